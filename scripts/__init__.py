@@ -1,12 +1,13 @@
 """CLI entry points for fantasy-br project scripts."""
 
+import argparse
+import json
 import os
 import subprocess
 import sys
+from functools import partial
 from pathlib import Path
 
-from dbt.cli.main import cli
-
 ROOT = Path(__file__).parent.parent
 
 
@@ -19,13 +20,306 @@ def run_app() -> None:
     sys.exit(result)
 
 
+def _with_round_vars(args: list[str]) -> list[str]:
+    """Replace ``--rounds N`` or ``--rounds A-B`` with the matching dbt ``--vars``.
+
+    Incremental models then rebuild only those as_of_round partitions. Any
+    ``--vars`` already given are kept.
+    """
+    if "--rounds" not in args:
+        return args
+    i = args.index("--rounds")
+    value = args[i + 1] if i + 1 < len(args) else ""
+    first, _, last = value.partition("-")
+    if not first.isdigit() or not (last or first).isdigit():
+        sys.exit(f"--rounds expects N or A-B, got {value!r}")
+    round_vars = {"round_from": int(first), "round_to": int(last or first)}
+    args = [*args[:i], *args[i + 2 :]]
+    if "--vars" in args:
+        import yaml  # noqa: PLC0415
+
+        j = args.index("--vars")
+        round_vars = {**(yaml.safe_load(args[j + 1]) or {}), **round_vars}
+        args = [*args[:j], *args[j + 2 :]]
+    return [*args, "--vars", json.dumps(round_vars)]
+
+
 def run_dbt() -> None:
-    """Run dbt from the dbt project directory, forwarding all arguments."""
+    """Run dbt from the dbt project directory, forwarding all arguments.
+
+    ``--rounds N`` / ``--rounds A-B`` limits incremental models to those rounds.
+    """
+    from dbt.cli.main import cli  # noqa: PLC0415
+
     os.chdir(ROOT / "src" / "dbt")
-    sys.argv[0] = "dbt"
+    sys.argv = ["dbt", *_with_round_vars(sys.argv[1:])]
     cli()
 
 
+def mart_bytes() -> None:
+    """Print the bytes each app loader's query scans for a round (BigQuery dry run).
+
+    ``uv run mart-bytes [ROUND]``; defaults to the latest built round. Validates
+    that mart partitioning and clustering keep each page view to a single round.
+    """
+    os.chdir(ROOT)
+    sys.path.insert(0, str(ROOT / "src" / "app"))
+    from utils import dry_run_bytes, load_available_rounds  # noqa: PLC0415
+
+    round_id = int(sys.argv[1]) if len(sys.argv) > 1 else load_available_rounds()[-1]
+    scanned = dry_run_bytes(round_id)
+    width = max(map(len, scanned))
+    print(f"Round {round_id}")  # noqa: T201
+    for loader, n_bytes in sorted(scanned.items(), key=lambda item: -item[1]):
+        print(f"  {loader:<{width}}  {n_bytes / 1e6:>10.2f} MB")  # noqa: T201
+    print(f"  {'total':<{width}}  {sum(scanned.values()) / 1e6:>10.2f} MB")  # noqa: T201
+
+
+def bench_loaders() -> None:
+    """Time rows-as-dicts against DataFrames on ss_round_by_round (DuckDB build).
+
+    ``uv run bench-loaders [--database PATH] [--scale N ...] [--repeat N]``, after
+    ``uv run dbt build --target duckdb``. Prints the best wall time and the peak
+    memory Python traced for each path, with the mart's rows repeated ``--scale``
+    times (default 1 and 19, about a full season of rounds).
+    """
+    from scripts import loader_benchmark  # noqa: PLC0415
+
+    parser = argparse.ArgumentParser(prog="bench-loaders")
+    parser.add_argument(
+        "--database",
+        default=os.environ.get(
+            "FANTASY_BR_DUCKDB",
+            str(ROOT / "src" / "dbt" / "target" / "fantasy_br.duckdb"),
+        ),
+    )
+    parser.add_argument("--scale", type=int, action="append")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    scales = tuple(args.scale or (1, 19))
+    print(loader_benchmark.run(args.database, scales, args.repeat))  # noqa: T201
+
+
+def plan_materializations() -> None:
+    """Report shared view/ephemeral models worth materializing as tables.
+
+    ``uv run dbt-plan [--min-mb MB] [--apply] [--compare RUN_RESULTS]``, after a
+    ``dbt build``. Reads the build's ``manifest.json`` and ``run_results.json``,
+    prints each candidate's fan-out and cost and the before/after bytes per build.
+    ``--apply`` switches the candidates to tables; ``--compare`` diffs the measured
+    bytes of an earlier ``run_results.json`` against the last build.
+    """
+    from scripts import materialization_plan  # noqa: PLC0415
+
+    parser = argparse.ArgumentParser(prog="dbt-plan")
+    parser.add_argument("--min-mb", type=float, default=10.0)
+    parser.add_argument("--apply", action="store_true")
+    parser.add_argument("--compare", type=Path)
+    args = parser.parse_args()
+
+    project_dir = ROOT / "src" / "dbt"
+    manifest, run_results = materialization_plan.load_artifacts(project_dir / "target")
+    if args.compare:
+        before = json.loads(args.compare.read_text())
+        print(materialization_plan.compare(before, run_results))  # noqa: T201
+        return
+
+    candidates = materialization_plan.plan(manifest, int(args.min_mb * 1e6))
+    print(materialization_plan.report(manifest, run_results, candidates))  # noqa: T201
+    if args.apply:
+        skipped = materialization_plan.apply(candidates, project_dir)
+        for candidate in skipped:
+            print(f"{candidate.path}: set materialized='table' in its config()")  # noqa: T201
+        print("Applied; rebuild, then compare with --compare OLD_RUN_RESULTS")  # noqa: T201
+
+
+def profile_build() -> None:
+    """Record and report the per-model cost of the last dbt build.
+
+    ``uv run dbt-profile [--rounds N] [--tolerance F] [--top N]``, after a
+    ``dbt build``. Appends wall time, bytes, slot-ms and rows per node to a local
+    Parquet history, prints the slowest models and the critical path, and flags
+    models whose cost grew faster than the round count since the previous build
+    of the same target. ``--rounds`` overrides the round read from build_metadata.
+    """
+    from scripts import build_profile  # noqa: PLC0415
+
+    parser = argparse.ArgumentParser(prog="dbt-profile")
+    parser.add_argument("--rounds", type=int)
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument(
+        "--history",
+        type=Path,
+        default=ROOT / "src" / "dbt" / ".cache" / "build_profile.parquet",
+    )
+    args = parser.parse_args()
+
+    print(  # noqa: T201
+        build_profile.profile(
+            ROOT / "src" / "dbt" / "target",
+            args.history,
+            rounds=args.rounds,
+            tolerance=args.tolerance,
+            top=args.top,
+        )
+    )
+
+
+def refresh_round() -> None:
+    """Rebuild only the rounds whose raw player partitions changed.
+
+    ``uv run refresh-round [--target T] [--no-warm]``. Fingerprints each
+    ``(season, round_id)`` partition of the player sources and each other source,
+    builds the models downstream of the player sources for the changed rounds
+    through ``round_from`` / ``round_to`` (any other change is a plain incremental
+    build), and then
+    re-reads those rounds into the app's round cache (``--no-warm`` skips it,
+    e.g. in CI where the app does not run). Fingerprints are stored per target in
+    ``src/dbt/.cache``; without them the first run is a plain incremental build.
+    """
+    from dbt.cli.main import dbtRunner  # noqa: PLC0415
+
+    from scripts import round_refresh  # noqa: PLC0415
+
+    parser = argparse.ArgumentParser(prog="refresh-round")
+    parser.add_argument("--target")
+    parser.add_argument("--no-warm", action="store_true")
+    args = parser.parse_args()
+
+    project_dir = ROOT / "src" / "dbt"
+    os.chdir(project_dir)
+    run = dbtRunner().invoke
+    target_args = ["--target", args.target] if args.target else []
+    state_path = project_dir / ".cache" / f"sources.{args.target or 'default'}.json"
+
+    after = round_refresh.partition_fingerprints(run, target_args)
+    before = round_refresh.load_state(state_path)
+    if before is None:
+        print("No fingerprints from an earlier refresh: incremental build")  # noqa: T201
+        dbt_args, rounds = ["build"], range(0)
+    else:
+        plan = round_refresh.build_args(
+            round_refresh.changed_partitions(before, after), after
+        )
+        if plan is None:
+            print("Sources unchanged: nothing to rebuild")  # noqa: T201
+            return
+        dbt_args, rounds = plan
+    print(f"dbt {' '.join(dbt_args)}")  # noqa: T201
+    if not run([*dbt_args, *target_args]).success:
+        sys.exit(1)
+    round_refresh.save_state(state_path, after)
+
+    if rounds and not args.no_warm:
+        if args.target == "duckdb":
+            duckdb_path = os.environ.get("DBT_DUCKDB_PATH", "target/fantasy_br.duckdb")
+            os.environ.setdefault("FANTASY_BR_DUCKDB", str(project_dir / duckdb_path))
+        os.chdir(ROOT)
+        sys.path.insert(0, str(ROOT / "src" / "app"))
+        from utils import warm_round_cache  # noqa: PLC0415
+
+        for round_id in rounds:
+            print(f"Round {round_id}: {warm_round_cache(round_id)} results cached")  # noqa: T201
+
+
+def ingest() -> None:
+    """Load the Cartola market snapshot (and schedule) into the raw tables.
+
+    ``uv run ingest --dataset PROJECT.DATASET [--dataset ...]`` streams
+    ``/atletas/mercado`` once into a content-addressed Parquet bundle and loads it
+    into every dataset concurrently, skipping datasets that already hold it.
+    ``--cartola-url`` reads from another server (e.g. a local fixture server),
+    ``--legacy DIR`` replays a round of the legacy CSVs instead; ``--out DIR``
+    keeps the bundle and, without ``--dataset``, skips the loads. Prints a
+    per-stage profile of the run; ``--cprofile PATH`` also dumps a cProfile.
+
+    ``--backfill-scouts`` instead rebuilds each dataset's per-round scouts from
+    the legacy CSVs and every round in ``raw_players_etl``; loads run it
+    themselves when earlier rounds of the season have no scouts stored.
+    """
+    import cProfile  # noqa: PLC0415
+    import datetime  # noqa: PLC0415
+
+    sys.path.insert(0, str(ROOT / "src"))
+    from ingest import pipeline, sources  # noqa: PLC0415
+    from ingest.profiling import Profiler  # noqa: PLC0415
+
+    parser = argparse.ArgumentParser(prog="ingest")
+    parser.add_argument(
+        "--dataset",
+        action="append",
+        default=[],
+        dest="datasets",
+        help="PROJECT.DATASET to load into (repeatable)",
+    )
+    parser.add_argument("--out", type=Path, help="directory to keep bundles in")
+    parser.add_argument("--season", type=int)
+    parser.add_argument("--cartola-url", default=sources.CARTOLA_URL)
+    parser.add_argument("--football-data-url", default=sources.FOOTBALL_DATA_URL)
+    parser.add_argument("--legacy", type=Path, help="legacy/<season> dir to replay")
+    parser.add_argument("--round", type=int, help="legacy round (default: last)")
+    parser.add_argument("--cprofile", type=Path)
+    parser.add_argument(
+        "--backfill-scouts",
+        action="store_true",
+        help="rebuild raw_player_round_scouts of each dataset from stored rounds",
+    )
+    args = parser.parse_args()
+    if not args.datasets and (args.backfill_scouts or not args.out):
+        parser.error("give --dataset to load, --out to write Parquet, or both")
+
+    if args.legacy:
+        source = sources.LegacySource(args.legacy, args.round)
+        season = args.season or int(args.legacy.name)
+    else:
+        source = sources.HttpSource(args.cartola_url, args.football_data_url)
+        season = args.season or datetime.datetime.now(tz=datetime.UTC).year
+    client = None
+    if args.datasets:
+        from google.cloud import bigquery  # noqa: PLC0415
+
+        client = bigquery.Client(project=args.datasets[0].split(".")[0])
+
+    profiler = Profiler()
+    if args.backfill_scouts:
+        for dataset in args.datasets:
+            rows = pipeline.backfill_scouts(client, dataset, ROOT / "legacy", profiler)
+            print(f"{dataset}: {rows} per-round scout rows")  # noqa: T201
+        print(profiler.report())  # noqa: T201
+        return
+
+    run = partial(
+        pipeline.run,
+        source,
+        season,
+        profiler,
+        client=client,
+        datasets=tuple(args.datasets),
+        out_dir=args.out,
+        legacy_dir=ROOT / "legacy",
+    )
+    if args.cprofile:
+        with cProfile.Profile() as profile:
+            bundle, loaded = run()
+        profile.dump_stats(args.cprofile)
+    else:
+        bundle, loaded = run()
+    print(f"bundle {bundle.digest}: {bundle.rows}")  # noqa: T201
+    for dataset, rows in loaded.items():
+        print(f"{dataset}: {rows if rows is not None else 'up to date'}")  # noqa: T201
+    print(profiler.report())  # noqa: T201
+
+    # Datasets whose raw tables changed, for the workflow to rebuild only those
+    rebuild = [
+        dataset for dataset, rows in loaded.items() if pipeline.needs_rebuild(rows)
+    ]
+    print(f"dbt rebuild needed: {', '.join(rebuild) or 'none'}")  # noqa: T201
+    if github_output := os.environ.get("GITHUB_OUTPUT"):
+        with Path(github_output).open("a") as file:
+            file.write(f"rebuild={json.dumps(rebuild)}\n")
+
+
 def lint_sql() -> None:
     """Lint all SQL files in the dbt project using SQLFluff."""
     result = subprocess.call(
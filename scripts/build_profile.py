@@ -0,0 +1,268 @@
+"""Build profiler: per-model cost of a dbt build, kept as a local Parquet history.
+
+Reads ``run_results.json`` (wall time and adapter response per node) and
+``manifest.json`` (lineage) of the last build and appends one row per executed
+node to the history: wall time, bytes processed, slot-ms and rows. Each build is
+tagged with the latest round its marts hold (``build_metadata``), so a model's
+cost can be compared with the previous comparable build: a round-keyed model
+should grow at most in proportion to the rounds it covers, and one that grows
+faster (a new cross join, a lost partition filter) is flagged.
+
+The critical path is the chain of dependent nodes with the largest summed wall
+time, i.e. the floor on build time no matter how many threads run.
+"""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from scripts.materialization_plan import load_artifacts
+
+# Wall time under this is mostly scheduling noise, so it is never flagged
+MIN_FLAG_SECONDS = 1.0
+
+METRICS = ("execution_time", "bytes_processed", "slot_ms")
+
+# dbt commands whose run_results are a build (`show`, `test` etc. are skipped)
+PROFILED_COMMANDS = ("build", "run")
+
+
+def records(manifest: dict, run_results: dict, rounds: int | None) -> pd.DataFrame:
+    """One row per node executed by the build, with its cost metrics."""
+    metadata = run_results["metadata"]
+    args = run_results.get("args", {})
+    nodes = manifest["nodes"]
+    rows = []
+    for res in run_results["results"]:
+        node = nodes.get(res["unique_id"], {})
+        response = res.get("adapter_response") or {}
+        rows.append(
+            {
+                "invocation_id": metadata["invocation_id"],
+                "generated_at": pd.Timestamp(metadata["generated_at"]),
+                "adapter_type": manifest["metadata"].get("adapter_type"),
+                "target_schema": node.get("schema"),
+                "command": args.get("which"),
+                "full_refresh": bool(args.get("full_refresh")),
+                "rounds": rounds,
+                "unique_id": res["unique_id"],
+                "name": node.get("name", res["unique_id"].split(".")[-1]),
+                "resource_type": node.get("resource_type"),
+                "materialized": node.get("config", {}).get("materialized"),
+                "status": res["status"],
+                "execution_time": float(res.get("execution_time") or 0.0),
+                "bytes_processed": int(response.get("bytes_processed") or 0),
+                "slot_ms": int(response.get("slot_ms") or 0),
+                "rows_affected": int(response.get("rows_affected") or 0),
+            }
+        )
+    frame = pd.DataFrame(rows)
+    frame["rounds"] = frame["rounds"].astype("Int64")
+    return frame
+
+
+def build_rounds(manifest: dict, invocation_id: str, project_dir: Path) -> int | None:
+    """Latest round held by the marts the build wrote (``build_metadata``).
+
+    None when the table cannot be read (no credentials, no mart rebuilt).
+    """
+    adapter_type = manifest["metadata"].get("adapter_type")
+    model = next(
+        (n for n in manifest["nodes"].values() if n["resource_type"] == "model"),
+        None,
+    )
+    if model is None:
+        return None
+    sql = (
+        "select max(max_round_id) from {table} "  # noqa: S608
+        f"where invocation_id = '{invocation_id}'"
+    )
+    try:
+        if adapter_type == "duckdb":
+            import duckdb  # noqa: PLC0415
+
+            path = os.environ.get("DBT_DUCKDB_PATH", "target/fantasy_br.duckdb")
+            with duckdb.connect(str(project_dir / path), read_only=True) as connection:
+                table = f"{model['schema']}.build_metadata"
+                row = connection.sql(sql.format(table=table)).fetchone()
+        else:
+            from google.cloud import bigquery  # noqa: PLC0415
+
+            client = bigquery.Client(project=model["database"])
+            table = f"`{model['database']}.{model['schema']}.build_metadata`"
+            row = next(iter(client.query(sql.format(table=table)).result()))
+    except Exception:  # noqa: BLE001
+        return None
+    return int(row[0]) if row[0] is not None else None
+
+
+def append_history(history_path: Path, build: pd.DataFrame) -> pd.DataFrame:
+    """Add a build to the Parquet history (re-profiling a build replaces it)."""
+    if history_path.exists():
+        history = pd.read_parquet(history_path)
+        history = history[~history["invocation_id"].isin(build["invocation_id"])]
+        history = pd.concat([history, build], ignore_index=True)
+    else:
+        history = build
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = history_path.with_suffix(".tmp")
+    history.to_parquet(tmp_path, index=False)
+    tmp_path.replace(history_path)
+    return history
+
+
+def previous_build(history: pd.DataFrame, build: pd.DataFrame) -> pd.DataFrame:
+    """Find the latest earlier build of the same target and kind (full or not)."""
+    first = build.iloc[0]
+    earlier = history[
+        (history["generated_at"] < first["generated_at"])
+        & (history["adapter_type"] == first["adapter_type"])
+        & (history["target_schema"] == first["target_schema"])
+        & (history["full_refresh"] == first["full_refresh"])
+    ]
+    if earlier.empty:
+        return earlier
+    latest = earlier.loc[earlier["generated_at"].idxmax(), "invocation_id"]
+    return earlier[earlier["invocation_id"] == latest]
+
+
+def critical_path(manifest: dict, build: pd.DataFrame) -> list[tuple[str, float]]:
+    """Chain of executed nodes with the largest total wall time, upstream first."""
+    durations = dict(zip(build["unique_id"], build["execution_time"], strict=True))
+    parent_map = manifest["parent_map"]
+    finish: dict[str, float] = {}
+    via: dict[str, str | None] = {}
+
+    def visit(unique_id: str) -> float:
+        if unique_id not in finish:
+            parents = [p for p in parent_map.get(unique_id, []) if p in durations]
+            slowest = max(parents, key=visit, default=None)
+            via[unique_id] = slowest
+            finish[unique_id] = durations[unique_id] + (
+                finish[slowest] if slowest else 0.0
+            )
+        return finish[unique_id]
+
+    end = max(durations, key=visit, default=None)
+    path = []
+    while end is not None:
+        path.append((end, durations[end]))
+        end = via[end]
+    return path[::-1]
+
+
+def outgrown(
+    build: pd.DataFrame, previous: pd.DataFrame, tolerance: float
+) -> pd.DataFrame:
+    """Models whose cost grew faster than the rounds since the previous build.
+
+    Compares each metric's growth ratio with the round ratio; growth above
+    ``round ratio * (1 + tolerance)`` is flagged.
+    """
+    columns = ["name", "metric", "before", "after", "growth", "round_growth"]
+    first, prev = build.iloc[0], previous.iloc[0]
+    if pd.isna(first["rounds"]) or pd.isna(prev["rounds"]) or not prev["rounds"]:
+        return pd.DataFrame(columns=columns)
+    round_growth = first["rounds"] / prev["rounds"]
+    merged = build.merge(previous, on="unique_id", suffixes=("", "_before"))
+    merged = merged[merged["resource_type"] == "model"]
+    flagged = []
+    for metric in METRICS:
+        before, after = merged[f"{metric}_before"], merged[metric]
+        compared = before > (MIN_FLAG_SECONDS if metric == "execution_time" else 0)
+        rows = merged[compared & (after > before * round_growth * (1 + tolerance))]
+        flagged.extend(
+            {
+                "name": row["name"],
+                "metric": metric,
+                "before": row[f"{metric}_before"],
+                "after": row[metric],
+                "growth": row[metric] / row[f"{metric}_before"],
+                "round_growth": round_growth,
+            }
+            for _, row in rows.iterrows()
+        )
+    return pd.DataFrame(flagged, columns=columns).sort_values("growth", ascending=False)
+
+
+def report(  # noqa: PLR0913
+    manifest: dict,
+    run_results: dict,
+    build: pd.DataFrame,
+    previous: pd.DataFrame,
+    tolerance: float,
+    top: int,
+) -> str:
+    """Slowest models, critical path and outgrown models of a build."""
+    first = build.iloc[0]
+    rounds = "?" if pd.isna(first["rounds"]) else int(first["rounds"])
+    elapsed = float(run_results.get("elapsed_time") or 0.0)
+    title = (
+        f"Build {first['invocation_id']} ({first['generated_at']:%Y-%m-%d %H:%M}, "
+        f"round {rounds}, {elapsed:.1f} s elapsed)"
+    )
+    header = f"{'model':<36} {'status':<8} {'time s':>8} {'MB':>10} {'slot s':>9}"
+    lines = [title, "", f"{header} {'rows':>10}"]
+    models = build[build["resource_type"] == "model"]
+    lines.extend(
+        f"{row['name']:<36} {row['status']:<8} {row['execution_time']:>8.1f} "
+        f"{row['bytes_processed'] / 1e6:>10.2f} {row['slot_ms'] / 1e3:>9.1f} "
+        f"{row['rows_affected']:>10}"
+        for _, row in models.nlargest(top, "execution_time").iterrows()
+    )
+    lines.append(
+        f"{'total (' + str(len(models)) + ' models)':<45} "
+        f"{models['execution_time'].sum():>8.1f} "
+        f"{models['bytes_processed'].sum() / 1e6:>10.2f} "
+        f"{models['slot_ms'].sum() / 1e3:>9.1f}"
+    )
+
+    path = critical_path(manifest, build)
+    names = dict(zip(build["unique_id"], build["name"], strict=True))
+    lines.extend(
+        ["", f"Critical path ({sum(t for _, t in path):.1f} s of {elapsed:.1f} s):"]
+    )
+    lines.extend(f"  {names[uid]:<40} {t:>8.1f} s" for uid, t in path)
+
+    lines.append("")
+    if previous.empty:
+        lines.append("No earlier build of this target to compare with")
+        return "\n".join(lines)
+    flagged = outgrown(build, previous, tolerance)
+    prev = previous.iloc[0]
+    since = f"Since build {prev['invocation_id']} ({prev['generated_at']:%Y-%m-%d})"
+    if pd.isna(first["rounds"]) or pd.isna(prev["rounds"]):
+        lines.append(f"{since}: round count unknown, growth not checked")
+    elif flagged.empty:
+        lines.append(f"{since}: no model grew faster than rounds")
+    else:
+        lines.append(f"{since}, rounds {int(prev['rounds'])} -> {rounds}, grew faster:")
+        lines.extend(
+            f"  {row['name']:<36} {row['metric']:<16} x{row['growth']:.2f} "
+            f"(rounds x{row['round_growth']:.2f})"
+            for _, row in flagged.iterrows()
+        )
+    return "\n".join(lines)
+
+
+def profile(
+    target_dir: Path,
+    history_path: Path,
+    rounds: int | None = None,
+    tolerance: float = 0.1,
+    top: int = 15,
+) -> str:
+    """Record the last build into the history and return its report."""
+    manifest, run_results = load_artifacts(target_dir)
+    command = run_results.get("args", {}).get("which")
+    if command not in PROFILED_COMMANDS:
+        return f"Last dbt command was `{command}`, not a build: nothing to profile"
+    if rounds is None:
+        rounds = build_rounds(
+            manifest, run_results["metadata"]["invocation_id"], target_dir.parent
+        )
+    build = records(manifest, run_results, rounds)
+    history = append_history(history_path, build)
+    previous = previous_build(history, build)
+    return report(manifest, run_results, build, previous, tolerance, top)
@@ -0,0 +1,81 @@
+"""Loader benchmark: ``ss_round_by_round`` as rows of dicts against a DataFrame.
+
+Times the app's loader path before and after mart results became DataFrames,
+on a local DuckDB build. The rows-as-dicts path fetches every row as a
+``dict``, keeps the rows of one position and copies each into a display
+``dict`` before building a frame; the DataFrame path fetches the result as
+columns, keeps the same position's rows and selects the display columns. Both
+read the same query, with the mart's rows repeated ``scale`` times to stand in
+for a season further along than the local build.
+"""
+
+# Queries only interpolate the module's mart name and integer scales
+# ruff: noqa: S608
+
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import duckdb
+import pandas as pd
+
+MART = "ss_round_by_round"
+
+# Position kept by the filter both paths apply (the sidebar's position filter)
+POSITION = "MD"
+
+
+def _sql(scale: int) -> str:
+    """Select the mart's rows, repeated ``scale`` times."""
+    return f"SELECT mart.* FROM {MART} AS mart, range({int(scale)}) ORDER BY round"
+
+
+def dict_path(connection: duckdb.DuckDBPyConnection, sql: str) -> pd.DataFrame:
+    """Fetch rows as dicts, filter the list and copy display rows into a frame."""
+    result = connection.sql(sql)
+    names = result.columns
+    data = [dict(zip(names, row, strict=True)) for row in result.fetchall()]
+    data = [row for row in data if row.get("position") == POSITION]
+    return pd.DataFrame([{name: row.get(name) for name in names} for row in data])
+
+
+def frame_path(connection: duckdb.DuckDBPyConnection, sql: str) -> pd.DataFrame:
+    """Fetch a DataFrame, filter it with a mask and project the display columns."""
+    data = connection.sql(sql).df()
+    return data.loc[data["position"] == POSITION, list(data.columns)]
+
+
+def measure(
+    path: Callable[[duckdb.DuckDBPyConnection, str], pd.DataFrame],
+    connection: duckdb.DuckDBPyConnection,
+    sql: str,
+    repeat: int,
+) -> tuple[float, int, int]:
+    """Return the best wall time, the peak memory Python traced and the rows shown."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        shown = path(connection, sql)
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    path(connection, sql)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings), peak, len(shown)
+
+
+def run(database: str, scales: tuple[int, ...], repeat: int = 5) -> str:
+    """Benchmark both paths at each scale and return a report."""
+    header = f"{'scale':>6} {'rows':>8} {'path':<6} {'shown':>7} {'best ms':>9}"
+    lines = [f"{header} {'peak MB':>8}"]
+    with duckdb.connect(database, read_only=True) as connection:
+        for scale in scales:
+            sql = _sql(scale)
+            n_rows = connection.sql(f"SELECT count(*) FROM ({sql})").fetchone()[0]
+            for name, path in (("dicts", dict_path), ("frame", frame_path)):
+                seconds, peak, shown = measure(path, connection, sql, repeat)
+                lines.append(
+                    f"{scale:>6} {n_rows:>8} {name:<6} {shown:>7} "
+                    f"{seconds * 1e3:>9.1f} {peak / 1e6:>8.1f}"
+                )
+    return "\n".join(lines)
@@ -0,0 +1,195 @@
+"""Materialization planner: find shared view/ephemeral models worth building as tables.
+
+A view or ephemeral model is recomputed inside every query that reads it, so its
+scan is paid once per consumer build. Reading ``manifest.json`` (lineage,
+materializations) and ``run_results.json`` (bytes processed per model) of the last
+build, the planner counts how many table builds execute each inlined model
+(fan-out, followed through chains of views) and dry-runs the model to price one
+execution. A model executed ``n >= 2`` times saves ``(n - 1) * bytes`` per build
+once materialized as a table (its consumers then read the stored result, which is
+no larger than what the model itself scans).
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+INLINED = ("view", "ephemeral")
+CONFIG_TABLE = "{{ config(materialized='table') }}\n"
+
+
+@dataclass
+class Candidate:
+    """An inlined model with its fan-out and per-execution cost."""
+
+    unique_id: str
+    name: str
+    materialized: str
+    path: str
+    executions: int
+    bytes_per_execution: int
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes no longer scanned per build once the model is a table."""
+        return (self.executions - 1) * self.bytes_per_execution
+
+
+def load_artifacts(target_dir: Path) -> tuple[dict, dict]:
+    """Read ``manifest.json`` and ``run_results.json`` from a dbt target directory."""
+    manifest = json.loads((target_dir / "manifest.json").read_text())
+    run_results = json.loads((target_dir / "run_results.json").read_text())
+    return manifest, run_results
+
+
+def model_bytes(run_results: dict) -> dict[str, int]:
+    """Bytes processed per model in a run (``adapter_response.bytes_processed``)."""
+    return {
+        res["unique_id"]: int(
+            res.get("adapter_response", {}).get("bytes_processed") or 0
+        )
+        for res in run_results["results"]
+        if res["unique_id"].startswith("model.")
+    }
+
+
+def executions(manifest: dict, tables: frozenset[str] = frozenset()) -> dict[str, int]:
+    """Count how many times each model's query runs per build.
+
+    Tables and incremental models (and the models in ``tables``) run once. An
+    inlined model runs once inside each consumer that is built, so it counts the
+    executions of its model children.
+    """
+    nodes = manifest["nodes"]
+    counts: dict[str, int] = {}
+
+    def count(unique_id: str) -> int:
+        if unique_id not in counts:
+            materialized = nodes[unique_id]["config"]["materialized"]
+            if materialized not in INLINED or unique_id in tables:
+                counts[unique_id] = 1
+            else:
+                children = [
+                    c
+                    for c in manifest["child_map"].get(unique_id, [])
+                    if c.startswith("model.")
+                ]
+                counts[unique_id] = sum(count(c) for c in children)
+        return counts[unique_id]
+
+    for unique_id in nodes:
+        if unique_id.startswith("model."):
+            count(unique_id)
+    return counts
+
+
+def dry_run_bytes(node: dict) -> int:
+    """Bytes one execution of an inlined model scans (BigQuery dry run)."""
+    from google.cloud import bigquery  # noqa: PLC0415
+
+    if node["config"]["materialized"] == "view":
+        sql = f"select * from {node['relation_name']}"  # noqa: S608
+    else:
+        sql = node["compiled_code"]
+    client = bigquery.Client(project=node["database"])
+    config = bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
+    return client.query(sql, job_config=config).total_bytes_processed
+
+
+def plan(manifest: dict, min_bytes: int) -> list[Candidate]:
+    """Pick inlined models to materialize, each saving at least ``min_bytes``.
+
+    Greedy: the model saving the most goes first, then fan-out is recounted with
+    it as a table (an upstream view read only through it now runs once).
+    """
+    nodes = manifest["nodes"]
+    # Fan-out only shrinks as models are chosen, so single-use models never qualify
+    inlined = [
+        uid
+        for uid, n in executions(manifest).items()
+        if nodes[uid]["config"]["materialized"] in INLINED and n >= 2  # noqa: PLR2004
+    ]
+    cost = {uid: dry_run_bytes(nodes[uid]) for uid in inlined}
+    chosen: list[Candidate] = []
+    while True:
+        counts = executions(manifest, frozenset(c.unique_id for c in chosen))
+        remaining = [
+            Candidate(
+                unique_id=uid,
+                name=nodes[uid]["name"],
+                materialized=nodes[uid]["config"]["materialized"],
+                path=nodes[uid]["original_file_path"],
+                executions=counts[uid],
+                bytes_per_execution=cost[uid],
+            )
+            for uid in inlined
+            if uid not in {c.unique_id for c in chosen}
+        ]
+        best = max(remaining, key=lambda c: c.bytes_saved, default=None)
+        if best is None or best.bytes_saved < max(min_bytes, 1):
+            return chosen
+        chosen.append(best)
+
+
+def apply(candidates: list[Candidate], project_dir: Path) -> list[Candidate]:
+    """Prepend ``config(materialized='table')`` to each candidate model file.
+
+    Models that already call ``config()`` are left alone and returned, to be
+    switched by hand.
+    """
+    skipped = []
+    for candidate in candidates:
+        path = project_dir / candidate.path
+        sql = path.read_text()
+        if "config(" in sql:
+            skipped.append(candidate)
+        else:
+            path.write_text(CONFIG_TABLE + sql)
+    return skipped
+
+
+def report(manifest: dict, run_results: dict, candidates: list[Candidate]) -> str:
+    """Before/after bytes processed per build, with the plan's per-model savings.
+
+    *Before* is the measured total of the last build; *after* subtracts the
+    projected savings of the candidates.
+    """
+    nodes = manifest["nodes"]
+    before = sum(model_bytes(run_results).values())
+    saved = sum(c.bytes_saved for c in candidates)
+    header = f"{'model':<32} {'materialized':<12} {'runs':>5} {'MB/run':>10}"
+    lines = [f"{header} {'MB saved':>10}"]
+    lines.extend(
+        f"{c.name:<32} {c.materialized:<12} {c.executions:>5} "
+        f"{c.bytes_per_execution / 1e6:>10.2f} {c.bytes_saved / 1e6:>10.2f}"
+        for c in candidates
+    )
+    if not candidates:
+        lines.append("(no inlined model worth materializing)")
+    n_inlined = sum(
+        1
+        for uid, node in nodes.items()
+        if uid.startswith("model.") and node["config"]["materialized"] in INLINED
+    )
+    lines.extend(
+        [
+            "",
+            f"Inlined models: {n_inlined}, to materialize: {len(candidates)}",
+            f"Bytes per build  before: {before / 1e6:>12.2f} MB (measured)",
+            f"                 after:  {(before - saved) / 1e6:>12.2f} MB (projected)",
+        ]
+    )
+    return "\n".join(lines)
+
+
+def compare(before: dict, after: dict) -> str:
+    """Measured bytes per build of two ``run_results.json`` (before/after applying)."""
+    bytes_before, bytes_after = model_bytes(before), model_bytes(after)
+    lines = [f"{'model':<40} {'MB before':>10} {'MB after':>10}"]
+    for uid in sorted(bytes_before.keys() | bytes_after.keys()):
+        b, a = bytes_before.get(uid, 0), bytes_after.get(uid, 0)
+        if a != b:
+            lines.append(f"{uid.split('.')[-1]:<40} {b / 1e6:>10.2f} {a / 1e6:>10.2f}")
+    total_b, total_a = sum(bytes_before.values()), sum(bytes_after.values())
+    lines.append(f"{'total':<40} {total_b / 1e6:>10.2f} {total_a / 1e6:>10.2f}")
+    return "\n".join(lines)
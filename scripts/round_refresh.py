@@ -0,0 +1,114 @@
+"""Round-scoped refresh: rebuild only the rounds whose raw player rows changed.
+
+Every source the models read is fingerprinted (row count and an order-independent
+hash of its rows): ``raw_players_etl`` and ``raw_player_round_scouts`` per
+``(season, round_id)`` partition, the other sources as a whole. The fingerprints
+are compared with those stored by the previous refresh of the same target. When
+only current-season rounds changed, the models downstream of the round sources
+are built with ``round_from`` / ``round_to`` set to the first changed round and
+the latest round, so incremental models rewrite just those partitions (an earlier
+round feeds the season-to-date totals of every later one). Nothing changed means
+no build at all; a change in an earlier season or in any other source falls back
+to a full refresh, since the incremental models only rebuild from the latest round
+and would keep stale schedule, club or position data in the earlier ones.
+"""
+
+import json
+from pathlib import Path
+
+# Sources partitioned by (season, round_id); the others are fingerprinted whole
+ROUND_SOURCES = ("raw_players_etl", "raw_player_round_scouts")
+OTHER_SOURCES = ("raw_schedule", "raw_clubs", "raw_positions")
+
+
+def _fingerprint_sql(name: str) -> str:
+    """Select the fingerprints of one source, one row per partition."""
+    partitioned = name in ROUND_SOURCES
+    return f"""
+select
+    '{name}' as source_name,
+    {"temporada" if partitioned else "0"} as season,
+    {"rodada_id" if partitioned else "0"} as round_id,
+    count(*) as n_rows,
+    coalesce(bit_xor({{{{ row_fingerprint('raw') }}}}), 0) as fingerprint
+from {{{{ source('cartola', '{name}') }}}} as raw
+{"group by temporada, rodada_id" if partitioned else ""}"""  # noqa: S608
+
+
+FINGERPRINT_SQL = "\nunion all\n".join(
+    _fingerprint_sql(name) for name in (*ROUND_SOURCES, *OTHER_SOURCES)
+)
+
+type Partition = tuple[str, int, int]
+type Fingerprints = dict[Partition, tuple[int, int]]
+
+
+def partition_fingerprints(run, target_args: list[str]) -> Fingerprints:  # noqa: ANN001
+    """Fingerprint every partition of the sources (``dbt show``, any adapter).
+
+    ``run`` invokes dbt with a list of arguments and returns its result.
+    """
+    res = run(
+        ["show", "--inline", FINGERPRINT_SQL, "--limit", "-1", *target_args],
+    )
+    if not res.success:
+        msg = f"Could not fingerprint the sources: {res.exception}"
+        raise RuntimeError(msg)
+    table = res.result.results[0].agate_table
+    return {
+        (row["source_name"], int(row["season"]), int(row["round_id"])): (
+            int(row["n_rows"]),
+            int(row["fingerprint"]),
+        )
+        for row in table.rows
+    }
+
+
+def load_state(path: Path) -> Fingerprints | None:
+    """Fingerprints stored by the last successful refresh (None on the first)."""
+    if not path.exists():
+        return None
+    return {
+        (name, season, round_id): (n_rows, fingerprint)
+        for name, season, round_id, n_rows, fingerprint in json.loads(path.read_text())
+    }
+
+
+def save_state(path: Path, fingerprints: Fingerprints) -> None:
+    """Store fingerprints for the next refresh."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rows = sorted([*partition, *value] for partition, value in fingerprints.items())
+    path.write_text(json.dumps(rows))
+
+
+def changed_partitions(before: Fingerprints, after: Fingerprints) -> set[Partition]:
+    """Partitions added, removed or rewritten since ``before``."""
+    return {
+        partition
+        for partition in before.keys() | after.keys()
+        if before.get(partition) != after.get(partition)
+    }
+
+
+def build_args(
+    changed: set[Partition], after: Fingerprints
+) -> tuple[list[str], range] | None:
+    """Return the dbt build arguments for the changed partitions and the rounds rebuilt.
+
+    None when nothing changed. The range is empty on a full refresh.
+    """
+    if not changed:
+        return None
+    if any(name not in ROUND_SOURCES for name, _, _ in changed):
+        return ["build", "--full-refresh"], range(0)
+    partitions = [(s, r) for name, s, r in (*after, *changed) if name in ROUND_SOURCES]
+    season = max(s for s, _ in partitions)
+    if any(s != season for _, s, _ in changed):
+        return ["build", "--full-refresh"], range(0)
+    rounds = [r for s, r in partitions if s == season]
+    first, last = min(r for _, _, r in changed), max(rounds)
+    round_vars = json.dumps({"round_from": first, "round_to": last})
+    selectors = [f"source:cartola.{name}+" for name in ROUND_SOURCES]
+    return ["build", "--select", *selectors, "--vars", round_vars], range(
+        first, last + 1
+    )
@@ -6,6 +6,7 @@ from utils import (
     filter_data,
     load_available_rounds,
     load_mv_baseline,
+    load_mv_bundle,
     load_mv_form_trend,
     load_mv_main,
     load_mv_par_breakdown,
@@ -13,7 +14,9 @@ from utils import (
     load_mv_round_by_round,
     load_mv_schedule_strength,
     load_mv_value_profile,
+    prefetch,
     render_sidebar_filters,
+    select_columns,
 )
 
 
@@ -25,7 +28,7 @@ def _col_label(field: str, cfg: object) -> str:
 
 def _format_value(value: object, cfg: object) -> object:
     """Format a value using the column config's format string, if any."""
-    if value is None:
+    if pd.isna(value):
         return ""
     fmt: str | None = None
     if isinstance(cfg, dict):
@@ -40,27 +43,42 @@ def _format_value(value: object, cfg: object) -> object:
 
 _COMPARE_MIN = 2
 
-
-def _render_player_comparison(rows: list[dict], col_config: dict, tab_key: str) -> None:
+ROUND_BY_ROUND_COLUMNS = [
+    "round",
+    "player_name",
+    "position",
+    "club_logo_url",
+    "club",
+    "points_total",
+    "points_base",
+    "did_play",
+]
+
+
+def _render_player_comparison(
+    rows: pd.DataFrame, col_config: dict, tab_key: str
+) -> None:
     """Multiselect and transposed comparison table for 2-4 selected players."""
-    if not rows:
+    if rows.empty:
         return
 
     skip = {"club_logo_url"}
     display_fields = [k for k in col_config if k not in skip]
 
-    def _opt_label(row: dict) -> str:
-        name = row.get("player_name") or "?"
-        pos = row.get("position") or ""
-        return f"{name} ({pos})" if pos else name
+    def _opt_label(name: object, pos: object) -> str:
+        name = name if isinstance(name, str) and name else "?"
+        return f"{name} ({pos})" if isinstance(pos, str) and pos else name
 
-    options: dict[str, dict] = {}
-    for row in rows:
-        lbl = _opt_label(row)
+    # Only labels are built per row; the selected rows are looked up by position
+    options: dict[str, int] = {}
+    for i_row, (name, pos) in enumerate(
+        zip(rows["player_name"], rows["position"], strict=True)
+    ):
+        lbl = _opt_label(name, pos)
         base, i = lbl, 2
         while lbl in options:
             lbl, i = f"{base} #{i}", i + 1
-        options[lbl] = row
+        options[lbl] = i_row
 
     st.divider()
     selected = st.multiselect(
@@ -77,26 +95,19 @@ def _render_player_comparison(rows: list[dict], col_config: dict, tab_key: str)
         st.caption(f"Select at least {_COMPARE_MIN} players to compare.")
         return
 
-    selected_rows = [options[lbl] for lbl in selected]
+    selected_rows = rows.iloc[[options[lbl] for lbl in selected]]
     metric_labels = [_col_label(f, col_config[f]) for f in display_fields]
     comp: dict[str, list] = {"Metric": metric_labels}
-    for lbl, row in zip(selected, selected_rows, strict=True):
+    for lbl, (_, row) in zip(selected, selected_rows.iterrows(), strict=True):
         comp[lbl] = [_format_value(row.get(f), col_config[f]) for f in display_fields]
 
     st.markdown("**Player Comparison**")
     st.dataframe(pd.DataFrame(comp), use_container_width=True, hide_index=True)
 
 
-def _render_main() -> None:
-    """Render main consolidated tab with key valuation columns."""
-    st.subheader("Market Valuation Overview")
-
-    data = filter_data(load_mv_main(st.session_state.get("filter_round_id")))
-    if not data:
-        st.info("No data available for this round.")
-        return
-
-    col_config = {
+def _main_config() -> dict:
+    """Column config for the main tab."""
+    return {
         "player_name": st.column_config.TextColumn(
             "Player",
             width="medium",
@@ -147,12 +158,20 @@ def _render_main() -> None:
         ),
     }
 
-    display_cols = list(col_config.keys())
-    rows = [{k: row.get(k) for k in display_cols} for row in data]
-    rows = sorted(rows, key=lambda r: r.get("par", 0), reverse=True)
-    for row in rows:
-        if row.get("availability") is not None:
-            row["availability"] = row["availability"] * 100
+
+def _render_main(data: pd.DataFrame) -> None:
+    """Render main consolidated tab with key valuation columns."""
+    st.subheader("Market Valuation Overview")
+
+    data = filter_data(data)
+    if data.empty:
+        st.info("No data available for this round.")
+        return
+
+    col_config = _main_config()
+
+    rows = select_columns(data, list(col_config.keys()), sort_by="par")
+    rows["availability"] = rows["availability"] * 100
 
     st.dataframe(
         rows, use_container_width=True, hide_index=True, column_config=col_config
@@ -160,16 +179,9 @@ def _render_main() -> None:
     _render_player_comparison(rows, col_config, "main")
 
 
-def _render_par_breakdown() -> None:
-    """PAR Breakdown subtab."""
-    st.subheader("PAR Breakdown & Replacement Level")
-
-    data = filter_data(load_mv_par_breakdown(st.session_state.get("filter_round_id")))
-    if not data:
-        st.info("No data available for this round.")
-        return
-
-    col_config = {
+def _par_breakdown_config() -> dict:
+    """Column config for the PAR Breakdown subtab."""
+    return {
         "player_name": st.column_config.TextColumn(
             "Player",
             width="medium",
@@ -214,25 +226,28 @@ def _render_par_breakdown() -> None:
         ),
     }
 
-    display_cols = list(col_config.keys())
-    rows = [{k: row.get(k) for k in display_cols} for row in data]
-    rows = sorted(rows, key=lambda r: r.get("par_points", 0), reverse=True)
+
+def _render_par_breakdown(data: pd.DataFrame) -> None:
+    """PAR Breakdown subtab."""
+    st.subheader("PAR Breakdown & Replacement Level")
+
+    data = filter_data(data)
+    if data.empty:
+        st.info("No data available for this round.")
+        return
+
+    col_config = _par_breakdown_config()
+
+    rows = select_columns(data, list(col_config.keys()), sort_by="par_points")
     st.dataframe(
         rows, use_container_width=True, hide_index=True, column_config=col_config
     )
     _render_player_comparison(rows, col_config, "par_breakdown")
 
 
-def _render_baseline() -> None:
-    """Baseline (Stabilized Mean & Shrinkage) subtab."""
-    st.subheader("Baseline: Stabilized Mean & Shrinkage")
-
-    data = filter_data(load_mv_baseline(st.session_state.get("filter_round_id")))
-    if not data:
-        st.info("No data available for this round.")
-        return
-
-    col_config = {
+def _baseline_config() -> dict:
+    """Column config for the Baseline subtab."""
+    return {
         "player_name": st.column_config.TextColumn(
             "Player",
             width="medium",
@@ -326,25 +341,28 @@ def _render_baseline() -> None:
         ),
     }
 
-    display_cols = list(col_config.keys())
-    data = sorted(data, key=lambda r: r.get("par", 0), reverse=True)
-    rows = [{k: row.get(k) for k in display_cols} for row in data]
+
+def _render_baseline(data: pd.DataFrame) -> None:
+    """Baseline (Stabilized Mean & Shrinkage) subtab."""
+    st.subheader("Baseline: Stabilized Mean & Shrinkage")
+
+    data = filter_data(data)
+    if data.empty:
+        st.info("No data available for this round.")
+        return
+
+    col_config = _baseline_config()
+
+    rows = select_columns(data, list(col_config.keys()), sort_by="par")
     st.dataframe(
         rows, use_container_width=True, hide_index=True, column_config=col_config
     )
     _render_player_comparison(rows, col_config, "baseline")
 
 
-def _render_form_trend() -> None:
-    """Form & Trend subtab."""
-    st.subheader("Form (EWM) & Trend")
-
-    data = filter_data(load_mv_form_trend(st.session_state.get("filter_round_id")))
-    if not data:
-        st.info("No data available for this round.")
-        return
-
-    col_config = {
+def _form_trend_config() -> dict:
+    """Column config for the Form & Trend subtab."""
+    return {
         "player_name": st.column_config.TextColumn(
             "Player",
             width="medium",
@@ -397,25 +415,28 @@ def _render_form_trend() -> None:
         ),
     }
 
-    display_cols = list(col_config.keys())
-    data = sorted(data, key=lambda r: r.get("par", 0), reverse=True)
-    rows = [{k: row.get(k) for k in display_cols} for row in data]
+
+def _render_form_trend(data: pd.DataFrame) -> None:
+    """Form & Trend subtab."""
+    st.subheader("Form (EWM) & Trend")
+
+    data = filter_data(data)
+    if data.empty:
+        st.info("No data available for this round.")
+        return
+
+    col_config = _form_trend_config()
+
+    rows = select_columns(data, list(col_config.keys()), sort_by="par")
     st.dataframe(
         rows, use_container_width=True, hide_index=True, column_config=col_config
     )
     _render_player_comparison(rows, col_config, "form_trend")
 
 
-def _render_regression() -> None:
-    """Regression Candidate subtab."""
-    st.subheader("Regression Candidates")
-
-    data = filter_data(load_mv_regression(st.session_state.get("filter_round_id")))
-    if not data:
-        st.info("No data available for this round.")
-        return
-
-    col_config = {
+def _regression_config() -> dict:
+    """Column config for the Regression subtab."""
+    return {
         "player_name": st.column_config.TextColumn(
             "Player",
             width="medium",
@@ -468,25 +489,28 @@ def _render_regression() -> None:
         ),
     }
 
-    display_cols = list(col_config.keys())
-    data = sorted(data, key=lambda r: r.get("par", 0), reverse=True)
-    rows = [{k: row.get(k) for k in display_cols} for row in data]
+
+def _render_regression(data: pd.DataFrame) -> None:
+    """Regression Candidate subtab."""
+    st.subheader("Regression Candidates")
+
+    data = filter_data(data)
+    if data.empty:
+        st.info("No data available for this round.")
+        return
+
+    col_config = _regression_config()
+
+    rows = select_columns(data, list(col_config.keys()), sort_by="par")
     st.dataframe(
         rows, use_container_width=True, hide_index=True, column_config=col_config
     )
     _render_player_comparison(rows, col_config, "regression")
 
 
-def _render_value_profile() -> None:
-    """Value Profile subtab."""
-    st.subheader("Value Profile: Risk vs Reward")
-
-    data = filter_data(load_mv_value_profile(st.session_state.get("filter_round_id")))
-    if not data:
-        st.info("No data available for this round.")
-        return
-
-    col_config = {
+def _value_profile_config() -> dict:
+    """Column config for the Value Profile subtab."""
+    return {
         "player_name": st.column_config.TextColumn(
             "Player",
             width="medium",
@@ -551,12 +575,20 @@ def _render_value_profile() -> None:
         ),
     }
 
-    display_cols = list(col_config.keys())
-    rows = [{k: row.get(k) for k in display_cols} for row in data]
-    rows = sorted(rows, key=lambda r: r.get("par_points", 0), reverse=True)
-    for row in rows:
-        if row.get("availability") is not None:
-            row["availability"] = row["availability"] * 100
+
+def _render_value_profile(data: pd.DataFrame) -> None:
+    """Value Profile subtab."""
+    st.subheader("Value Profile: Risk vs Reward")
+
+    data = filter_data(data)
+    if data.empty:
+        st.info("No data available for this round.")
+        return
+
+    col_config = _value_profile_config()
+
+    rows = select_columns(data, list(col_config.keys()), sort_by="par_points")
+    rows["availability"] = rows["availability"] * 100
 
     st.dataframe(
         rows, use_container_width=True, hide_index=True, column_config=col_config
@@ -564,23 +596,9 @@ def _render_value_profile() -> None:
     _render_player_comparison(rows, col_config, "value_profile")
 
 
-def _render_schedule_strength() -> None:
-    """Schedule Strength subtab: MPAP-based upcoming opponent difficulty."""
-    st.subheader("Schedule Strength")
-    st.caption(
-        "Average points allowed by upcoming opponents for the player's position. "
-        "Higher = easier schedule. Overall uses next 10 matches; "
-        "Home/Away use next 5 home/away matches respectively."
-    )
-
-    data = filter_data(
-        load_mv_schedule_strength(st.session_state.get("filter_round_id"))
-    )
-    if not data:
-        st.info("No data available for this round.")
-        return
-
-    col_config = {
+def _schedule_strength_config() -> dict:
+    """Column config for the Schedule Strength subtab."""
+    return {
         "player_name": st.column_config.TextColumn("Player", width="medium"),
         "position": st.column_config.TextColumn("Pos", width="small"),
         "club_logo_url": st.column_config.ImageColumn("Club", width="small"),
@@ -647,36 +665,42 @@ def _render_schedule_strength() -> None:
         ),
     }
 
-    display_cols = list(col_config.keys())
-    rows = [{k: row.get(k) for k in display_cols} for row in data]
-    rows = sorted(rows, key=lambda r: r.get("par", 0), reverse=True)
+
+def _render_schedule_strength(data: pd.DataFrame) -> None:
+    """Schedule Strength subtab: MPAP-based upcoming opponent difficulty."""
+    st.subheader("Schedule Strength")
+    st.caption(
+        "Average points allowed by upcoming opponents for the player's position. "
+        "Higher = easier schedule. Overall uses next 10 matches; "
+        "Home/Away use next 5 home/away matches respectively."
+    )
+
+    data = filter_data(data)
+    if data.empty:
+        st.info("No data available for this round.")
+        return
+
+    col_config = _schedule_strength_config()
+
+    rows = select_columns(data, list(col_config.keys()), sort_by="par")
     st.dataframe(
         rows, use_container_width=True, hide_index=True, column_config=col_config
     )
     _render_player_comparison(rows, col_config, "schedule")
 
 
-def _render_round_by_round() -> None:
+def _render_round_by_round(data: pd.DataFrame) -> None:
     """Round-by-Round Raw subtab."""
     st.subheader("Round-by-Round Raw Data")
 
-    data = filter_data(load_mv_round_by_round(st.session_state.get("filter_round_id")))
-    if not data:
+    data = filter_data(data)
+    if data.empty:
         st.info("No data available for this round.")
         return
 
-    df = pd.DataFrame(data)
-
-    display_cols = [
-        "round",
-        "player_name",
-        "position",
-        "club_logo_url",
-        "club",
-        "points_total",
-        "points_base",
-        "did_play",
-    ]
+    df = data
+
+    display_cols = list(ROUND_BY_ROUND_COLUMNS)
     scout_cols = [c for c in df.columns if c.startswith("scout_")]
     display_cols.extend(sorted(scout_cols))
     display_cols = [c for c in display_cols if c in df.columns]
@@ -759,6 +783,59 @@ def _render_round_by_round() -> None:
             st.caption(f"Select at least {_COMPARE_MIN} players to compare.")
 
 
+# Tab label -> (mart, loader, renderer, columns read by the renderer)
+TABS = {
+    "Main": (
+        "mv_main",
+        load_mv_main,
+        _render_main,
+        [*_main_config(), "par"],
+    ),
+    "PAR Breakdown": (
+        "mv_par_breakdown",
+        load_mv_par_breakdown,
+        _render_par_breakdown,
+        [*_par_breakdown_config(), "par_points"],
+    ),
+    "Baseline": (
+        "mv_baseline",
+        load_mv_baseline,
+        _render_baseline,
+        [*_baseline_config(), "par"],
+    ),
+    "Form & Trend": (
+        "mv_form_trend",
+        load_mv_form_trend,
+        _render_form_trend,
+        [*_form_trend_config(), "par"],
+    ),
+    "Regression": (
+        "mv_regression",
+        load_mv_regression,
+        _render_regression,
+        [*_regression_config(), "par"],
+    ),
+    "Value Profile": (
+        "mv_value_profile",
+        load_mv_value_profile,
+        _render_value_profile,
+        [*_value_profile_config(), "par_points"],
+    ),
+    "Schedule": (
+        "mv_schedule_strength",
+        load_mv_schedule_strength,
+        _render_schedule_strength,
+        [*_schedule_strength_config(), "par"],
+    ),
+    "Round-by-Round": (
+        "mv_round_by_round",
+        load_mv_round_by_round,
+        _render_round_by_round,
+        [*ROUND_BY_ROUND_COLUMNS, "scout_*"],
+    ),
+}
+
+
 def main() -> None:
     """Render Market Valuation page."""
     st.title("💰 Market Valuation")
@@ -770,32 +847,21 @@ def main() -> None:
 
     render_sidebar_filters()
 
-    tabs = st.tabs(
-        [
-            "Main",
-            "PAR Breakdown",
-            "Baseline",
-            "Form & Trend",
-            "Regression",
-            "Value Profile",
-            "Schedule",
-            "Round-by-Round",
-        ]
+    # Only the selected view is loaded and rendered (segmented_control persists
+    # selection across reruns); the other marts are prefetched afterwards
+    tab_options = list(TABS)
+    selected_tab = st.segmented_control(
+        "View",
+        options=tab_options,
+        default=tab_options[0],
+        key="market_valuation_tab",
+        label_visibility="collapsed",
     )
+    round_id = st.session_state.get("filter_round_id")
+
+    if selected_tab in TABS:
+        _, loader, render, columns = TABS[selected_tab]
+        render(loader(round_id, columns))
 
-    with tabs[0]:
-        _render_main()
-    with tabs[1]:
-        _render_par_breakdown()
-    with tabs[2]:
-        _render_baseline()
-    with tabs[3]:
-        _render_form_trend()
-    with tabs[4]:
-        _render_regression()
-    with tabs[5]:
-        _render_value_profile()
-    with tabs[6]:
-        _render_schedule_strength()
-    with tabs[7]:
-        _render_round_by_round()
+    bundle_columns = {mart: columns for mart, _, _, columns in TABS.values()}
+    prefetch(f"mv_bundle_{round_id}", lambda: load_mv_bundle(round_id, bundle_columns))
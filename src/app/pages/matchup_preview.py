@@ -2,8 +2,10 @@
 
 from typing import NamedTuple
 
+import pandas as pd
 import streamlit as st
 from utils import (
+    fetch_concurrently,
     load_available_rounds,
     load_mv_main,
     load_opponent_squad,
@@ -11,8 +13,12 @@ from utils import (
     load_squad,
     load_ss_main,
     load_team,
+    select_columns,
 )
 
+# Columns the roster tables read besides the score field
+ROSTER_COLUMNS = ["player_name", "position", "club_logo_url", "club", "is_home_next"]
+
 
 class _ScoreConfig(NamedTuple):
     """Score field and display label for a comparison view."""
@@ -23,23 +29,23 @@ class _ScoreConfig(NamedTuple):
 
 
 def _build_roster_table(
-    data: list[dict], player_ids: set[int], score_field: str
-) -> tuple[list[dict], float]:
+    data: pd.DataFrame, player_ids: set[int], score_field: str
+) -> tuple[pd.DataFrame, float]:
     """Build display rows for a set of player IDs and return (rows, total_score)."""
-    rows = [row for row in data if row.get("player_id") in player_ids]
-    rows.sort(key=lambda r: (r.get("position", ""), r.get("player_name", "")))
-    total = sum(r.get(score_field) or 0.0 for r in rows)
+    rows = data[data["player_id"].isin(player_ids)]
+    rows = rows.sort_values(["position", "player_name"], na_position="first")
+    total = float(rows[score_field].fillna(0.0).sum())
     return rows, total
 
 
 def _render_roster(
-    label: str, rows: list[dict], total_score: float, cfg: _ScoreConfig
+    label: str, rows: pd.DataFrame, total_score: float, cfg: _ScoreConfig
 ) -> None:
     """Render a roster table with score total."""
     kind = "Team" if cfg.is_team else "Squad"
     st.markdown(f"**{label} {kind} ({len(rows)} players)**")
 
-    if not rows:
+    if rows.empty:
         st.info(f"No players in {label.lower()} {kind.lower()}.")
         return
 
@@ -53,8 +59,7 @@ def _render_roster(
     home_col = {"is_home_next": st.column_config.CheckboxColumn("Home?")}
     extra_cols: dict = home_col if cfg.is_team else {}
     col_config = {**base_cols, **score_col, **extra_cols}
-    display_cols = list(col_config.keys())
-    display_rows = [{k: r.get(k) for k in display_cols} for r in rows]
+    display_rows = select_columns(rows, list(col_config.keys()))
     st.dataframe(
         display_rows,
         use_container_width=True,
@@ -65,8 +70,8 @@ def _render_roster(
 
 
 def _render_comparison(
-    my_rows: list[dict],
-    opp_rows: list[dict],
+    my_rows: pd.DataFrame,
+    opp_rows: pd.DataFrame,
     my_total: float,
     opp_total: float,
     cfg: _ScoreConfig,
@@ -111,10 +116,15 @@ def main() -> None:
             key="matchup_round_id",
         )
 
-    map_data = load_ss_main(round_id)
-    par_data = load_mv_main(round_id)
+    data = fetch_concurrently(
+        {
+            "map": lambda: load_ss_main(round_id, [*ROSTER_COLUMNS, "map_score"]),
+            "par": lambda: load_mv_main(round_id, [*ROSTER_COLUMNS, "par"]),
+        }
+    )
+    map_data, par_data = data["map"], data["par"]
 
-    if not map_data and not par_data:
+    if map_data.empty and par_data.empty:
         st.info("No data available for this round.")
         return
 
@@ -126,7 +136,7 @@ def main() -> None:
     tab_team, tab_squad = st.tabs(["Team", "Squad"])
 
     with tab_team:
-        if not map_data:
+        if map_data.empty:
             st.info("No MAP data available for this round.")
         else:
             cfg_team = _ScoreConfig(field="map_score", label="MAP", is_team=True)
@@ -141,7 +151,7 @@ def main() -> None:
             )
 
     with tab_squad:
-        if not par_data:
+        if par_data.empty:
             st.info("No PAR data available for this round.")
         else:
             cfg_squad = _ScoreConfig(field="par", label="PAR", is_team=False)
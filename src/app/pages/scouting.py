@@ -10,6 +10,7 @@ from utils import (
     load_scout_points,
     load_scouting_data,
     render_sidebar_filters,
+    select_columns,
     style_dataframe,
 )
 
@@ -96,8 +97,38 @@ PAGE_COLUMN_CONFIG = {
     },
 }
 
+# Columns each view reads; "avg_*" covers per-scout averages and home/away splits
+_METRIC_COLUMNS = (
+    "club_logo_url",
+    "matches_counted",
+    "availability",
+    "pts_avg",
+    "ga_avg",
+    "base_avg",
+    "adp_*",
+    "dvs_*",
+    "z_score_*",
+    "avg_*",
+)
+TAB_COLUMNS = {
+    "Rankings Overview": (
+        "club_logo_url",
+        "pts_avg",
+        "base_avg",
+        "adp_*",
+        "availability",
+    ),
+    "Detailed Metrics": _METRIC_COLUMNS,
+    "Compare Players": _METRIC_COLUMNS,
+}
+
 
-def render_rankings_tab(data: list[dict]) -> None:
+def _as_record(row: pd.Series) -> dict:
+    """Convert a single selected row to a dict, with nulls as None."""
+    return {k: (None if pd.isna(v) else v) for k, v in row.items()}
+
+
+def render_rankings_tab(data: pd.DataFrame) -> None:
     """Render rankings overview tab."""
     st.subheader("ADP Rankings Comparison")
 
@@ -176,7 +207,7 @@ def render_rankings_tab(data: list[dict]) -> None:
         "availability",
     ]
 
-    display_data = [{k: row.get(k) for k in display_cols} for row in data]
+    display_data = select_columns(data, display_cols)
 
     st.dataframe(
         display_data, width="stretch", hide_index=True, column_config=col_config
@@ -184,7 +215,7 @@ def render_rankings_tab(data: list[dict]) -> None:
 
 
 def render_details_tab(
-    data: list[dict],
+    data: pd.DataFrame,
     scout_groups: tuple[list[tuple[str, str, float]], ...],
     time_period: str,
 ) -> None:
@@ -409,8 +440,7 @@ def render_details_tab(
             "z_score_pos_base",
         ]
 
-    display_data = [{k: row.get(k) for k in display_cols} for row in data]
-    df = pd.DataFrame(display_data)
+    df = select_columns(data, display_cols)
 
     # Columns to apply color styling
     if is_general:
@@ -454,14 +484,14 @@ def render_details_tab(
     selected_rows = event.selection.rows
     if selected_rows:
         selected_idx = selected_rows[0]
-        player = data[selected_idx]
+        player = _as_record(data.iloc[selected_idx])
         st.subheader(f"Scout Breakdown: {player['player_name']}")
         st.caption(f"{player['position']} | {player['club']}")
         _render_scout_breakdown(player, scout_groups, time_period)
 
 
 def render_comparison_tab(
-    data: list[dict],
+    data: pd.DataFrame,
     scout_groups: tuple[list[tuple[str, str, float]], ...],
     time_period: str,
 ) -> None:
@@ -469,13 +499,23 @@ def render_comparison_tab(
     _ = time_period  # Used for consistency with other tabs
     st.subheader("Player Comparison")
 
-    selected = st.multiselect(
+    # Options are row labels; only the selected players are turned into dicts
+    labels = (
+        data["player_name"]
+        + " ("
+        + data["position"].fillna("")
+        + " - "
+        + data["club"].fillna("")
+        + ")"
+    )
+    selected_labels = st.multiselect(
         "Select players to compare (up to 5)",
-        options=sorted(data, key=lambda x: x["player_name"]),
-        format_func=lambda x: f"{x['player_name']} ({x['position']} - {x['club']})",
+        options=data["player_name"].sort_values().index.tolist(),
+        format_func=lambda idx: labels[idx],
         max_selections=5,
         placeholder="Search and select players...",
     )
+    selected = [_as_record(data.loc[idx]) for idx in selected_labels]
 
     if not selected:
         st.info("Select players above to compare their metrics side-by-side.")
@@ -760,31 +800,31 @@ def main() -> None:
 
     render_sidebar_filters(render_rounds=selected_period != "Last Season")
 
+    # Main tabs (segmented_control persists selection across reruns)
+    tab_options = list(TAB_COLUMNS)
+    selected_tab = st.segmented_control(
+        "View",
+        options=tab_options,
+        default=tab_options[0],
+        key="scouting_tab",
+        label_visibility="collapsed",
+    )
+
     # Load data; round only applies when not viewing last season
     with st.spinner("Loading data..."):
         data = load_scouting_data(
-            view_name, round_id=st.session_state.get("filter_round_id")
+            view_name,
+            round_id=st.session_state.get("filter_round_id"),
+            columns=TAB_COLUMNS.get(selected_tab),
         )
         scout_points = load_scout_points()
         scout_groups = get_scout_groups(scout_points)
 
     # Convert availability to percentage
-    for row in data:
-        if row.get("availability") is not None:
-            row["availability"] = row["availability"] * 100
+    data["availability"] = data["availability"] * 100
 
     filtered_data = filter_data(data)
 
-    # Main tabs (segmented_control persists selection across reruns)
-    tab_options = ["Rankings Overview", "Detailed Metrics", "Compare Players"]
-    selected_tab = st.segmented_control(
-        "View",
-        options=tab_options,
-        default=tab_options[0],
-        key="scouting_tab",
-        label_visibility="collapsed",
-    )
-
     if selected_tab == "Rankings Overview":
         render_rankings_tab(filtered_data)
     elif selected_tab == "Detailed Metrics":
@@ -4,7 +4,10 @@ from collections.abc import Callable
 
 import pandas as pd
 import streamlit as st
+from roster_store import RosterConflictError
 from utils import (
+    get_name_index,
+    get_roster_store,
     get_user_email,
     load_clubs,
     load_enriched_players,
@@ -100,9 +103,8 @@ def _apply_filters(df: pd.DataFrame, prefix: str) -> pd.DataFrame:
 
     df_filtered = df
     if filter_name:
-        df_filtered = df_filtered[
-            df_filtered["player_name"].str.contains(filter_name, case=False, na=False)
-        ]
+        names = get_name_index(df_filtered["player_name"]).filter(filter_name)
+        df_filtered = df_filtered[df_filtered["player_name"].isin(names)]
     if filter_club["abbreviation"] != "All":
         df_filtered = df_filtered[df_filtered["club"] == filter_club["abbreviation"]]
     if filter_pos != "All":
@@ -200,9 +202,10 @@ def _render_remove_section(  # noqa: PLR0913
             ids_stored.discard(player_id)
             if also_remove_from is not None:
                 also_remove_from.discard(player_id)
-        save_fn(ids_stored)
-        if also_save_fn is not None and also_remove_from is not None:
-            also_save_fn(also_remove_from)
+        with get_roster_store().batch():
+            save_fn(ids_stored)
+            if also_save_fn is not None and also_remove_from is not None:
+                also_save_fn(also_remove_from)
         st.rerun()
 
 
@@ -346,12 +349,11 @@ def main() -> None:
 
     get_user_email()
 
-    players_all = load_enriched_players()
-    if not players_all:
+    df_all = load_enriched_players(["player_id", "club", *PLAYER_COLUMNS])
+    if df_all.empty:
         st.error("No player data available.")
         return
 
-    df_all = pd.DataFrame(players_all)
     ids_valid = set(df_all["player_id"].tolist())
 
     # Load both sets
@@ -377,19 +379,28 @@ def main() -> None:
         key="squad_view_selector",
     )
 
-    if view == "My Squad and Team":
-        _render_view(
-            df_all,
-            (ids_squad, ids_team),
-            (save_squad, save_team),
-            prefix="my",
-            ids_excluded=ids_opp_squad,
-        )
-    else:
-        _render_view(
-            df_all,
-            (ids_opp_squad, ids_opp_team),
-            (save_opponent_squad, save_opponent_team),
-            prefix="opp",
-            ids_excluded=ids_squad,
+    try:
+        if view == "My Squad and Team":
+            _render_view(
+                df_all,
+                (ids_squad, ids_team),
+                (save_squad, save_team),
+                prefix="my",
+                ids_excluded=ids_opp_squad,
+            )
+        else:
+            _render_view(
+                df_all,
+                (ids_opp_squad, ids_opp_team),
+                (save_opponent_squad, save_opponent_team),
+                prefix="opp",
+                ids_excluded=ids_squad,
+            )
+    except RosterConflictError:
+        # Another session saved first: drop this session's copies so they reload
+        for key in ("ids_squad", "ids_team", "ids_opp_squad", "ids_opp_team"):
+            st.session_state.pop(key, None)
+        st.warning(
+            "Your rosters were changed in another session and have been reloaded. "
+            "Please make your change again."
         )
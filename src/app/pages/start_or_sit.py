@@ -4,7 +4,9 @@ import pandas as pd
 import streamlit as st
 from utils import (
     filter_data,
+    is_prefetched,
     load_available_rounds,
+    load_ss_bundle,
     load_ss_distribution,
     load_ss_edge_cases,
     load_ss_home_away,
@@ -12,20 +14,30 @@ from utils import (
     load_ss_map_breakdown,
     load_ss_mpap_debug,
     load_ss_round_by_round,
+    prefetch,
     render_sidebar_filters,
+    select_columns,
 )
 
-
-def _render_main() -> None:
-    """Render main consolidated tab with key decision columns."""
-    st.subheader("Start or Sit Overview")
-
-    data = filter_data(load_ss_main(st.session_state.get("filter_round_id")))
-    if not data:
-        st.info("No data available for this round.")
-        return
-
-    col_config = {
+ROUND_BY_ROUND_COLUMNS = [
+    "round",
+    "match_id",
+    "player_name",
+    "position",
+    "club_logo_url",
+    "club",
+    "opponent_logo_url",
+    "opponent_club",
+    "is_home",
+    "points_total",
+    "points_base",
+    "did_play",
+]
+
+
+def _main_config() -> dict:
+    """Column config for the main tab."""
+    return {
         "player_name": st.column_config.TextColumn(
             "Player",
             width="medium",
@@ -79,24 +91,27 @@ def _render_main() -> None:
         ),
     }
 
-    display_cols = list(col_config.keys())
-    rows = [{k: row.get(k) for k in display_cols} for row in data]
-    rows = sorted(rows, key=lambda r: r.get("map_score", 0), reverse=True)
-    st.dataframe(
-        rows, use_container_width=True, hide_index=True, column_config=col_config
-    )
-
 
-def _render_map_breakdown() -> None:
-    """MAP Breakdown subtab: every component of the MAP projection."""
-    st.subheader("MAP Component Breakdown")
+def _render_main(data: pd.DataFrame) -> None:
+    """Render main consolidated tab with key decision columns."""
+    st.subheader("Start or Sit Overview")
 
-    data = filter_data(load_ss_map_breakdown(st.session_state.get("filter_round_id")))
-    if not data:
+    data = filter_data(data)
+    if data.empty:
         st.info("No data available for this round.")
         return
 
-    col_config = {
+    col_config = _main_config()
+
+    rows = select_columns(data, list(col_config.keys()), sort_by="map_score")
+    st.dataframe(
+        rows, use_container_width=True, hide_index=True, column_config=col_config
+    )
+
+
+def _map_breakdown_config() -> dict:
+    """Column config for the MAP Breakdown subtab."""
+    return {
         "player_name": st.column_config.TextColumn(
             "Player",
             width="medium",
@@ -169,24 +184,27 @@ def _render_map_breakdown() -> None:
         ),
     }
 
-    display_cols = list(col_config.keys())
-    rows = [{k: row.get(k) for k in display_cols} for row in data]
-    rows = sorted(rows, key=lambda r: r.get("map_points", 0), reverse=True)
-    st.dataframe(
-        rows, use_container_width=True, hide_index=True, column_config=col_config
-    )
-
 
-def _render_mpap_debug() -> None:
-    """Opponent & MPAP Debug subtab."""
-    st.subheader("Opponent Strength (MPAP Debug)")
+def _render_map_breakdown(data: pd.DataFrame) -> None:
+    """MAP Breakdown subtab: every component of the MAP projection."""
+    st.subheader("MAP Component Breakdown")
 
-    data = filter_data(load_ss_mpap_debug(st.session_state.get("filter_round_id")))
-    if not data:
+    data = filter_data(data)
+    if data.empty:
         st.info("No data available for this round.")
         return
 
-    col_config = {
+    col_config = _map_breakdown_config()
+
+    rows = select_columns(data, list(col_config.keys()), sort_by="map_points")
+    st.dataframe(
+        rows, use_container_width=True, hide_index=True, column_config=col_config
+    )
+
+
+def _mpap_debug_config() -> dict:
+    """Column config for the Opponent & MPAP Debug subtab."""
+    return {
         "opponent_logo_url": st.column_config.ImageColumn(
             "Club",
             width="small",
@@ -241,23 +259,27 @@ def _render_mpap_debug() -> None:
         ),
     }
 
-    display_cols = list(col_config.keys())
-    rows = [{k: row.get(k) for k in display_cols} for row in data]
-    st.dataframe(
-        rows, use_container_width=True, hide_index=True, column_config=col_config
-    )
-
 
-def _render_home_away() -> None:
-    """Player Home-Away subtab: home vs away performance."""
-    st.subheader("Home vs Away Splits")
+def _render_mpap_debug(data: pd.DataFrame) -> None:
+    """Opponent & MPAP Debug subtab."""
+    st.subheader("Opponent Strength (MPAP Debug)")
 
-    data = filter_data(load_ss_home_away(st.session_state.get("filter_round_id")))
-    if not data:
+    data = filter_data(data)
+    if data.empty:
         st.info("No data available for this round.")
         return
 
-    col_config = {
+    col_config = _mpap_debug_config()
+
+    rows = select_columns(data, list(col_config.keys()))
+    st.dataframe(
+        rows, use_container_width=True, hide_index=True, column_config=col_config
+    )
+
+
+def _home_away_config() -> dict:
+    """Column config for the Player Home-Away subtab."""
+    return {
         "player_name": st.column_config.TextColumn(
             "Player",
             width="medium",
@@ -333,24 +355,27 @@ def _render_home_away() -> None:
         ),
     }
 
-    display_cols = list(col_config.keys())
-    data = sorted(data, key=lambda r: r.get("map_score", 0), reverse=True)
-    rows = [{k: row.get(k) for k in display_cols} for row in data]
-    st.dataframe(
-        rows, use_container_width=True, hide_index=True, column_config=col_config
-    )
-
 
-def _render_distribution() -> None:
-    """Distribution & Volatility subtab."""
-    st.subheader("Distribution & Volatility")
+def _render_home_away(data: pd.DataFrame) -> None:
+    """Player Home-Away subtab: home vs away performance."""
+    st.subheader("Home vs Away Splits")
 
-    data = filter_data(load_ss_distribution(st.session_state.get("filter_round_id")))
-    if not data:
+    data = filter_data(data)
+    if data.empty:
         st.info("No data available for this round.")
         return
 
-    col_config = {
+    col_config = _home_away_config()
+
+    rows = select_columns(data, list(col_config.keys()), sort_by="map_score")
+    st.dataframe(
+        rows, use_container_width=True, hide_index=True, column_config=col_config
+    )
+
+
+def _distribution_config() -> dict:
+    """Column config for the Distribution & Volatility subtab."""
+    return {
         "player_name": st.column_config.TextColumn(
             "Player",
             width="medium",
@@ -415,46 +440,41 @@ def _render_distribution() -> None:
         ),
     }
 
-    display_cols = list(col_config.keys())
-    data = sorted(data, key=lambda r: r.get("map_score", 0), reverse=True)
-    rows = [{k: row.get(k) for k in display_cols} for row in data]
+
+def _render_distribution(data: pd.DataFrame) -> None:
+    """Distribution & Volatility subtab."""
+    st.subheader("Distribution & Volatility")
+
+    data = filter_data(data)
+    if data.empty:
+        st.info("No data available for this round.")
+        return
+
+    col_config = _distribution_config()
+
+    rows = select_columns(data, list(col_config.keys()), sort_by="map_score")
 
     # Convert rates from fractions to percentages
-    for row in rows:
-        for col in ("boom_rate", "bust_rate"):
-            if row.get(col) is not None:
-                row[col] = row[col] * 100
+    for col in ("boom_rate", "bust_rate"):
+        rows[col] = rows[col] * 100
 
     st.dataframe(
         rows, use_container_width=True, hide_index=True, column_config=col_config
     )
 
 
-def _render_round_by_round() -> None:
+def _render_round_by_round(data: pd.DataFrame) -> None:
     """Round-by-Round Raw subtab."""
     st.subheader("Round-by-Round Raw Data")
 
-    data = filter_data(load_ss_round_by_round(st.session_state.get("filter_round_id")))
-    if not data:
+    data = filter_data(data)
+    if data.empty:
         st.info("No data available for this round.")
         return
 
-    df = pd.DataFrame(data)
-
-    display_cols = [
-        "round",
-        "match_id",
-        "player_name",
-        "position",
-        "club_logo_url",
-        "club",
-        "opponent_logo_url",
-        "opponent_club",
-        "is_home",
-        "points_total",
-        "points_base",
-        "did_play",
-    ]
+    df = data
+
+    display_cols = list(ROUND_BY_ROUND_COLUMNS)
     scout_cols = [c for c in df.columns if c.startswith("scout_")]
     display_cols.extend(sorted(scout_cols))
     display_cols = [c for c in display_cols if c in df.columns]
@@ -525,16 +545,9 @@ def _render_round_by_round() -> None:
     )
 
 
-def _render_edge_cases() -> None:
-    """Edge Cases & Missing Data subtab."""
-    st.subheader("Edge Cases & Missing Data")
-
-    data = filter_data(load_ss_edge_cases())
-    if not data:
-        st.info("No data available.")
-        return
-
-    col_config = {
+def _edge_cases_config() -> dict:
+    """Column config for the Edge Cases & Missing Data subtab."""
+    return {
         "player_name": st.column_config.TextColumn(
             "Player",
             width="medium",
@@ -587,14 +600,71 @@ def _render_edge_cases() -> None:
         ),
     }
 
-    display_cols = list(col_config.keys())
-    data = sorted(data, key=lambda r: r.get("map_score", 0), reverse=True)
-    rows = [{k: row.get(k) for k in display_cols} for row in data]
+
+def _render_edge_cases(data: pd.DataFrame) -> None:
+    """Edge Cases & Missing Data subtab."""
+    st.subheader("Edge Cases & Missing Data")
+
+    data = filter_data(data)
+    if data.empty:
+        st.info("No data available.")
+        return
+
+    col_config = _edge_cases_config()
+
+    rows = select_columns(data, list(col_config.keys()), sort_by="map_score")
     st.dataframe(
         rows, use_container_width=True, hide_index=True, column_config=col_config
     )
 
 
+# Tab label -> (mart, loader, renderer, columns read by the renderer)
+TABS = {
+    "Main": (
+        "ss_main",
+        load_ss_main,
+        _render_main,
+        [*_main_config(), "map_score"],
+    ),
+    "MAP Breakdown": (
+        "ss_map_breakdown",
+        load_ss_map_breakdown,
+        _render_map_breakdown,
+        [*_map_breakdown_config(), "map_points"],
+    ),
+    "Opponent & MPAP": (
+        "ss_mpap_debug",
+        load_ss_mpap_debug,
+        _render_mpap_debug,
+        [*_mpap_debug_config()],
+    ),
+    "Home / Away Splits": (
+        "ss_home_away",
+        load_ss_home_away,
+        _render_home_away,
+        [*_home_away_config(), "map_score"],
+    ),
+    "Distribution": (
+        "ss_distribution",
+        load_ss_distribution,
+        _render_distribution,
+        [*_distribution_config(), "map_score"],
+    ),
+    "Round-by-Round": (
+        "ss_round_by_round",
+        load_ss_round_by_round,
+        _render_round_by_round,
+        [*ROUND_BY_ROUND_COLUMNS, "scout_*"],
+    ),
+    "Edge Cases": (
+        "ss_edge_cases",
+        lambda _, columns: load_ss_edge_cases(columns),
+        _render_edge_cases,
+        [*_edge_cases_config(), "map_score"],
+    ),
+}
+
+
 def main() -> None:
     """Render Start or Sit page."""
     st.title("⚖️ Start or Sit")
@@ -606,29 +676,32 @@ def main() -> None:
 
     render_sidebar_filters()
 
-    tabs = st.tabs(
-        [
-            "Main",
-            "MAP Breakdown",
-            "Opponent & MPAP",
-            "Home / Away Splits",
-            "Distribution",
-            "Round-by-Round",
-            "Edge Cases",
-        ]
+    # Only the selected view is loaded and rendered (segmented_control persists
+    # selection across reruns); the rest of the round is prefetched afterwards
+    tab_options = list(TABS)
+    selected_tab = st.segmented_control(
+        "View",
+        options=tab_options,
+        default=tab_options[0],
+        key="start_or_sit_tab",
+        label_visibility="collapsed",
     )
+    round_id = st.session_state.get("filter_round_id")
+    bundle_key = f"ss_bundle_{round_id}"
+    bundle_columns = {mart: columns for mart, _, _, columns in TABS.values()}
+    # The prefetched bundle leaves out the mart of the view first opened in the
+    # round, which its own loader has just read
+    opened = TABS[selected_tab][0] if selected_tab in TABS else None
+    bundle_marts = st.session_state.setdefault(
+        f"{bundle_key}_marts",
+        tuple(mart for mart in bundle_columns if mart != opened),
+    )
+
+    if selected_tab in TABS:
+        mart, loader, render, columns = TABS[selected_tab]
+        if mart in bundle_marts and is_prefetched(bundle_key):
+            render(load_ss_bundle(round_id, bundle_columns, bundle_marts)[mart])
+        else:
+            render(loader(round_id, columns))
 
-    with tabs[0]:
-        _render_main()
-    with tabs[1]:
-        _render_map_breakdown()
-    with tabs[2]:
-        _render_mpap_debug()
-    with tabs[3]:
-        _render_home_away()
-    with tabs[4]:
-        _render_distribution()
-    with tabs[5]:
-        _render_round_by_round()
-    with tabs[6]:
-        _render_edge_cases()
+    prefetch(bundle_key, lambda: load_ss_bundle(round_id, bundle_columns, bundle_marts))
@@ -1,35 +1,38 @@
 """Trade Simulator page."""
 
+import pandas as pd
 import streamlit as st
-from utils import load_available_rounds, load_mv_main, load_squad
+from utils import (
+    get_name_index,
+    load_available_rounds,
+    load_mv_main,
+    load_squad,
+    select_columns,
+)
 
 FAIR_TRADE_THRESHOLD = 0.5
 
+PLAYER_COLUMNS = ["player_id", "player_name", "position", "club", "baseline_pts", "par"]
 
-def _build_player_options(data: list[dict]) -> list[dict]:
-    """Build sorted player options with display labels."""
-    players = []
-    for row in data:
-        if row.get("par") is None:
-            continue
-        players.append(
-            {
-                "player_id": row["player_id"],
-                "label": f"{row['player_name']} ({row['position']} — {row['club']})",
-                "player_name": row["player_name"],
-                "position": row["position"],
-                "club": row["club"],
-                "baseline_pts": row.get("baseline_pts"),
-                "par": row["par"],
-            }
-        )
-    return sorted(players, key=lambda p: p["label"])
+
+def _build_player_options(data: pd.DataFrame) -> pd.DataFrame:
+    """Build player options with display labels, sorted by label and keyed by ID."""
+    players = data[data["par"].notna()].reindex(columns=PLAYER_COLUMNS)
+    players["label"] = (
+        players["player_name"]
+        + " ("
+        + players["position"]
+        + " — "
+        + players["club"]
+        + ")"
+    )
+    return players.sort_values("label").set_index("player_id", drop=False)
 
 
-def _render_side(player_by_id: dict, player_ids: list[int], label: str) -> float:
+def _render_side(players: pd.DataFrame, player_ids: list[int], label: str) -> float:
     """Render a side's player table and return total PAR."""
-    rows = [player_by_id[pid] for pid in player_ids]
-    total_par = sum(r["par"] for r in rows)
+    rows = players.loc[player_ids]
+    total_par = float(rows["par"].sum())
 
     col_config = {
         "player_name": st.column_config.TextColumn("Player", width="medium"),
@@ -38,8 +41,7 @@ def _render_side(player_by_id: dict, player_ids: list[int], label: str) -> float
         "baseline_pts": st.column_config.NumberColumn("Baseline", format="%.2f"),
         "par": st.column_config.NumberColumn("PAR", format="%+.2f"),
     }
-    display_cols = list(col_config.keys())
-    table_rows = [{k: r.get(k) for k in display_cols} for r in rows]
+    table_rows = select_columns(rows, list(col_config.keys()))
     st.dataframe(
         table_rows,
         use_container_width=True,
@@ -72,30 +74,55 @@ def _render_verdict(par_a: float, par_b: float) -> None:
         st.markdown(f"### {icon} {verdict}")
 
 
-def _render_selections(
-    players: list[dict], player_by_id: dict
-) -> tuple[list[int], list[int]]:
+def _search_players(players: pd.DataFrame, search: str) -> list[int]:
+    """Return player IDs matching the search text, best match first."""
+    if not search:
+        return players["player_id"].tolist()
+    ranked = get_name_index(players["player_name"]).search(search)
+    rank = {name: i for i, name in enumerate(ranked)}
+    order = players["player_name"].map(rank).dropna().sort_values(kind="stable")
+    return order.index.tolist()
+
+
+def _with_selected(options: list[int], key: str, allowed: list[int]) -> list[int]:
+    """Keep already selected IDs among the options so a new search keeps them."""
+    selected = [pid for pid in st.session_state.get(key, []) if pid in allowed]
+    return [*selected, *(pid for pid in options if pid not in selected)]
+
+
+def _render_selections(players: pd.DataFrame) -> tuple[list[int], list[int]]:
     """Render player selection multiselects and return selected IDs."""
+    search = st.text_input(
+        "Find players",
+        placeholder="Type a name (accents and typos are fine)...",
+        key="trade_search",
+    )
+    found = _search_players(players, search)
+
     col_left, col_right = st.columns(2)
 
     with col_left:
         st.subheader("Side A")
         selected_left = st.multiselect(
             "Side A receives",
-            options=[p["player_id"] for p in players],
-            format_func=lambda pid: player_by_id[pid]["label"],
+            options=_with_selected(
+                found, "trade_side_a", players["player_id"].tolist()
+            ),
+            format_func=lambda pid: players.loc[pid, "label"],
             key="trade_side_a",
         )
 
     with col_right:
         st.subheader("Side B")
-        available_right = [
-            p["player_id"] for p in players if p["player_id"] not in selected_left
-        ]
+        available_right = [pid for pid in found if pid not in selected_left]
         selected_right = st.multiselect(
             "Side B receives",
-            options=available_right,
-            format_func=lambda pid: player_by_id[pid]["label"],
+            options=_with_selected(
+                available_right,
+                "trade_side_b",
+                [pid for pid in players["player_id"] if pid not in selected_left],
+            ),
+            format_func=lambda pid: players.loc[pid, "label"],
             key="trade_side_b",
         )
 
@@ -121,26 +148,24 @@ def main() -> None:
         )
         my_squad = st.toggle("My Squad", value=False, key="trade_my_squad")
 
-    data = load_mv_main(round_id)
-    if not data:
+    data = load_mv_main(round_id, PLAYER_COLUMNS)
+    if data.empty:
         st.info("No valuation data available for this round.")
         return
 
     players = _build_player_options(data)
     if my_squad:
-        players = [p for p in players if p["player_id"] in load_squad()]
-    if not players:
+        players = players[players["player_id"].isin(load_squad())]
+    if players.empty:
         st.info("No players with PAR data available.")
         return
 
-    player_by_id = {p["player_id"]: p for p in players}
-
     st.markdown(
         "Select the players each side **receives** in the trade. "
         "The PAR delta shows which side gets more value."
     )
 
-    selected_left, selected_right = _render_selections(players, player_by_id)
+    selected_left, selected_right = _render_selections(players)
 
     if not selected_left and not selected_right:
         return
@@ -154,14 +179,14 @@ def main() -> None:
     with col_left:
         if selected_left:
             st.markdown("**Side A receives:**")
-            par_a = _render_side(player_by_id, selected_left, "Side A")
+            par_a = _render_side(players, selected_left, "Side A")
         else:
             st.info("No players selected for Side A.")
 
     with col_right:
         if selected_right:
             st.markdown("**Side B receives:**")
-            par_b = _render_side(player_by_id, selected_right, "Side B")
+            par_b = _render_side(players, selected_right, "Side B")
         else:
             st.info("No players selected for Side B.")
 
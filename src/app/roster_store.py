@@ -0,0 +1,223 @@
+"""Roster persistence for Fantasy BR: squads and teams, batched and session-cached."""
+
+import datetime
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Protocol
+
+from google.api_core.exceptions import AlreadyExists, FailedPrecondition, NotFound
+
+if TYPE_CHECKING:
+    from google.cloud.firestore import Client as FirestoreClient
+
+# One document per user email in each collection
+ROSTER_COLLECTIONS = (
+    "user_squads",
+    "user_teams",
+    "opponent_squads",
+    "opponent_teams",
+)
+
+# Seconds a session trusts its cached rosters before reading them again
+ROSTER_MAX_AGE = 30.0
+
+
+class RosterConflictError(Exception):
+    """A roster changed in the backend since this session read it."""
+
+
+class RosterBackend(Protocol):
+    """Storage for roster documents: player IDs plus a version stamp each."""
+
+    def get_all(
+        self, user: str, collections: Sequence[str]
+    ) -> dict[str, tuple[set[int], object]]:
+        """Read a user's rosters from the given collections in one round trip."""
+        ...
+
+    def commit(
+        self,
+        user: str,
+        rosters: dict[str, set[int]],
+        versions: dict[str, object],
+    ) -> dict[str, object]:
+        """Write a user's rosters in one batch and return their new versions.
+
+        Each roster is only written if its stored version is still the one in
+        ``versions`` (None: not stored yet); otherwise nothing is written and
+        RosterConflictError is raised.
+        """
+        ...
+
+
+class FirestoreRosterBackend:
+    """Roster backend on Firestore, keyed by collection and user email."""
+
+    def __init__(self, client: "FirestoreClient") -> None:
+        """Wrap a Firestore client."""
+        self.client = client
+
+    def get_all(
+        self, user: str, collections: Sequence[str]
+    ) -> dict[str, tuple[set[int], object]]:
+        """Read every roster document with a single batched get_all."""
+        refs = [self.client.collection(name).document(user) for name in collections]
+        rosters: dict[str, tuple[set[int], object]] = {
+            name: (set(), None) for name in collections
+        }
+        for snapshot in self.client.get_all(refs):
+            if snapshot.exists:
+                rosters[snapshot.reference.parent.id] = (
+                    set(snapshot.to_dict().get("player_ids", [])),
+                    snapshot.update_time,
+                )
+        return rosters
+
+    def commit(
+        self,
+        user: str,
+        rosters: dict[str, set[int]],
+        versions: dict[str, object],
+    ) -> dict[str, object]:
+        """Replace the given roster documents in one batched commit.
+
+        Documents read before are updated on their ``update_time``, new ones
+        created, so a write made elsewhere in between fails the whole batch.
+        """
+        batch = self.client.batch()
+        updated_at = datetime.datetime.now(tz=datetime.UTC)
+        for name, player_ids in rosters.items():
+            reference = self.client.collection(name).document(user)
+            data = {"player_ids": list(player_ids), "updated_at": updated_at}
+            if versions.get(name) is None:
+                batch.create(reference, data)
+            else:
+                option = self.client.write_option(last_update_time=versions[name])
+                batch.update(reference, data, option=option)
+        try:
+            results = batch.commit()
+        except (AlreadyExists, FailedPrecondition, NotFound) as error:
+            msg = f"Rosters of {user} changed since they were read"
+            raise RosterConflictError(msg) from error
+        return {
+            name: result.update_time
+            for name, result in zip(rosters, results, strict=True)
+        }
+
+
+class InMemoryRosterBackend:
+    """Roster backend held in a dict, for local runs and tests."""
+
+    def __init__(self) -> None:
+        """Start with no stored rosters."""
+        self.documents: dict[tuple[str, str], tuple[set[int], int]] = {}
+        self.version = 0
+
+    def get_all(
+        self, user: str, collections: Sequence[str]
+    ) -> dict[str, tuple[set[int], object]]:
+        """Read the stored rosters (missing ones come back empty)."""
+        return {
+            name: self.documents.get((name, user), (set(), None))
+            for name in collections
+        }
+
+    def commit(
+        self,
+        user: str,
+        rosters: dict[str, set[int]],
+        versions: dict[str, object],
+    ) -> dict[str, object]:
+        """Store the rosters under a new version, if none changed since ``versions``."""
+        for name in rosters:
+            if self.documents.get((name, user), (None, None))[1] != versions.get(name):
+                msg = f"Rosters of {user} changed since they were read"
+                raise RosterConflictError(msg)
+        self.version += 1
+        for name, player_ids in rosters.items():
+            self.documents[name, user] = (set(player_ids), self.version)
+        return dict.fromkeys(rosters, self.version)
+
+
+class RosterStore:
+    """One user's rosters for a session, over a RosterBackend.
+
+    All rosters are read together on first use and kept with their version
+    stamps, then read again once older than ``max_age`` seconds. Saves are
+    written straight away, or as a single commit when made inside ``batch()``,
+    and only reach the cache once committed. A commit fails with
+    RosterConflictError when a roster changed elsewhere since it was read; the
+    store then re-reads every roster.
+    """
+
+    def __init__(
+        self, backend: RosterBackend, user: str, max_age: float = ROSTER_MAX_AGE
+    ) -> None:
+        """Bind the store to a backend and user; nothing is read yet."""
+        self.backend = backend
+        self.user = user
+        self.max_age = max_age
+        self.versions: dict[str, object] = {}
+        self._rosters: dict[str, set[int]] | None = None
+        self._read_at = 0.0
+        self._pending: dict[str, set[int]] = {}
+        self._batch_depth = 0
+
+    def refresh(self) -> None:
+        """Re-read every roster from the backend."""
+        documents = self.backend.get_all(self.user, ROSTER_COLLECTIONS)
+        self._rosters = {name: ids for name, (ids, _) in documents.items()}
+        self.versions = {name: version for name, (_, version) in documents.items()}
+        self._read_at = time.monotonic()
+
+    def _rosters_read(self) -> dict[str, set[int]]:
+        """Return the cached rosters, re-read when missing or stale (no batch open)."""
+        stale = time.monotonic() - self._read_at > self.max_age
+        if self._rosters is None or (stale and not self._pending):
+            self.refresh()
+        return self._rosters
+
+    def load(self, collection: str) -> set[int]:
+        """Return a roster's player IDs, including saves not committed yet."""
+        rosters = self._rosters_read()
+        return set(self._pending.get(collection, rosters[collection]))
+
+    def save(self, collection: str, player_ids: set[int]) -> None:
+        """Replace a roster, deferring the write while a batch is open."""
+        self._rosters_read()
+        self._pending[collection] = set(player_ids)
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all pending rosters in one commit, then cache them."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        expected = {name: self.versions.get(name) for name in pending}
+        try:
+            versions = self.backend.commit(self.user, pending, expected)
+        except RosterConflictError:
+            self.refresh()
+            raise
+        self._rosters.update(pending)
+        self.versions.update(versions)
+
+    @contextmanager
+    def batch(self) -> Iterator["RosterStore"]:
+        """Coalesce every save made inside the block into one commit.
+
+        Saves are dropped, not written, when the block raises.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._pending = {}
+            raise
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
@@ -4,12 +4,27 @@
 # ruff: noqa: S608
 
 import datetime
+import hashlib
+import os
+import threading
+import unicodedata
+from bisect import bisect_left
+from collections import Counter, OrderedDict, defaultdict
+from collections.abc import Callable, Collection, Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from fnmatch import fnmatchcase
+from functools import partial
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 import streamlit as st
+from google.api_core.exceptions import NotFound
 from google.cloud import bigquery, firestore
 from google.oauth2 import service_account
+from roster_store import FirestoreRosterBackend, RosterStore
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 if TYPE_CHECKING:
     from google.cloud.firestore import Client as FirestoreClient
@@ -18,6 +33,28 @@ PROJECT_ID = "fantasy-br"
 DATASET_ID = "fdmdev_fantasy_br"
 FIRESTORE_DATABASE = "fantasy-br-dev-squads-teams"
 
+# Local DuckDB build (`uv run dbt build --target duckdb`): when set, marts are read
+# from this file instead of BigQuery (the roster store stays on Firestore)
+DUCKDB_PATH = os.environ.get("FANTASY_BR_DUCKDB")
+
+# Upper bound on BigQuery jobs a page keeps in flight at once
+MAX_CONCURRENT_QUERIES = 8
+
+# Share of a query's trigrams a name must hold to count as a fuzzy match
+NAME_MATCH_MIN_SIMILARITY = 0.5
+
+# Columns filter_data reads, kept in every projection
+FILTER_COLUMNS = ("player_id", "player_name", "position", "club")
+
+# Closed rounds never change, so their results are pinned here as Parquet files
+ROUND_CACHE_DIR = Path(__file__).parent / ".cache" / "rounds"
+
+# Query sets whose fetched projections are remembered (least recently used dropped)
+PROJECTION_CACHE_ENTRIES = 512
+
+# Loaders whose query ignores the selected round, left out of the round cache
+ROUND_INDEPENDENT_LOADERS = ("load_scouting_data:sct_last_season", "load_ss_edge_cases")
+
 TIME_PERIODS = {
     "This Season": "sct_this_season",
     "Last Match": "sct_last_1",
@@ -28,6 +65,29 @@ TIME_PERIODS = {
     "Last Season": "sct_last_season",
 }
 
+# Score column each analytics mart is ordered by (descending)
+ANALYTICS_ORDER_BY = {
+    "ss_main": "map_score",
+    "ss_map_breakdown": "map_points",
+    "ss_mpap_debug": "mpap_ratio",
+    "ss_home_away": "home_away_delta",
+    "ss_distribution": "pts_median",
+    "ss_edge_cases": "matches_this_season",
+    "mv_main": "par",
+    "mv_par_breakdown": "par_points",
+    "mv_baseline": "baseline_pts",
+    "mv_form_trend": "ewm_points",
+    "mv_regression": "regression_score",
+    "mv_value_profile": "par_points",
+    "mv_schedule_strength": "schedule_strength",
+}
+
+# Round-by-round marts read every round up to the selected one
+ROUND_BY_ROUND_ORDER_BY = {
+    "ss_round_by_round": "points_total DESC NULLS LAST",
+    "mv_round_by_round": "round DESC, points_total DESC NULLS LAST",
+}
+
 # Scout groupings by code
 SCOUTS_OFFENSIVE_CODES = ["G", "A", "FT", "FD", "FF", "FS", "PS"]
 SCOUTS_DEFENSIVE_CODES = ["DS", "SG", "DE", "DP"]
@@ -81,171 +141,693 @@ def get_client() -> bigquery.Client:
     return bigquery.Client(project=PROJECT_ID, credentials=credentials)
 
 
-@st.cache_data(ttl=600)
-def _query(sql: str) -> list[dict]:
-    """Execute query and return list of dicts."""
+def _table(name: str) -> str:
+    """Return the SQL reference to a dbt relation in the warehouse the app reads."""
+    if DUCKDB_PATH:
+        return name
+    return f"`{PROJECT_ID}.{DATASET_ID}.{name}`"
+
+
+def _run_duckdb_query(sql: str) -> pd.DataFrame:
+    """Execute query against the local DuckDB build.
+
+    A read-only connection per query, so dbt can rebuild the file between reads.
+    """
+    import duckdb  # noqa: PLC0415
+
+    with duckdb.connect(DUCKDB_PATH, read_only=True) as connection:
+        return connection.sql(sql).df()
+
+
+def _run_query(sql: str) -> pd.DataFrame:
+    """Execute query and return a columnar DataFrame (Arrow download, no row dicts)."""
+    if DUCKDB_PATH:
+        return _run_duckdb_query(sql)
+    client = get_client()
+    return client.query(sql).to_dataframe()
+
+
+def _run_queries(sqls: tuple[str, ...]) -> tuple[pd.DataFrame, ...]:
+    """Execute queries in a single BigQuery job and return one DataFrame each.
+
+    Several statements are sent as one multi-statement script, so they cost a
+    single job round trip; each SELECT's result is read back from its child job.
+    Against DuckDB the statements simply run in turn.
+    """
+    if len(sqls) == 1 or DUCKDB_PATH:
+        return tuple(_run_query(sql) for sql in sqls)
     client = get_client()
-    return [dict(row) for row in client.query(sql).result()]
+    script = client.query(";\n".join(sql.strip() for sql in sqls))
+    script.result()
+    children = sorted(
+        (
+            child
+            for child in client.list_jobs(parent_job=script)
+            if child.statement_type == "SELECT"
+        ),
+        key=lambda child: child.script_statistics.stack_frames[0].start_line,
+    )
+    return tuple(child.to_dataframe() for child in children)
+
+
+@st.cache_data(ttl=600)
+def _query(sql: str) -> pd.DataFrame:
+    """Execute query, caching the result for 10 minutes."""
+    return _run_query(sql)
+
+
+@st.cache_data(ttl=600)
+def _query_expiring(sqls: tuple[str, ...]) -> tuple[pd.DataFrame, ...]:
+    """Execute queries as one job, caching the results for 10 minutes."""
+    return _run_queries(sqls)
+
+
+def _round_cache_path(sql: str, build_id: str | None) -> Path:
+    """Return the Parquet file a closed-round query result is pinned to.
+
+    Named after the query and the build id of the mart it reads, so a rebuild
+    of the mart pins a new file instead of serving the old one.
+    """
+    digest = hashlib.sha256(sql.encode()).hexdigest()
+    return ROUND_CACHE_DIR / f"{digest}.{build_id or 'unbuilt'}.parquet"
+
+
+def _write_round_cache(
+    sqls: tuple[str, ...], build_ids: tuple[str | None, ...]
+) -> dict[str, pd.DataFrame]:
+    """Execute queries and (over)write their Parquet files in the round cache.
+
+    Files pinned for earlier builds of the same queries are removed.
+    """
+    fetched = dict(zip(sqls, _run_queries(sqls), strict=True)) if sqls else {}
+    for (sql, data), build_id in zip(fetched.items(), build_ids, strict=True):
+        ROUND_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _round_cache_path(sql, build_id)
+        tmp_path = path.with_suffix(".tmp")
+        data.to_parquet(tmp_path, index=False)
+        tmp_path.replace(path)
+        digest = path.name.split(".", 1)[0]
+        for stale in ROUND_CACHE_DIR.glob(f"{digest}.*.parquet"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    return fetched
+
+
+@st.cache_data(ttl=None, max_entries=256)
+def _query_closed_round(
+    sqls: tuple[str, ...], build_ids: tuple[str | None, ...]
+) -> tuple[pd.DataFrame, ...]:
+    """Execute queries for a closed round, pinned in memory and on disk as Parquet.
+
+    The disk copy survives app restarts, so switching back to a past round only
+    ever costs a local Parquet read. Statements already on disk for the same
+    ``build_ids`` (one per query, of the mart it reads) are not re-run.
+    """
+    paths = {
+        sql: _round_cache_path(sql, build_id)
+        for sql, build_id in zip(sqls, build_ids, strict=True)
+    }
+    missing = [
+        (sql, build_id)
+        for (sql, path), build_id in zip(paths.items(), build_ids, strict=True)
+        if not path.exists()
+    ]
+    fetched = _write_round_cache(
+        tuple(sql for sql, _ in missing), tuple(build_id for _, build_id in missing)
+    )
+    return tuple(
+        fetched[sql] if sql in fetched else pd.read_parquet(path)
+        for sql, path in paths.items()
+    )
+
+
+@st.cache_data(ttl=None, max_entries=256)
+def _query_build(
+    sqls: tuple[str, ...],
+    build_ids: tuple[str, ...],  # noqa: ARG001
+) -> tuple[pd.DataFrame, ...]:
+    """Execute queries as one job, caching the results until a mart's build id changes.
+
+    ``build_ids`` are only part of the cache key: a new dbt build of any of the
+    marts yields a new id, which misses the cache exactly once.
+    """
+    return _run_queries(sqls)
+
+
+@st.cache_data(ttl=60)
+def _build_metadata_modified() -> datetime.datetime | None:
+    """Return when build_metadata was last written (metadata call, no query cost).
+
+    None when the table does not exist (no mart built yet).
+    """
+    if DUCKDB_PATH:
+        path = Path(DUCKDB_PATH)
+        if not path.exists():
+            return None
+        tables = _run_duckdb_query("""
+            SELECT table_name FROM information_schema.tables
+            WHERE table_name = 'build_metadata'
+        """)
+        if tables.empty:
+            return None
+        return datetime.datetime.fromtimestamp(path.stat().st_mtime, tz=datetime.UTC)
+    try:
+        table = get_client().get_table(f"{PROJECT_ID}.{DATASET_ID}.build_metadata")
+    except NotFound:
+        return None
+    return table.modified
+
+
+@st.cache_data(ttl=None, max_entries=16)
+def _load_build_marker(modified: datetime.datetime | None) -> dict[str, str]:
+    """Load the latest build id per mart, re-read only when the table changes."""
+    if modified is None:
+        return {}
+    marker = _run_query(f"""
+        SELECT model_name, invocation_id
+        FROM {_table("build_metadata")}
+        QUALIFY ROW_NUMBER() OVER (
+            PARTITION BY model_name ORDER BY finished_at DESC
+        ) = 1
+    """)
+    return dict(zip(marker["model_name"], marker["invocation_id"], strict=True))
+
+
+def load_build_marker() -> dict[str, str]:
+    """Return the dbt build id that last rebuilt each mart (written on run end)."""
+    return _load_build_marker(_build_metadata_modified())
+
+
+def _is_closed_round(round_id: int | None) -> bool:
+    """Whether a round is closed, i.e. a later round is already available."""
+    if round_id is None:
+        return False
+    rounds = load_available_rounds()
+    return bool(rounds) and int(round_id) < rounds[-1]
+
+
+@st.cache_data(ttl=600)
+def _load_mart_columns(mart: str, build_id: str | None) -> tuple[str, ...]:  # noqa: ARG001
+    """Return a mart's column names (metadata call, re-read when dbt rebuilds it)."""
+    if DUCKDB_PATH:
+        return tuple(_run_query(f"SELECT * FROM {_table(mart)} LIMIT 0").columns)
+    table = get_client().get_table(f"{PROJECT_ID}.{DATASET_ID}.{mart}")
+    return tuple(field.name for field in table.schema)
+
+
+def _resolve_columns(
+    mart: str, columns: Sequence[str] | None
+) -> tuple[str, ...] | None:
+    """Resolve requested columns against the mart schema (None selects all).
+
+    Entries may be fnmatch patterns such as ``scout_*``; names the mart does not
+    carry are dropped, and FILTER_COLUMNS are always kept.
+    """
+    if columns is None:
+        return None
+    available = _load_mart_columns(mart, load_build_marker().get(mart))
+    resolved = tuple(
+        dict.fromkeys(
+            name
+            for pattern in (*FILTER_COLUMNS, *columns)
+            for name in available
+            if fnmatchcase(name, pattern)
+        )
+    )
+    return resolved or None
+
+
+def _covers(
+    projection: tuple[str, ...] | None, columns: tuple[str, ...] | None
+) -> bool:
+    """Whether a cached projection holds every column of another one."""
+    if projection is None:
+        return True
+    return columns is not None and set(columns) <= set(projection)
+
+
+type Projection = tuple[tuple[str, ...] | None, ...]
+
+
+class ProjectionCache:
+    """Projections fetched so far per query set, for its current cache tier.
+
+    A set fetched under a new tier (e.g. after a dbt build) starts over, so old
+    tiers are never kept. Bounded to the most recently used sets, and shared by
+    the fetch_concurrently and prefetch threads, hence the lock.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Start empty, holding at most ``max_entries`` query sets."""
+        self.max_entries = max_entries
+        # Query set -> (tier, projections fetched under it)
+        self._entries: OrderedDict[tuple[str, ...], tuple[tuple, list]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _projections(self, sqls: tuple[str, ...], tier: tuple) -> list[Projection]:
+        """Return the projections of a query set under ``tier`` (lock held)."""
+        entry = self._entries.get(sqls)
+        if entry is None or entry[0] != tier:
+            entry = self._entries[sqls] = (tier, [])
+        self._entries.move_to_end(sqls)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry[1]
+
+    def covering(
+        self, sqls: tuple[str, ...], tier: tuple, wanted: Projection
+    ) -> Projection:
+        """Return a fetched projection covering ``wanted`` (else ``wanted`` itself)."""
+        with self._lock:
+            return next(
+                (
+                    projection
+                    for projection in self._projections(sqls, tier)
+                    if all(map(_covers, projection, wanted))
+                ),
+                wanted,
+            )
+
+    def add(self, sqls: tuple[str, ...], tier: tuple, fetched: Projection) -> None:
+        """Record a projection as fetched."""
+        with self._lock:
+            projections = self._projections(sqls, tier)
+            if fetched not in projections:
+                projections.append(fetched)
+
+
+@st.cache_resource
+def _get_projections() -> ProjectionCache:
+    """Return the process-wide cache of fetched projections."""
+    return ProjectionCache(PROJECTION_CACHE_ENTRIES)
+
+
+def _query_marts(
+    queries: dict[str, str],
+    round_id: int | None = None,
+    columns: dict[str, Sequence[str] | None] | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Execute queries against app-facing marts through the right cache tier.
+
+    ``queries`` maps each mart to its SQL, with the SELECT list left as a
+    ``{columns}`` slot filled from ``columns`` (all columns when a mart is not
+    listed). All queries run as a single job and are cached as a unit, until dbt
+    rebuilds one of the marts (see load_build_marker): closed rounds are pinned
+    on disk too, and without a build marker the cache falls back to a 10-minute
+    TTL.
+
+    A narrower projection of queries that were already fetched with more
+    columns is sliced from that cached result instead of scanning the marts again.
+    """
+    marker = load_build_marker()
+    build_ids = tuple(marker.get(mart) for mart in queries)
+    closed = _is_closed_round(round_id)
+    if closed:
+        tier = ("closed", *build_ids)
+    else:
+        tier = ("expiring",) if None in build_ids else build_ids
+
+    wanted = tuple(
+        _resolve_columns(mart, (columns or {}).get(mart)) for mart in queries
+    )
+    fetched = _get_projections().covering(tuple(queries.values()), tier, wanted)
+    if closed:
+        # Rounds warmed by refresh-round are on disk with every column
+        fetched = tuple(
+            None
+            if _round_cache_path(sql.format(columns="*"), build_id).exists()
+            else projection
+            for sql, projection, build_id in zip(
+                queries.values(), fetched, build_ids, strict=True
+            )
+        )
+    sqls = tuple(
+        sql.format(columns=", ".join(projection) if projection else "*")
+        for sql, projection in zip(queries.values(), fetched, strict=True)
+    )
+
+    if closed:
+        results = _query_closed_round(sqls, build_ids)
+    elif tier == ("expiring",):
+        results = _query_expiring(sqls)
+    else:
+        results = _query_build(sqls, tier)
+
+    _get_projections().add(tuple(queries.values()), tier, fetched)
+    frames = {}
+    for mart, sql, data, projection, fetched_projection in zip(
+        queries, sqls, results, wanted, fetched, strict=True
+    ):
+        frame = data if projection == fetched_projection else data[list(projection)]
+        # Lets filter_rows reuse the player index built for this exact result
+        frame.attrs["query_key"] = (sql, tier)
+        frames[mart] = frame
+    return frames
+
+
+def _query_mart(
+    sql: str,
+    mart: str,
+    round_id: int | None = None,
+    columns: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """Execute a query against a single app-facing mart (see _query_marts)."""
+    return _query_marts({mart: sql}, round_id, {mart: columns})[mart]
+
+
+def fetch_concurrently[T](loaders: dict[str, Callable[[], T]]) -> dict[str, T]:
+    """Run loaders in a thread pool and gather their results by key.
+
+    Loaders are the cached load_* functions, so cache hits return straight from
+    memory and only misses submit a BigQuery job, all of them in flight at once
+    instead of back to back.
+    """
+    # Resolve the lookups every loader depends on first, so workers don't race
+    # each other to fill the same cache entries.
+    load_available_rounds()
+    load_build_marker()
+
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(len(loaders), MAX_CONCURRENT_QUERIES)),
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx),
+    ) as executor:
+        futures = {key: executor.submit(loader) for key, loader in loaders.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+
+@st.cache_resource
+def _get_prefetch_executor() -> ThreadPoolExecutor:
+    """Return the process-wide pool that runs background prefetches."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="prefetch")
+
+
+def prefetch(key: str, loader: Callable[[], object]) -> None:
+    """Warm a loader's cache in the background, once per session and key.
+
+    Call it after the visible content has been rendered, so the first paint
+    never waits on data for views the user has not opened yet.
+    """
+    prefetched: dict[str, Future] = st.session_state.setdefault("_prefetched", {})
+    if key in prefetched:
+        return
+    ctx = get_script_run_ctx()
+
+    def run() -> None:
+        add_script_run_ctx(threading.current_thread(), ctx)
+        loader()
+
+    prefetched[key] = _get_prefetch_executor().submit(run)
+
+
+def is_prefetched(key: str) -> bool:
+    """Whether a background prefetch for ``key`` finished successfully."""
+    future = st.session_state.get("_prefetched", {}).get(key)
+    return future is not None and future.done() and future.exception() is None
 
 
 def load_available_rounds() -> list[int]:
     """Load available rounds."""
-    return [
-        int(r["as_of_round_id"])
-        for r in _query(f"""
-            SELECT DISTINCT as_of_round_id
-            FROM `{PROJECT_ID}.{DATASET_ID}.sct_this_season`
-            ORDER BY as_of_round_id ASC
-        """)
-    ]
+    rounds = _query_mart(
+        f"""
+        SELECT DISTINCT as_of_round_id
+        FROM {_table("sct_this_season")}
+        ORDER BY as_of_round_id ASC
+        """,
+        "sct_this_season",
+    )
+    return rounds["as_of_round_id"].astype(int).tolist()
 
 
 def load_positions() -> list[dict]:
-    """Load positions."""
+    """Load positions (small lookup, returned as records for selectbox options)."""
     return _query(f"""
         SELECT DISTINCT
             id,
             abbreviation as position
-        FROM `{PROJECT_ID}.{DATASET_ID}.stg_positions`
-        WHERE abbreviation <> "HC"
+        FROM {_table("stg_positions")}
+        WHERE abbreviation <> 'HC'
         ORDER BY id
-    """)
+    """).to_dict("records")
 
 
 def load_clubs() -> list[dict]:
-    """Load clubs."""
+    """Load clubs (small lookup, returned as records for selectbox options)."""
     return _query(f"""
         SELECT DISTINCT
             abbreviation,
             label as club
-        FROM `{PROJECT_ID}.{DATASET_ID}.stg_clubs`
+        FROM {_table("stg_clubs")}
         ORDER by label
-    """)
+    """).to_dict("records")
 
 
-def load_scouting_data(view_name: str, round_id: int | None = None) -> list[dict]:
-    """Load scouting data from a view."""
-    if view_name == "sct_last_season" or round_id is None:
-        return _query(f"""
-            SELECT *
-            FROM `{PROJECT_ID}.{DATASET_ID}.{view_name}`
-            ORDER BY adp_gen_avg ASC NULLS LAST
-        """)
-    return _query(f"""
-        SELECT *
-        FROM `{PROJECT_ID}.{DATASET_ID}.{view_name}`
-        WHERE as_of_round_id = {round_id}
+def _scouting_round(view_name: str, round_id: int | None) -> int | None:
+    """Return the round a scouting mart is scoped to (last season has none)."""
+    return None if view_name == "sct_last_season" else round_id
+
+
+def _scouting_sql(view_name: str, round_id: int | None) -> str:
+    """Build the query for a scouting mart, optionally scoped to one round."""
+    where_clause = ""
+    if round_id is not None:
+        where_clause = f"WHERE as_of_round_id = {round_id}"
+
+    return f"""
+        SELECT {{columns}}
+        FROM {_table(view_name)}
+        {where_clause}
         ORDER BY adp_gen_avg ASC NULLS LAST
-    """)
+    """
 
 
-def load_analytics(view: str, as_of_round_id: str | None, order_by: str) -> list[dict]:
-    """Load analytics."""
+def load_scouting_data(
+    view_name: str,
+    round_id: int | None = None,
+    columns: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """Load scouting data from a view, optionally projected to ``columns``."""
+    round_id = _scouting_round(view_name, round_id)
+    return _query_mart(_scouting_sql(view_name, round_id), view_name, round_id, columns)
+
+
+def _analytics_sql(view: str, as_of_round_id: int | None) -> str:
+    """Build the query for an analytics mart, optionally scoped to one round."""
     where_clause = ""
     if as_of_round_id is not None:
         where_clause = f"WHERE as_of_round_id = {as_of_round_id}"
 
-    return _query(f"""
-        SELECT *
-        FROM `{PROJECT_ID}.{DATASET_ID}.{view}`
+    return f"""
+        SELECT {{columns}}
+        FROM {_table(view)}
         {where_clause}
-        ORDER BY {order_by} DESC NULLS LAST
-    """)
+        ORDER BY {ANALYTICS_ORDER_BY[view]} DESC NULLS LAST
+    """
+
+
+def _round_by_round_sql(view: str, round_id: int) -> str:
+    """Build the query for a round-by-round mart up to and including a round."""
+    return f"""
+        SELECT {{columns}}
+        FROM {_table(view)}
+        WHERE round <= {int(round_id)}
+        ORDER BY {ROUND_BY_ROUND_ORDER_BY[view]}
+    """
+
+
+def load_analytics(
+    view: str,
+    as_of_round_id: int | None,
+    columns: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """Load analytics, optionally projected to ``columns``."""
+    return _query_mart(
+        _analytics_sql(view, as_of_round_id), view, as_of_round_id, columns
+    )
+
 
+def _load_round_by_round(
+    view: str, round_id: int, columns: Sequence[str] | None = None
+) -> pd.DataFrame:
+    """Load a round-by-round mart up to and including a round."""
+    return _query_mart(_round_by_round_sql(view, round_id), view, round_id, columns)
 
-def load_ss_main(round_id: int) -> list[dict]:
+
+def load_ss_main(round_id: int, columns: Sequence[str] | None = None) -> pd.DataFrame:
     """Load Start or Sit main tab data."""
-    return load_analytics("ss_main", round_id, "map_score")
+    return load_analytics("ss_main", round_id, columns)
 
 
-def load_ss_map_breakdown(round_id: int) -> list[dict]:
+def load_ss_map_breakdown(
+    round_id: int, columns: Sequence[str] | None = None
+) -> pd.DataFrame:
     """Load MAP breakdown data."""
-    return load_analytics("ss_map_breakdown", round_id, "map_points")
+    return load_analytics("ss_map_breakdown", round_id, columns)
 
 
-def load_ss_mpap_debug(round_id: int) -> list[dict]:
+def load_ss_mpap_debug(
+    round_id: int, columns: Sequence[str] | None = None
+) -> pd.DataFrame:
     """Load MPAP debug data."""
-    return load_analytics("ss_mpap_debug", round_id, "mpap_ratio")
+    return load_analytics("ss_mpap_debug", round_id, columns)
 
 
-def load_ss_home_away(round_id: int) -> list[dict]:
+def load_ss_home_away(
+    round_id: int, columns: Sequence[str] | None = None
+) -> pd.DataFrame:
     """Load player home/away splits."""
-    return load_analytics("ss_home_away", round_id, "home_away_delta")
+    return load_analytics("ss_home_away", round_id, columns)
 
 
-def load_ss_distribution(round_id: int) -> list[dict]:
+def load_ss_distribution(
+    round_id: int, columns: Sequence[str] | None = None
+) -> pd.DataFrame:
     """Load distribution and volatility data."""
-    return load_analytics("ss_distribution", round_id, "pts_median")
+    return load_analytics("ss_distribution", round_id, columns)
 
 
-def load_ss_round_by_round(round_id: int) -> list[dict]:
+def load_ss_round_by_round(
+    round_id: int, columns: Sequence[str] | None = None
+) -> pd.DataFrame:
     """Load round-by-round raw data."""
-    return _query(f"""
-        SELECT *
-        FROM `{PROJECT_ID}.{DATASET_ID}.ss_round_by_round`
-        WHERE round <= {int(round_id)}
-        ORDER BY points_total DESC NULLS LAST
-    """)
+    return _load_round_by_round("ss_round_by_round", round_id, columns)
 
 
-def load_ss_edge_cases() -> list[dict]:
+def load_ss_edge_cases(columns: Sequence[str] | None = None) -> pd.DataFrame:
     """Load edge cases and missing data."""
-    return load_analytics("ss_edge_cases", None, "matches_this_season")
+    return load_analytics("ss_edge_cases", None, columns)
+
+
+def load_ss_bundle(
+    round_id: int,
+    columns: dict[str, Sequence[str] | None] | None = None,
+    marts: Collection[str] | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Load the Start or Sit marts for a round in a single BigQuery job.
+
+    Returns one DataFrame per mart (every mart, or those in ``marts``), projected
+    per mart by ``columns``. ss_edge_cases is not round-scoped, so for a closed
+    round it is cached on its own instead of being pinned with the round.
+    """
+    queries = {
+        view: _analytics_sql(view, round_id)
+        for view in (
+            "ss_main",
+            "ss_map_breakdown",
+            "ss_mpap_debug",
+            "ss_home_away",
+            "ss_distribution",
+        )
+    }
+    queries["ss_round_by_round"] = _round_by_round_sql("ss_round_by_round", round_id)
+    edge_cases = {"ss_edge_cases": _analytics_sql("ss_edge_cases", None)}
+    if marts is not None:
+        queries = {view: sql for view, sql in queries.items() if view in marts}
+        edge_cases = {view: sql for view, sql in edge_cases.items() if view in marts}
+    if not queries:
+        return _query_marts(edge_cases, columns=columns)
+    if edge_cases and _is_closed_round(round_id):
+        return {
+            **_query_marts(queries, round_id, columns),
+            **_query_marts(edge_cases, columns=columns),
+        }
+    return _query_marts({**queries, **edge_cases}, round_id, columns)
 
 
-def load_mv_main(round_id: int) -> list[dict]:
+def load_mv_main(round_id: int, columns: Sequence[str] | None = None) -> pd.DataFrame:
     """Load Market Valuation main tab data."""
-    return load_analytics("mv_main", round_id, "par")
+    return load_analytics("mv_main", round_id, columns)
 
 
-def load_mv_par_breakdown(round_id: int) -> list[dict]:
+def load_mv_par_breakdown(
+    round_id: int, columns: Sequence[str] | None = None
+) -> pd.DataFrame:
     """Load PAR breakdown data."""
-    return load_analytics("mv_par_breakdown", round_id, "par_points")
+    return load_analytics("mv_par_breakdown", round_id, columns)
 
 
-def load_mv_baseline(round_id: int) -> list[dict]:
+def load_mv_baseline(
+    round_id: int, columns: Sequence[str] | None = None
+) -> pd.DataFrame:
     """Load baseline (stabilized mean, shrinkage, and home/away splits) data."""
-    return load_analytics("mv_baseline", round_id, "baseline_pts")
+    return load_analytics("mv_baseline", round_id, columns)
 
 
-def load_mv_form_trend(round_id: int) -> list[dict]:
+def load_mv_form_trend(
+    round_id: int, columns: Sequence[str] | None = None
+) -> pd.DataFrame:
     """Load form and trend data."""
-    return load_analytics("mv_form_trend", round_id, "ewm_points")
+    return load_analytics("mv_form_trend", round_id, columns)
 
 
-def load_mv_regression(round_id: int) -> list[dict]:
+def load_mv_regression(
+    round_id: int, columns: Sequence[str] | None = None
+) -> pd.DataFrame:
     """Load regression candidate data."""
-    return load_analytics("mv_regression", round_id, "regression_score")
+    return load_analytics("mv_regression", round_id, columns)
 
 
-def load_mv_value_profile(round_id: int) -> list[dict]:
+def load_mv_value_profile(
+    round_id: int, columns: Sequence[str] | None = None
+) -> pd.DataFrame:
     """Load value profile data."""
-    return load_analytics("mv_value_profile", round_id, "par_points")
+    return load_analytics("mv_value_profile", round_id, columns)
 
 
-def load_mv_schedule_strength(round_id: int) -> list[dict]:
+def load_mv_schedule_strength(
+    round_id: int, columns: Sequence[str] | None = None
+) -> pd.DataFrame:
     """Load schedule strength data."""
-    return load_analytics("mv_schedule_strength", round_id, "schedule_strength")
+    return load_analytics("mv_schedule_strength", round_id, columns)
 
 
-def load_mv_round_by_round(round_id: int) -> list[dict]:
+def load_mv_round_by_round(
+    round_id: int, columns: Sequence[str] | None = None
+) -> pd.DataFrame:
     """Load MV round-by-round raw data."""
-    return _query(f"""
-        SELECT *
-        FROM `{PROJECT_ID}.{DATASET_ID}.mv_round_by_round`
-        WHERE round <= {round_id}
-        ORDER BY round DESC, points_total DESC NULLS LAST
-    """)
+    return _load_round_by_round("mv_round_by_round", round_id, columns)
+
+
+def load_mv_bundle(
+    round_id: int, columns: dict[str, Sequence[str] | None] | None = None
+) -> dict[str, pd.DataFrame]:
+    """Load every Market Valuation mart for a round with concurrent BigQuery jobs.
+
+    Returns one DataFrame per mart, projected per mart by ``columns``.
+    """
+    columns = columns or {}
+    loaders = {
+        "mv_main": load_mv_main,
+        "mv_par_breakdown": load_mv_par_breakdown,
+        "mv_baseline": load_mv_baseline,
+        "mv_form_trend": load_mv_form_trend,
+        "mv_regression": load_mv_regression,
+        "mv_value_profile": load_mv_value_profile,
+        "mv_schedule_strength": load_mv_schedule_strength,
+        "mv_round_by_round": load_mv_round_by_round,
+    }
+    return fetch_concurrently(
+        {
+            mart: partial(loader, round_id, columns.get(mart))
+            for mart, loader in loaders.items()
+        }
+    )
 
 
 def load_scout_points() -> dict[str, tuple[str, float]]:
     """Load scout points."""
+    scout_points = _query(f"""
+        SELECT code, description_en, points
+        FROM {_table("raw_scout_points")}
+    """)
     return {
-        row["code"]: (row["description_en"], float(row["points"]))
-        for row in _query(f"""
-            SELECT code, description_en, points
-            FROM `{PROJECT_ID}.{DATASET_ID}.raw_scout_points`
-        """)
+        code: (description, float(points))
+        for code, description, points in zip(
+            scout_points["code"],
+            scout_points["description_en"],
+            scout_points["points"],
+            strict=True,
+        )
     }
 
 
@@ -312,36 +894,242 @@ def render_sidebar_filters(*, render_rounds: bool = True) -> None:
         )
 
 
-def filter_data(data: list[dict]) -> list[dict]:
-    """Apply filters to data."""
+def _column(data: pd.DataFrame, name: str) -> pd.Series:
+    """Return a column, or an all-null column when the table does not carry it."""
+    if name in data.columns:
+        return data[name]
+    return pd.Series(None, index=data.index, dtype=object)
+
+
+class _Postings:
+    """Sorted row positions per distinct value of a column."""
+
+    def __init__(self, values: pd.Series) -> None:
+        codes, uniques = pd.factorize(values)
+        self.order = np.argsort(codes, kind="stable")
+        self.bounds = np.searchsorted(codes[self.order], np.arange(len(uniques) + 1))
+        self.uniques = uniques
+        self.codes = {value: code for code, value in enumerate(uniques)}
+
+    def rows(self, *values: object) -> np.ndarray:
+        """Return the sorted row positions holding any of ``values``."""
+        chunks = [
+            self.order[self.bounds[code] : self.bounds[code + 1]]
+            for code in (self.codes.get(value) for value in values)
+            if code is not None
+        ]
+        if not chunks:
+            return np.empty(0, dtype=np.intp)
+        return chunks[0] if len(chunks) == 1 else np.sort(np.concatenate(chunks))
+
+
+def fold_text(text: str) -> str:
+    """Strip accents and case for matching, e.g. "Léo" -> "leo"."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+
+def _trigrams(text: str) -> set[str]:
+    """Return the trigrams of text padded at the edges (so prefixes weigh more)."""
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """Accent-folded trigram and word-prefix index over distinct player names.
+
+    Lookups only touch the postings of the query's trigrams and words, so they
+    stay well under a millisecond for a full player pool.
+    """
+
+    def __init__(self, names: tuple[str, ...]) -> None:
+        """Index the given distinct names."""
+        self.names = names
+        self.folded = [fold_text(name) for name in names]
+        self.grams: dict[str, set[int]] = defaultdict(set)
+        words = []
+        for i, folded in enumerate(self.folded):
+            for gram in _trigrams(folded):
+                self.grams[gram].add(i)
+            words.extend((word, i) for word in folded.split())
+        self.words = sorted(words)
+
+    def _prefixed(self, query: str) -> set[int]:
+        """Return the names with a word starting with ``query``."""
+        found = set()
+        i = bisect_left(self.words, (query,))
+        while i < len(self.words) and self.words[i][0].startswith(query):
+            found.add(self.words[i][1])
+            i += 1
+        return found
+
+    def _contained(self, query: str) -> set[int]:
+        """Return the names containing ``query``, checked on trigram candidates."""
+        inner = [query[i : i + 3] for i in range(len(query) - 2)]
+        if inner:
+            candidates = set.intersection(*(self.grams.get(g, set()) for g in inner))
+        else:
+            candidates = range(len(self.names))
+        return {i for i in candidates if query in self.folded[i]}
+
+    def search(self, text: str, limit: int | None = None) -> list[str]:
+        """Return names matching ``text``, best first.
+
+        Names starting with the query rank first, then names with a word starting
+        with it, then names containing it. Fuzzy matches (shared trigrams, e.g.
+        typos) follow, ranked by similarity.
+        """
+        query = fold_text(text).strip()
+        if not query:
+            return []
+        prefixed = self._prefixed(query)
+        contained = self._contained(query) | prefixed
+        query_grams = _trigrams(query)
+        shared = Counter(
+            i
+            for gram in query_grams
+            for i in self.grams.get(gram, ())
+            if i not in contained
+        )
+        fuzzy = {
+            i: count / len(query_grams)
+            for i, count in shared.items()
+            if count / len(query_grams) >= NAME_MATCH_MIN_SIMILARITY
+        }
+        ranked = sorted(
+            contained,
+            key=lambda i: (
+                not self.folded[i].startswith(query),
+                i not in prefixed,
+                self.folded[i],
+            ),
+        )
+        ranked += sorted(fuzzy, key=lambda i: (-fuzzy[i], self.folded[i]))
+        return [self.names[i] for i in ranked[:limit]]
+
+    def filter(self, text: str) -> list[str]:
+        """Return the names containing ``text``, or its fuzzy matches if none do."""
+        query = fold_text(text).strip()
+        if not query:
+            return []
+        contained = self._contained(query)
+        if contained:
+            return [self.names[i] for i in contained]
+        return self.search(text)
+
+
+@st.cache_resource(max_entries=64)
+def _load_name_index(names: tuple[str, ...]) -> NameIndex:
+    """Build the name index once per distinct set of names."""
+    return NameIndex(names)
+
+
+def get_name_index(names: Iterable[object]) -> NameIndex:
+    """Return the shared name index for a set of player names.
+
+    Pages showing the same round reuse one index, whatever mart they read.
+    """
+    return _load_name_index(tuple(sorted({n for n in names if isinstance(n, str)})))
+
+
+class PlayerIndex:
+    """Position, club, player and name postings over one loaded mart.
+
+    Filters are answered by looking up postings and intersecting them, so their
+    cost follows the number of matching rows, not the size of the table. Name
+    search goes through the shared NameIndex over the distinct names only.
+    """
+
+    def __init__(self, data: pd.DataFrame) -> None:
+        """Build the postings for a loaded mart."""
+        self.size = len(data)
+        self.player_ids = pd.Index(_column(data, "player_id"))
+        self.players = _Postings(_column(data, "player_id"))
+        self.positions = _Postings(_column(data, "position"))
+        self.clubs = _Postings(_column(data, "club"))
+        self.names = _Postings(_column(data, "player_name"))
+        self.name_index = get_name_index(self.names.uniques)
+
+    def matches(self, data: pd.DataFrame) -> bool:
+        """Whether the index was built over these exact rows."""
+        return len(data) == self.size and self.player_ids.equals(
+            pd.Index(_column(data, "player_id"))
+        )
+
+    def squad_rows(self, player_ids: set[int]) -> np.ndarray:
+        """Return the rows of the given players."""
+        return self.players.rows(*player_ids)
+
+    def name_rows(self, text: str) -> np.ndarray:
+        """Return the rows whose player name matches ``text`` (see NameIndex)."""
+        return self.names.rows(*self.name_index.filter(text))
+
+
+@st.cache_resource(max_entries=64)
+def _load_player_index(query_key: tuple, _data: pd.DataFrame) -> PlayerIndex:  # noqa: ARG001
+    """Build the player index once per query result (keyed by ``query_key``)."""
+    return PlayerIndex(_data)
+
+
+def get_player_index(data: pd.DataFrame) -> PlayerIndex:
+    """Return the player index for a loaded mart, reusing it across reruns."""
+    query_key = data.attrs.get("query_key")
+    if query_key is not None:
+        index = _load_player_index(query_key, data)
+        if index.matches(data):
+            return index
+    return PlayerIndex(data)
+
+
+def filter_rows(data: pd.DataFrame) -> np.ndarray:
+    """Return the positions of the rows that pass the sidebar filters.
+
+    Each active filter yields a sorted posting list from the player index and
+    the lists are intersected, so no filter scans the full table.
+    """
     filter_my_squad = st.session_state.get("filter_my_squad", False)
     filter_name = st.session_state.get("filter_name")
     filter_position = st.session_state.get("filter_position")
     filter_club = st.session_state.get("filter_club")
 
-    filtered = data
+    index = get_player_index(data)
+    postings = []
 
     if filter_my_squad:
-        filtered = [row for row in filtered if row.get("player_id") in load_squad()]
+        postings.append(index.squad_rows(load_squad()))
     if filter_name:
-        filtered = [
-            row
-            for row in filtered
-            if filter_name.lower() in row.get("player_name", "").lower()
-        ]
+        postings.append(index.name_rows(filter_name))
     if filter_club and filter_club["club"] != "All":
-        filtered = [
-            row
-            for row in filtered
-            if row.get("club") == filter_club.get("abbreviation")
-        ]
+        postings.append(index.clubs.rows(filter_club.get("abbreviation")))
     if filter_position and filter_position["position"] != "All":
-        filtered = [
-            row
-            for row in filtered
-            if row.get("position") == filter_position["position"]
-        ]
-    return filtered
+        postings.append(index.positions.rows(filter_position["position"]))
+
+    if not postings:
+        return np.arange(index.size)
+    rows = postings[0]
+    for other in postings[1:]:
+        rows = np.intersect1d(rows, other, assume_unique=True)
+    return rows
+
+
+def filter_data(data: pd.DataFrame) -> pd.DataFrame:
+    """Apply the sidebar filters to data (see filter_rows)."""
+    rows = data.iloc[filter_rows(data)]
+    rows.attrs.pop("query_key", None)
+    return rows
+
+
+def select_columns(
+    data: pd.DataFrame, columns: list[str], sort_by: str | None = None
+) -> pd.DataFrame:
+    """Project data onto display columns, optionally sorted descending by a column.
+
+    Missing columns come back as nulls (like ``row.get`` did), so every tab can
+    hand its ``col_config`` keys straight to ``st.dataframe``.
+    """
+    if sort_by is not None and sort_by in data.columns:
+        data = data.sort_values(sort_by, ascending=False, na_position="last")
+    return data.reindex(columns=columns)
 
 
 def color_zscore_dvs(val: float | None) -> str:
@@ -394,114 +1182,161 @@ def get_firestore_client() -> "FirestoreClient":
     )
 
 
+def get_roster_store() -> RosterStore:
+    """Return this session's roster store for the signed-in user."""
+    email = get_user_email()
+    store = st.session_state.get("_roster_store")
+    if store is None or store.user != email:
+        store = RosterStore(FirestoreRosterBackend(get_firestore_client()), email)
+        st.session_state["_roster_store"] = store
+    return store
+
+
 def load_squad() -> set[int]:
     """Load persisted squad player IDs for a user."""
-    if "_cached_squad" in st.session_state:
-        return st.session_state["_cached_squad"]
-    email = get_user_email()
-    doc = get_firestore_client().collection("user_squads").document(email).get()
-    squad = set(doc.to_dict().get("player_ids", [])) if doc.exists else set()
-    st.session_state["_cached_squad"] = squad
-    return squad
+    return get_roster_store().load("user_squads")
 
 
 def save_squad(player_ids: set[int]) -> None:
     """Persist squad for a user (replaces existing document)."""
-    email = get_user_email()
-    get_firestore_client().collection("user_squads").document(email).set(
-        {
-            "player_ids": list(player_ids),
-            "updated_at": datetime.datetime.now(tz=datetime.UTC),
-        }
-    )
-    st.session_state["_cached_squad"] = set(player_ids)
+    get_roster_store().save("user_squads", player_ids)
 
 
 def load_team() -> set[int]:
     """Load persisted team player IDs for a user."""
-    email = get_user_email()
-    doc = get_firestore_client().collection("user_teams").document(email).get()
-    if doc.exists:
-        return set(doc.to_dict().get("player_ids", []))
-    return set()
+    return get_roster_store().load("user_teams")
 
 
 def save_team(player_ids: set[int]) -> None:
     """Persist team for a user (replaces existing document)."""
-    email = get_user_email()
-    get_firestore_client().collection("user_teams").document(email).set(
-        {
-            "player_ids": list(player_ids),
-            "updated_at": datetime.datetime.now(tz=datetime.UTC),
-        }
-    )
+    get_roster_store().save("user_teams", player_ids)
 
 
 def load_opponent_squad() -> set[int]:
     """Load persisted opponent squad player IDs for a user."""
-    email = get_user_email()
-    doc = get_firestore_client().collection("opponent_squads").document(email).get()
-    if doc.exists:
-        return set(doc.to_dict().get("player_ids", []))
-    return set()
+    return get_roster_store().load("opponent_squads")
 
 
 def save_opponent_squad(player_ids: set[int]) -> None:
     """Persist opponent squad for a user (replaces existing document)."""
-    email = get_user_email()
-    get_firestore_client().collection("opponent_squads").document(email).set(
-        {
-            "player_ids": list(player_ids),
-            "updated_at": datetime.datetime.now(tz=datetime.UTC),
-        }
-    )
+    get_roster_store().save("opponent_squads", player_ids)
 
 
 def load_opponent_team() -> set[int]:
     """Load persisted opponent team player IDs for a user."""
-    email = get_user_email()
-    doc = get_firestore_client().collection("opponent_teams").document(email).get()
-    if doc.exists:
-        return set(doc.to_dict().get("player_ids", []))
-    return set()
+    return get_roster_store().load("opponent_teams")
 
 
 def save_opponent_team(player_ids: set[int]) -> None:
     """Persist opponent team for a user (replaces existing document)."""
-    email = get_user_email()
-    get_firestore_client().collection("opponent_teams").document(email).set(
-        {
-            "player_ids": list(player_ids),
-            "updated_at": datetime.datetime.now(tz=datetime.UTC),
-        }
-    )
+    get_roster_store().save("opponent_teams", player_ids)
 
 
-def load_players() -> list[dict]:
-    """Load all players from the latest round (for squad selection)."""
-    return _query(f"""
+def _latest_round() -> int | None:
+    """Return the latest built round, or None before any build."""
+    rounds = load_available_rounds()
+    return rounds[-1] if rounds else None
+
+
+def _players_sql(round_id: int | None) -> str:
+    """Build the query for the players listed in a round.
+
+    The round is a literal (not a MAX subquery) so BigQuery prunes to its partition.
+    """
+    return f"""
         SELECT DISTINCT
             player_id,
             player_name,
             club,
             club_logo_url,
             position
-        FROM `{PROJECT_ID}.{DATASET_ID}.sct_this_season`
-        WHERE as_of_round_id = (
-            SELECT MAX(as_of_round_id)
-            FROM `{PROJECT_ID}.{DATASET_ID}.sct_this_season`
-        )
+        FROM {_table("sct_this_season")}
+        WHERE as_of_round_id = {round_id if round_id is not None else "NULL"}
         ORDER BY position, player_name
-    """)
+    """
+
+
+def _enriched_players_sql(round_id: int | None) -> str:
+    """Build the query for the enriched players of a round (see _players_sql)."""
+    return f"""
+        SELECT {{columns}}
+        FROM {_table("sat_players")}
+        WHERE as_of_round_id = {round_id if round_id is not None else "NULL"}
+        ORDER BY position, player_name
+    """
+
+
+def load_players() -> pd.DataFrame:
+    """Load all players from the latest round (for squad selection)."""
+    return _query_mart(_players_sql(_latest_round()), "sct_this_season")
 
 
-def load_enriched_players() -> list[dict]:
+def load_enriched_players(columns: Sequence[str] | None = None) -> pd.DataFrame:
     """Load all players enriched with MAP, PoE, opponent, PAR and regression data."""
-    return _query(f"""
-        SELECT *
-        FROM `{PROJECT_ID}.{DATASET_ID}.sat_players`
-        WHERE as_of_round_id = (
-            SELECT MAX(as_of_round_id) FROM `{PROJECT_ID}.{DATASET_ID}.sat_players`
+    return _query_mart(
+        _enriched_players_sql(_latest_round()), "sat_players", columns=columns
+    )
+
+
+def loader_queries(round_id: int) -> dict[str, str]:
+    """Return the SQL each app loader sends for a round, keyed by loader.
+
+    Scouting marts are keyed ``load_scouting_data:<mart>``, one per time period.
+    """
+    queries = {
+        f"load_scouting_data:{view}": _scouting_sql(
+            view, _scouting_round(view, round_id)
         )
-        ORDER BY position, player_name
-    """)
+        for view in TIME_PERIODS.values()
+    }
+    queries |= {
+        f"load_{view}": _analytics_sql(
+            view, None if view == "ss_edge_cases" else round_id
+        )
+        for view in ANALYTICS_ORDER_BY
+    }
+    queries |= {
+        f"load_{view}": _round_by_round_sql(view, round_id)
+        for view in ROUND_BY_ROUND_ORDER_BY
+    }
+    queries["load_players"] = _players_sql(round_id)
+    queries["load_enriched_players"] = _enriched_players_sql(round_id)
+    return queries
+
+
+def _loader_mart(loader: str) -> str:
+    """Return the mart a loader of loader_queries reads."""
+    marts = {"load_players": "sct_this_season", "load_enriched_players": "sat_players"}
+    return marts.get(loader) or loader.rsplit(":", 1)[-1].removeprefix("load_")
+
+
+def warm_round_cache(round_id: int) -> int:
+    """Re-read a round's app queries into the closed-round cache, all columns.
+
+    Run after the round's marts are rebuilt (``uv run refresh-round``): replaces
+    any result pinned before the rebuild, so the round loads from disk once it
+    closes. Queries not scoped to a round are skipped. Returns the files written.
+    """
+    marker = load_build_marker()
+    queries = {
+        sql.format(columns="*"): marker.get(_loader_mart(loader))
+        for loader, sql in loader_queries(round_id).items()
+        if loader not in ROUND_INDEPENDENT_LOADERS
+    }
+    return len(_write_round_cache(tuple(queries), tuple(queries.values())))
+
+
+def dry_run_bytes(round_id: int) -> dict[str, int]:
+    """Return the bytes each app loader's query scans for a round.
+
+    Runs BigQuery dry runs (all columns, cache bypassed): no cost, and a check
+    that partition pruning and clustering keep every page view to one round.
+    """
+    client = get_client()
+    job_config = bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
+    return {
+        loader: client.query(
+            sql.format(columns="*"), job_config=job_config
+        ).total_bytes_processed
+        for loader, sql in loader_queries(round_id).items()
+    }
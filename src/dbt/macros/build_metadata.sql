@@ -0,0 +1,71 @@
+{% macro record_build_metadata(results) %}
+{#
+Build metadata: freshness marker for the Streamlit app.
+
+Runs as an on-run-end hook. Appends one row per app-facing mart rebuilt by this
+invocation to `build_metadata`:
+  - invocation_id: dbt invocation (build id)
+  - finished_at: when the run ended
+  - model_name: mart name (e.g. ss_main)
+  - max_round_id: latest as_of_round_id (or round) held by the mart, null if not round-keyed
+
+The app polls the table's modification time (a free metadata call) and only
+re-reads marts whose latest invocation_id changed.
+#}
+    {% if execute %}
+        {% set mart_dirs = ['scouting', 'start_or_sit', 'market_valuation', 'squad_and_team'] %}
+        {% set mart_rows = [] %}
+        {% for res in results %}
+            {% set node = res.node %}
+            {% if node.resource_type == 'model' and res.status == 'success' and node.fqn[1] in mart_dirs %}
+                {% set relation = adapter.get_relation(
+                    database=node.database, schema=node.schema, identifier=node.alias
+                ) %}
+                {% set column_names = adapter.get_columns_in_relation(relation) | map(attribute='name') | list %}
+                {% if 'as_of_round_id' in column_names %}
+                    {% set round_expr = 'max(as_of_round_id)' %}
+                {% elif 'round' in column_names %}
+                    {% set round_expr = 'max(round)' %}
+                {% else %}
+                    {% set round_expr = 'max(cast(null as ' ~ dbt.type_int() ~ '))' %}
+                {% endif %}
+                {% do mart_rows.append(
+                    "select '" ~ node.name ~ "' as model_name, " ~ round_expr ~ " as max_round_id from " ~ relation
+                ) %}
+            {% endif %}
+        {% endfor %}
+
+        {% if mart_rows %}
+            {% set build_metadata = api.Relation.create(
+                database=target.database, schema=target.schema, identifier='build_metadata'
+            ) %}
+            {% do run_query(build_metadata_insert(build_metadata, mart_rows)) %}
+            {# Hooks end with a rollback on transactional adapters (DuckDB); no-op on BigQuery #}
+            {% do adapter.commit() %}
+        {% endif %}
+    {% endif %}
+    {{ return('') }}
+{% endmacro %}
+
+{% macro build_metadata_insert(relation, mart_rows) %}
+{#
+Create build_metadata if needed and append one row per select in `mart_rows`
+(see record_build_metadata).
+#}
+    create table if not exists {{ relation }} (
+        invocation_id {{ dbt.type_string() }},
+        finished_at {{ dbt.type_timestamp() }},
+        model_name {{ dbt.type_string() }},
+        max_round_id {{ dbt.type_int() }}
+    );
+
+    insert into {{ relation }} (invocation_id, finished_at, model_name, max_round_id)
+    select
+        '{{ invocation_id }}',
+        {{ dbt.current_timestamp() }},
+        model_name,
+        max_round_id
+    from (
+        {{ mart_rows | join('\n        union all\n        ') }}
+    );
+{% endmacro %}
@@ -0,0 +1,144 @@
+/*
+Cross-dialect SQL: BigQuery constructs with no portable spelling, dispatched per adapter.
+
+The project targets BigQuery (default__ implementations) and DuckDB for local builds
+(duckdb__ implementations, `uv run dbt build --target duckdb`). Portable functions that
+both engines accept as written (countif, if, qualify, last_value(... ignore nulls),
+generate-free window frames, bitwise | and &) are used directly; dbt's own cross-database
+macros (dbt.bool_or, dbt.type_int, dbt.current_timestamp ...) cover the rest.
+
+any_value_max_by(value_expr, by_expr)
+  value_expr from the row with the largest by_expr (rows with a null by_expr are skipped).
+  BigQuery: any_value(value having max by); DuckDB: arg_max(value, by).
+
+percentile_cont_over(value_expr, fraction, partition_by)
+  Continuous percentile as a window function over `partition by <partition_by>`.
+  BigQuery: percentile_cont(value, f) over (...); DuckDB: quantile_cont(value, f) over (...).
+
+struct_rows(rows)
+  Inline table of literal rows, given as a list of dicts (keys = column names, in order;
+  string values are quoted). Use as a from item: `cross join {{ struct_rows(...) }} as w`.
+  BigQuery: unnest([struct(...), ...]); DuckDB: a values list.
+
+unnest_range(start_expr, end_expr, alias)
+  One row per integer in [start, end] (inclusive), as column `alias`; correlated
+  arguments are allowed. BigQuery: unnest(generate_array(...)); DuckDB: generate_series.
+
+make_struct(fields)
+  Struct value from a dict of field name -> SQL expression, fields in order.
+  BigQuery: struct(expr as name, ...); DuckDB: struct_pack(name := expr, ...).
+
+row_fingerprint(alias)
+  64-bit hash of a whole row, given its table alias; aggregate with bit_xor for an
+  order-independent fingerprint of a set of rows.
+  BigQuery: farm_fingerprint(to_json_string(alias)); DuckDB: hash(alias).
+*/
+
+{%- macro any_value_max_by(value_expr, by_expr) -%}
+    {{ return(adapter.dispatch('any_value_max_by', 'fantasy_br')(value_expr, by_expr)) }}
+{%- endmacro -%}
+
+{%- macro default__any_value_max_by(value_expr, by_expr) -%}
+    any_value({{ value_expr }} having max {{ by_expr }})
+{%- endmacro -%}
+
+{%- macro duckdb__any_value_max_by(value_expr, by_expr) -%}
+    arg_max({{ value_expr }}, {{ by_expr }})
+{%- endmacro -%}
+
+
+{%- macro percentile_cont_over(value_expr, fraction, partition_by) -%}
+    {{ return(adapter.dispatch('percentile_cont_over', 'fantasy_br')(value_expr, fraction, partition_by)) }}
+{%- endmacro -%}
+
+{%- macro default__percentile_cont_over(value_expr, fraction, partition_by) -%}
+    percentile_cont({{ value_expr }}, {{ fraction }}) over (partition by {{ partition_by }})
+{%- endmacro -%}
+
+{%- macro duckdb__percentile_cont_over(value_expr, fraction, partition_by) -%}
+    quantile_cont({{ value_expr }}, {{ fraction }}) over (partition by {{ partition_by }})
+{%- endmacro -%}
+
+
+{%- macro sql_literal(value) -%}
+    {{- "'" ~ value ~ "'" if value is string else value -}}
+{%- endmacro -%}
+
+{%- macro struct_rows(rows) -%}
+    {{ return(adapter.dispatch('struct_rows', 'fantasy_br')(rows)) }}
+{%- endmacro -%}
+
+{%- macro default__struct_rows(rows) -%}
+    unnest([
+        {%- for row in rows %}
+        struct(
+            {%- for name, value in row.items() -%}
+            {{ sql_literal(value) }} as {{ name }}{{ ', ' if not loop.last }}
+            {%- endfor -%}
+        ){{ ',' if not loop.last }}
+        {%- endfor %}
+    ])
+{%- endmacro -%}
+
+{%- macro duckdb__struct_rows(rows) -%}
+    (
+        select *
+        from (
+            values
+            {%- for row in rows %}
+            (
+                {%- for value in row.values() -%}
+                {{ sql_literal(value) }}{{ ', ' if not loop.last }}
+                {%- endfor -%}
+            ){{ ',' if not loop.last }}
+            {%- endfor %}
+        ) as struct_rows ({{ rows[0].keys() | join(', ') }})
+    )
+{%- endmacro -%}
+
+
+{%- macro unnest_range(start_expr, end_expr, alias) -%}
+    {{ return(adapter.dispatch('unnest_range', 'fantasy_br')(start_expr, end_expr, alias)) }}
+{%- endmacro -%}
+
+{%- macro default__unnest_range(start_expr, end_expr, alias) -%}
+    unnest(generate_array({{ start_expr }}, {{ end_expr }})) as {{ alias }}
+{%- endmacro -%}
+
+{%- macro duckdb__unnest_range(start_expr, end_expr, alias) -%}
+    unnest(generate_series({{ start_expr }}, {{ end_expr }})) as {{ alias }}_range ({{ alias }})
+{%- endmacro -%}
+
+
+{%- macro make_struct(fields) -%}
+    {{ return(adapter.dispatch('make_struct', 'fantasy_br')(fields)) }}
+{%- endmacro -%}
+
+{%- macro default__make_struct(fields) -%}
+    struct(
+        {%- for name, expr in fields.items() %}
+        {{ expr }} as {{ name }}{{ ',' if not loop.last }}
+        {%- endfor %}
+    )
+{%- endmacro -%}
+
+{%- macro duckdb__make_struct(fields) -%}
+    struct_pack(
+        {%- for name, expr in fields.items() %}
+        {{ name }} := {{ expr }}{{ ',' if not loop.last }}
+        {%- endfor %}
+    )
+{%- endmacro -%}
+
+
+{%- macro row_fingerprint(alias) -%}
+    {{ return(adapter.dispatch('row_fingerprint', 'fantasy_br')(alias)) }}
+{%- endmacro -%}
+
+{%- macro default__row_fingerprint(alias) -%}
+    farm_fingerprint(to_json_string({{ alias }}))
+{%- endmacro -%}
+
+{%- macro duckdb__row_fingerprint(alias) -%}
+    hash({{ alias }})
+{%- endmacro -%}
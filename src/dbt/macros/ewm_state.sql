@@ -0,0 +1,22 @@
+{% macro ewm_resume_round(alpha) %}
+{#
+EWM state resume point: the as_of_round whose stored state an incremental run of
+int_ewm_state continues from.
+
+Returns first_round - 1 (see incremental_rounds) when that partition exists and was
+built with the same alpha. Returns none on full builds, from round 1, or after an
+alpha change, in which case the state is rebuilt from the start of the season.
+#}
+    {% set first_round = incremental_rounds()[0] %}
+    {% if not execute or first_round is none or first_round <= 1 %}
+        {{ return(none) }}
+    {% endif %}
+    {% set previous = run_query(
+        'select count(*), countif(ewm_alpha != ' ~ alpha ~ ') = 0 from ' ~ this
+        ~ ' where as_of_round_id = ' ~ (first_round - 1)
+    ) %}
+    {% if previous.columns[0].values()[0] > 0 and previous.columns[1].values()[0] %}
+        {{ return(first_round - 1) }}
+    {% endif %}
+    {{ return(none) }}
+{% endmacro %}
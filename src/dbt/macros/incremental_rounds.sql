@@ -0,0 +1,52 @@
+{% macro incremental_rounds(partition='as_of_round_id', where=none) %}
+{#
+Incremental rounds: the (first, last) rounds an incremental run rebuilds.
+
+  - Full builds (first run, --full-refresh): (none, none), i.e. every round
+  - round_from / round_to vars set: that range (round_to defaults to round_from)
+  - Otherwise: from the latest partition already in {{ this }} onwards, so the
+    still-open round is refreshed and any missed rounds are caught up
+    (`where` restricts the rows considered, e.g. to the current season)
+
+Bounds are resolved at compile time into literals so BigQuery can prune
+partitions (a subquery filter would scan every partition).
+#}
+    {% if not is_incremental() %}
+        {{ return((none, none)) }}
+    {% endif %}
+    {% if var('round_from', none) is not none %}
+        {{ return((var('round_from') | int, var('round_to', var('round_from')) | int)) }}
+    {% endif %}
+    {% set latest = none %}
+    {% if execute %}
+        {% set result = run_query(
+            'select max(' ~ partition ~ ') from ' ~ this ~ (' where ' ~ where if where else '')
+        ) %}
+        {% set latest = result.columns[0].values()[0] %}
+    {% endif %}
+    {{ return((latest | int if latest is not none else none, none)) }}
+{% endmacro %}
+
+{% macro as_of_round_filter(expr='as_of_round_id', partition='as_of_round_id', cumulative=false, where=none) %}
+{#
+Predicate restricting `expr` to the rounds this run rebuilds (see incremental_rounds).
+
+Parameters:
+  - expr: round column or expression to filter
+  - partition: partition column of {{ this }}, used to find the latest built round
+  - cumulative (bool): keep every round up to the last one (for running inputs
+                       such as all matches played up to as_of_round_id)
+  - where: filter on {{ this }} when finding the latest built round (see incremental_rounds)
+
+Renders `true` on full builds.
+#}
+    {%- set first, last = incremental_rounds(partition, where) -%}
+    {%- set conditions = [] -%}
+    {%- if first is not none and not cumulative -%}
+        {%- do conditions.append(expr ~ ' >= ' ~ first) -%}
+    {%- endif -%}
+    {%- if last is not none -%}
+        {%- do conditions.append(expr ~ ' <= ' ~ last) -%}
+    {%- endif -%}
+    {{ conditions | join(' and ') if conditions else 'true' }}
+{%- endmacro %}
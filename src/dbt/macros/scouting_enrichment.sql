@@ -1,10 +1,11 @@
-{% macro scouting_enrichment(by_round=true) %}
+{% macro scouting_enrichment(by_round=true, by_window=false) %}
 {#
 Scouting enrichment: computes z-scores and DVS from a preceding `player_pts` CTE.
 
 This macro generates CTEs that continue the WITH clause started in the calling model.
 It expects a CTE named `player_pts` to already exist with these columns:
   - as_of_round_id (required if by_round=true)
+  - scouting_window (required if by_window=true)
   - id, player_name, club, club_logo_url, position
   - pts_avg, base_avg, availability, matches_counted
   - All scout averages: avg_g, avg_a, avg_ft, avg_fd, avg_ff, avg_fs, avg_ps,
@@ -19,28 +20,31 @@ Outputs all player_pts columns plus:
 Parameters:
   - by_round (bool): true for current-season models with as_of_round_id dimension,
                       false for last-season models without it.
+  - by_window (bool): with by_round, benchmark each scouting_window separately
+                      (long multi-window models such as int_sct_window_stats).
 #}
 
 {% if by_round %}
+{% set partition_by = ['as_of_round_id', 'scouting_window'] if by_window else ['as_of_round_id'] %}
 
 -- Position-level benchmark stats per round
 -- Reference group: top N players per position (GK=10, FB/CB=20, MD/AT=30)
 position_stats_avg as (
-    {{ position_stats_by_round('pts_avg') }}
+    {{ position_stats_by_round('pts_avg', partition_by=partition_by) }}
 ),
 
 position_stats_base as (
-    {{ position_stats_by_round('base_avg') }}
+    {{ position_stats_by_round('base_avg', partition_by=partition_by) }}
 ),
 
 -- General benchmark stats per round
 -- Reference group: top 200 players across all positions
 general_stats_avg as (
-    {{ general_stats_by_round('pts_avg') }}
+    {{ general_stats_by_round('pts_avg', partition_by=partition_by) }}
 ),
 
 general_stats_base as (
-    {{ general_stats_by_round('base_avg') }}
+    {{ general_stats_by_round('base_avg', partition_by=partition_by) }}
 ),
 
 -- Z-scores: how many standard deviations above/below the benchmark mean
@@ -54,13 +58,13 @@ with_z_score as (
         {{ z_score_position('p.base_avg', 'psb') }} as z_score_pos_base
     from player_pts p
     left join position_stats_avg psa
-        on p.as_of_round_id = psa.as_of_round_id and p.position = psa.position
+        on {% for col in partition_by %}p.{{ col }} = psa.{{ col }} and {% endfor %}p.position = psa.position
     left join position_stats_base psb
-        on p.as_of_round_id = psb.as_of_round_id and p.position = psb.position
+        on {% for col in partition_by %}p.{{ col }} = psb.{{ col }} and {% endfor %}p.position = psb.position
     left join general_stats_avg gsa
-        on p.as_of_round_id = gsa.as_of_round_id
+        on {% for col in partition_by %}p.{{ col }} = gsa.{{ col }}{{ ' and ' if not loop.last }}{% endfor %}
     left join general_stats_base gsb
-        on p.as_of_round_id = gsb.as_of_round_id
+        on {% for col in partition_by %}p.{{ col }} = gsb.{{ col }}{{ ' and ' if not loop.last }}{% endfor %}
 )
 
 {% else %}
@@ -1,16 +1,16 @@
-{% macro position_stats_by_round(pts_column) %}
+{% macro position_stats_by_round(pts_column, partition_by=['as_of_round_id']) %}
 {# Compute position stats for top N players per position per round: GK=10, FB/CB=20, MD/AT=30 #}
 select
-    as_of_round_id,
+    {{ partition_by | join(', ') }},
     position,
     avg({{ pts_column }}) as pos_avg,
     stddev({{ pts_column }}) as pos_std
 from (
     select
-        as_of_round_id,
+        {{ partition_by | join(', ') }},
         position,
         {{ pts_column }},
-        row_number() over (partition by as_of_round_id, position order by {{ pts_column }} desc) as rn,
+        row_number() over (partition by {{ partition_by | join(', ') }}, position order by {{ pts_column }} desc) as rn,
         case 
             when position = 'GK' then 10
             when position in ('FB', 'CB') then 20
@@ -20,23 +20,23 @@ from (
     where {{ pts_column }} is not null
 )
 where rn <= pos_limit
-group by as_of_round_id, position
+group by {{ partition_by | join(', ') }}, position
 {% endmacro %}
 
-{% macro general_stats_by_round(pts_column, top_n=200) %}
+{% macro general_stats_by_round(pts_column, top_n=200, partition_by=['as_of_round_id']) %}
 {# Compute overall stats for top N players per round #}
 select
-    as_of_round_id,
+    {{ partition_by | join(', ') }},
     avg({{ pts_column }}) as gen_avg,
     stddev({{ pts_column }}) as gen_std
 from (
     select
-        as_of_round_id,
+        {{ partition_by | join(', ') }},
         {{ pts_column }},
-        row_number() over (partition by as_of_round_id order by {{ pts_column }} desc) as rn
+        row_number() over (partition by {{ partition_by | join(', ') }} order by {{ pts_column }} desc) as rn
     from player_pts
     where {{ pts_column }} is not null
 )
 where rn <= {{ top_n }}
-group by as_of_round_id
+group by {{ partition_by | join(', ') }}
 {% endmacro %}
@@ -10,35 +10,27 @@ Prior:
 - Rookies / insufficient history: position_pts_avg_last_season
 */
 
-with all_rounds as (
-    select distinct round_id as as_of_round_id
-    from {{ ref('int_players') }}
-    where season = 2026
-),
-
--- This season averages per player up to each round
-player_avg_this_season as (
+-- This season averages per player up to each round (see int_player_running_totals)
+with player_avg_this_season as (
     select
-        r.as_of_round_id,
-        p.id,
-        any_value(p.player_name having max p.round_id) as player_name,
-        any_value(p.club having max p.round_id) as club,
-        any_value(p.club_logo_url having max p.round_id) as club_logo_url,
-        any_value(p.position having max p.round_id) as position,
-        avg(if(p.has_played, p.pts_round, null)) as player_pts_avg_this_season,
-        countif(p.has_played = true) as matches_this_season,
-        count(*) as rounds_listed_this_season
-    from {{ ref('int_players') }} as p
-    cross join all_rounds as r
-    where p.season = 2026 and p.round_id <= r.as_of_round_id
-    group by r.as_of_round_id, p.id
+        as_of_round_id,
+        id,
+        player_name,
+        club,
+        club_logo_url,
+        position,
+        pts_sum / nullif(pts_count, 0) as player_pts_avg_this_season,
+        matches_played as matches_this_season,
+        rounds_listed as rounds_listed_this_season
+    from {{ ref('int_player_running_totals') }}
+    where {{ as_of_round_filter() }}
 ),
 
 -- Last season averages per player (full season 2025)
 player_avg_last_season as (
     select
         id,
-        any_value(position having max round_id) as position,
+        {{ any_value_max_by('position', 'round_id') }} as position,
         avg(if(has_played, pts_round, null)) as player_pts_avg_last_season,
         countif(has_played = true) as matches_last_season,
         countif(has_played = true) / count(*) as availability_last_season
@@ -0,0 +1,75 @@
+/*
+Conceded Running Totals (this season)
+
+Shared cumulative-aggregation layer: season-to-date points conceded by each club to each
+position per as_of_round, computed once with window frames over per-round totals.
+"Conceding club" = the opponent that allowed the points.
+
+Each row covers rows with round_id <= as_of_round_id against that club:
+  - pts_count, pts_sum: played-match points allowed (avg = pts_sum / pts_count)
+  - matches_played: distinct rounds in which the club conceded to a player who played
+
+The grid starts at the first round the club faced the position.
+*/
+
+with round_totals as (
+    select
+        round_id,
+        opponent_id as conceding_club_id,
+        position,
+        count(if(has_played, pts_round, null)) as pts_count,
+        sum(if(has_played, pts_round, null)) as pts_sum,
+        if({{ dbt.bool_or('has_played') }}, 1, 0) as played_round
+    from {{ ref('int_players') }}
+    where
+        season = 2026
+        and opponent_id is not null
+        and {{ as_of_round_filter('round_id', cumulative=true) }}
+    group by round_id, opponent_id, position
+),
+
+-- Dense grid: one row per club/position per round from their first meeting
+grid as (
+    select
+        f.conceding_club_id,
+        f.position,
+        r.round_id as as_of_round_id
+    from (
+        select
+            conceding_club_id,
+            position,
+            min(round_id) as first_round_id
+        from round_totals
+        group by conceding_club_id, position
+    ) as f
+    inner join (
+        select distinct round_id
+        from {{ ref('int_players') }}
+        where season = 2026 and {{ as_of_round_filter('round_id', cumulative=true) }}
+    ) as r on f.first_round_id <= r.round_id
+),
+
+running as (
+    select
+        g.as_of_round_id,
+        g.conceding_club_id,
+        g.position,
+        coalesce(sum(t.pts_count) over season_to_date, 0) as pts_count,
+        sum(t.pts_sum) over season_to_date as pts_sum,
+        coalesce(sum(t.played_round) over season_to_date, 0) as matches_played
+    from grid as g
+    left join round_totals as t
+        on
+            g.conceding_club_id = t.conceding_club_id
+            and g.position = t.position
+            and g.as_of_round_id = t.round_id
+    window season_to_date as (
+        partition by g.conceding_club_id, g.position
+        order by g.as_of_round_id
+        rows between unbounded preceding and current row
+    )
+)
+
+select *
+from running
+where {{ as_of_round_filter() }}
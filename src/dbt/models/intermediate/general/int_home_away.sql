@@ -15,25 +15,17 @@ venue_multiplier = avg_[home|away] / baseline_pts
 Clamped between 0.85 and 1.15 (+-15% max impact)
 */
 
-with all_rounds as (
-    select distinct round_id as as_of_round_id
-    from {{ ref('int_players') }}
-    where season = 2026
-),
-
--- This season home/away splits per round
-player_avg_venue_this_season as (
+-- This season home/away splits per round (see int_player_running_totals)
+with player_avg_venue_this_season as (
     select
-        r.as_of_round_id,
-        p.id,
-        avg(if(p.has_played and p.is_home = true, p.pts_round, null)) as player_pts_avg_home_this_season,
-        avg(if(p.has_played and p.is_home = false, p.pts_round, null)) as player_pts_avg_away_this_season,
-        countif(p.has_played = true and p.is_home = true) as matches_home_this_season,
-        countif(p.has_played = true and p.is_home = false) as matches_away_this_season
-    from {{ ref('int_players') }} as p
-    cross join all_rounds as r
-    where p.season = 2026 and p.round_id <= r.as_of_round_id
-    group by r.as_of_round_id, p.id
+        as_of_round_id,
+        id,
+        pts_home_sum / nullif(pts_home_count, 0) as player_pts_avg_home_this_season,
+        pts_away_sum / nullif(pts_away_count, 0) as player_pts_avg_away_this_season,
+        matches_home as matches_home_this_season,
+        matches_away as matches_away_this_season
+    from {{ ref('int_player_running_totals') }}
+    where {{ as_of_round_filter() }}
 ),
 
 -- Last season home/away splits (full season 2025)
@@ -100,6 +92,7 @@ combined as (
     left join player_avg_venue_this_season as ts on b.as_of_round_id = ts.as_of_round_id and b.id = ts.id
     left join position_avg_home_last_season as ph on b.position = ph.position
     left join position_avg_away_last_season as pa on b.position = pa.position
+    where {{ as_of_round_filter('b.as_of_round_id') }}
 ),
 
 -- Calculate blended averages using shrinkage per venue
@@ -0,0 +1,112 @@
+/*
+Player Running Totals (this season)
+
+Shared cumulative-aggregation layer: season-to-date totals per player per as_of_round,
+computed once with window frames over a dense player x round grid. As-of models read
+these instead of re-scanning every earlier round for each as_of_round (all_rounds cross join).
+
+Each row covers the player's rows with round_id <= as_of_round_id:
+  - rounds_listed, matches_played, matches_home, matches_away (listed / played counts)
+  - pts_count, pts_sum, pts_sq_sum: played-match points (avg = sum / count,
+    sample variance = (sq_sum - sum^2 / count) / (count - 1))
+  - pts_home_*, pts_away_*: the same split by venue
+  - base_pts_sum, ga_pts_sum: base points and goal/assist points of played matches
+  - boom_count, bust_count: played matches with >= 8 / <= 2 points
+  - first_played_round_id, last_played_round_id
+  - Latest player_name, club, club_logo_url, position and club_id
+
+The grid starts at the player's first listed round, so players appear from then on.
+*/
+
+with rounds as (
+    select distinct round_id
+    from {{ ref('int_players') }}
+    where season = 2026 and {{ as_of_round_filter('round_id', cumulative=true) }}
+),
+
+goal_points as (
+    select points
+    from {{ ref('raw_scout_points') }}
+    where code = 'G'
+),
+
+assist_points as (
+    select points
+    from {{ ref('raw_scout_points') }}
+    where code = 'A'
+),
+
+player_rounds as (
+    select
+        p.id,
+        p.round_id,
+        p.player_name,
+        p.club,
+        p.club_logo_url,
+        p.position,
+        p.club_id,
+        p.has_played,
+        p.is_home,
+        if(p.has_played, p.pts_round, null) as pts_played,
+        if(p.has_played, p.base_round, null) as base_played,
+        if(p.has_played, (p.scout_g * gp.points) + (p.scout_a * ap.points), null) as ga_played
+    from {{ ref('int_players') }} as p
+    cross join goal_points as gp
+    cross join assist_points as ap
+    where p.season = 2026 and {{ as_of_round_filter('p.round_id', cumulative=true) }}
+),
+
+-- Dense grid: one row per player per round from their first listed round
+grid as (
+    select
+        f.id,
+        r.round_id as as_of_round_id
+    from (
+        select
+            id,
+            min(round_id) as first_round_id
+        from player_rounds
+        group by id
+    ) as f
+    inner join rounds as r on f.first_round_id <= r.round_id
+),
+
+running as (
+    select
+        g.as_of_round_id,
+        g.id,
+        last_value(p.player_name ignore nulls) over season_to_date as player_name,
+        last_value(p.club ignore nulls) over season_to_date as club,
+        last_value(p.club_logo_url ignore nulls) over season_to_date as club_logo_url,
+        last_value(p.position ignore nulls) over season_to_date as position,
+        last_value(p.club_id ignore nulls) over season_to_date as club_id,
+        count(p.round_id) over season_to_date as rounds_listed,
+        countif(p.has_played) over season_to_date as matches_played,
+        countif(p.has_played and p.is_home = true) over season_to_date as matches_home,
+        countif(p.has_played and p.is_home = false) over season_to_date as matches_away,
+        count(p.pts_played) over season_to_date as pts_count,
+        sum(p.pts_played) over season_to_date as pts_sum,
+        sum(p.pts_played * p.pts_played) over season_to_date as pts_sq_sum,
+        count(if(p.is_home = true, p.pts_played, null)) over season_to_date as pts_home_count,
+        sum(if(p.is_home = true, p.pts_played, null)) over season_to_date as pts_home_sum,
+        count(if(p.is_home = false, p.pts_played, null)) over season_to_date as pts_away_count,
+        sum(if(p.is_home = false, p.pts_played, null)) over season_to_date as pts_away_sum,
+        sum(p.base_played) over season_to_date as base_pts_sum,
+        sum(p.ga_played) over season_to_date as ga_pts_sum,
+        countif(p.pts_played >= 8.0) over season_to_date as boom_count,
+        countif(p.pts_played <= 2.0) over season_to_date as bust_count,
+        min(if(p.has_played, p.round_id, null)) over season_to_date as first_played_round_id,
+        max(if(p.has_played, p.round_id, null)) over season_to_date as last_played_round_id
+    from grid as g
+    left join player_rounds as p
+        on g.id = p.id and g.as_of_round_id = p.round_id
+    window season_to_date as (
+        partition by g.id
+        order by g.as_of_round_id
+        rows between unbounded preceding and current row
+    )
+)
+
+select *
+from running
+where {{ as_of_round_filter() }}
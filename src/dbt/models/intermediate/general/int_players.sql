@@ -1,3 +1,22 @@
+/*
+Players by round: one row per player per round of each season, with club, position,
+venue, opponent, flat per-round scout counts and base points.
+
+Incremental table partitioned by round_id and clustered by season, id and position
+(see dbt_project.yml), so downstream models read precomputed rows instead of
+re-running the joins. Per-round scouts come from raw_player_round_scouts, which the
+ingester fills from the API's cumulative scouts as each round is loaded, so only the
+rebuilt rounds are read (the current season's latest round onwards, for every
+season, as partitions are per round).
+*/
+
+{#- Scout columns, in output order: offensive, defensive, negative -#}
+{%- set scout_codes = [
+    'g', 'a', 'ft', 'fd', 'ff', 'fs', 'ps',
+    'ds', 'sg', 'de', 'dp',
+    'fc', 'pc', 'ca', 'cv', 'gc', 'gs', 'i', 'pp',
+] %}
+
 with scout_points as (
     select
         code,
@@ -18,7 +37,6 @@ base_players as (
         p.pts_avg,
         p.has_played,
         p.matches_played,
-        p.scout,
         p.club_id,
         m.match_id,
         case
@@ -37,6 +55,20 @@ base_players as (
             p.season = m.season
             and p.round_id = m.round_id
             and (p.club_id = m.club_home_id or p.club_id = m.club_away_id)
+    where {{ as_of_round_filter('p.round_id', partition='round_id', where='season = 2026') }}
+),
+
+round_scouts as (
+    select
+        season,
+        round_id,
+        id,
+        {%- for code in scout_codes %}
+        sum(case when scout_code = '{{ code }}' then scout_count else 0 end) as scout_{{ code }}{{ ',' if not loop.last }}
+        {%- endfor %}
+    from {{ ref('stg_player_round_scouts') }}
+    where {{ as_of_round_filter('round_id', partition='round_id', where='season = 2026') }}
+    group by season, round_id, id
 ),
 
 goal_points as (
@@ -63,33 +95,15 @@ own_goal_points as (
     where code = 'GC'
 ),
 
--- Calculate per-round scout values from cumulative scout data
 with_deltas as (
     select
-        *,
-        -- Offensive scouts
-        coalesce(scout.g, 0) - coalesce(lag(scout.g) over (partition by id, season order by round_id), 0) as scout_g,
-        coalesce(scout.a, 0) - coalesce(lag(scout.a) over (partition by id, season order by round_id), 0) as scout_a,
-        coalesce(scout.ft, 0) - coalesce(lag(scout.ft) over (partition by id, season order by round_id), 0) as scout_ft,
-        coalesce(scout.fd, 0) - coalesce(lag(scout.fd) over (partition by id, season order by round_id), 0) as scout_fd,
-        coalesce(scout.ff, 0) - coalesce(lag(scout.ff) over (partition by id, season order by round_id), 0) as scout_ff,
-        coalesce(scout.fs, 0) - coalesce(lag(scout.fs) over (partition by id, season order by round_id), 0) as scout_fs,
-        coalesce(scout.ps, 0) - coalesce(lag(scout.ps) over (partition by id, season order by round_id), 0) as scout_ps,
-        -- Defensive scouts
-        coalesce(scout.ds, 0) - coalesce(lag(scout.ds) over (partition by id, season order by round_id), 0) as scout_ds,
-        coalesce(scout.sg, 0) - coalesce(lag(scout.sg) over (partition by id, season order by round_id), 0) as scout_sg,
-        coalesce(scout.de, 0) - coalesce(lag(scout.de) over (partition by id, season order by round_id), 0) as scout_de,
-        coalesce(scout.dp, 0) - coalesce(lag(scout.dp) over (partition by id, season order by round_id), 0) as scout_dp,
-        -- Negative scouts
-        coalesce(scout.fc, 0) - coalesce(lag(scout.fc) over (partition by id, season order by round_id), 0) as scout_fc,
-        coalesce(scout.pc, 0) - coalesce(lag(scout.pc) over (partition by id, season order by round_id), 0) as scout_pc,
-        coalesce(scout.ca, 0) - coalesce(lag(scout.ca) over (partition by id, season order by round_id), 0) as scout_ca,
-        coalesce(scout.cv, 0) - coalesce(lag(scout.cv) over (partition by id, season order by round_id), 0) as scout_cv,
-        coalesce(scout.gc, 0) - coalesce(lag(scout.gc) over (partition by id, season order by round_id), 0) as scout_gc,
-        coalesce(scout.gs, 0) - coalesce(lag(scout.gs) over (partition by id, season order by round_id), 0) as scout_gs,
-        coalesce(scout.i, 0) - coalesce(lag(scout.i) over (partition by id, season order by round_id), 0) as scout_i,
-        coalesce(scout.pp, 0) - coalesce(lag(scout.pp) over (partition by id, season order by round_id), 0) as scout_pp
-    from base_players
+        p.*,
+        {%- for code in scout_codes %}
+        coalesce(s.scout_{{ code }}, 0) as scout_{{ code }}{{ ',' if not loop.last }}
+        {%- endfor %}
+    from base_players as p
+    left join round_scouts as s
+        on p.season = s.season and p.round_id = s.round_id and p.id = s.id
 )
 
 -- Calculate base_round (points without goals, assists, red cards, and own goals)
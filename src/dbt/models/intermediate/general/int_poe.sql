@@ -9,17 +9,14 @@ So PoE for round R = actual_pts(R) - map_score(as_of_round_id = R-1).
 Aggregates per player per as_of_round:
   - avg_poe_season: mean PoE across all rounds with valid MAP this season
   - avg_poe_last_5: mean PoE across the 5 most recently played rounds with valid MAP
-*/
 
-with all_rounds as (
-    select distinct round_id as as_of_round_id
-    from {{ ref('int_players') }}
-    where season = 2026
-),
+Both are running window frames over the PoE rounds, carried forward to later
+as_of_rounds over the int_player_running_totals grid.
+*/
 
 -- Round-level PoE: actual points minus MAP projection for that round.
 -- MAP at as_of_round_id = R-1 projects round R.
-round_poe as (
+with round_poe as (
     select
         p.round_id,
         p.id,
@@ -35,28 +32,50 @@ round_poe as (
         p.season = 2026
         and p.has_played = true
         and m.map_score is not null
+        and {{ as_of_round_filter('p.round_id', cumulative=true) }}
+),
+
+-- Season and last-5 PoE averages as of each PoE round
+running_poe as (
+    select
+        id,
+        round_id,
+        avg(poe) over (
+            partition by id
+            order by round_id
+            rows between unbounded preceding and current row
+        ) as avg_poe_season,
+        avg(poe) over (
+            partition by id
+            order by round_id
+            rows between 4 preceding and current row
+        ) as avg_poe_last_5
+    from round_poe
 ),
 
--- For each as_of_round, rank played rounds by recency per player
-ranked_poe as (
+-- Carry the latest PoE round forward to every later as_of_round
+carried_poe as (
     select
-        r.as_of_round_id,
-        rp.id,
-        rp.round_id,
-        rp.poe,
-        row_number() over (
-            partition by r.as_of_round_id, rp.id
-            order by rp.round_id desc
-        ) as recency_rank
-    from round_poe as rp
-    cross join all_rounds as r
-    where rp.round_id <= r.as_of_round_id
+        t.as_of_round_id,
+        t.id,
+        last_value(rp.avg_poe_season ignore nulls) over season_to_date as avg_poe_season,
+        last_value(rp.avg_poe_last_5 ignore nulls) over season_to_date as avg_poe_last_5,
+        countif(rp.round_id is not null) over season_to_date as poe_rounds
+    from {{ ref('int_player_running_totals') }} as t
+    left join running_poe as rp
+        on t.id = rp.id and t.as_of_round_id = rp.round_id
+    where {{ as_of_round_filter('t.as_of_round_id', cumulative=true) }}
+    window season_to_date as (
+        partition by t.id
+        order by t.as_of_round_id
+        rows between unbounded preceding and current row
+    )
 )
 
 select
     as_of_round_id,
     id,
-    avg(poe) as avg_poe_season,
-    avg(case when recency_rank <= 5 then poe end) as avg_poe_last_5
-from ranked_poe
-group by as_of_round_id, id
+    avg_poe_season,
+    avg_poe_last_5
+from carried_poe
+where poe_rounds > 0 and {{ as_of_round_filter() }}
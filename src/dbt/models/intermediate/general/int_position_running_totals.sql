@@ -0,0 +1,51 @@
+/*
+Position Running Totals (this season)
+
+Shared cumulative-aggregation layer: season-to-date played-match points per position
+per as_of_round, computed once with window frames over per-round position totals.
+
+Each row covers every player's rows at that position with round_id <= as_of_round_id:
+  - pts_count, pts_sum, pts_sq_sum (league_avg_pts = pts_sum / pts_count)
+*/
+
+with round_totals as (
+    select
+        round_id,
+        position,
+        count(if(has_played, pts_round, null)) as pts_count,
+        sum(if(has_played, pts_round, null)) as pts_sum,
+        sum(if(has_played, pts_round * pts_round, null)) as pts_sq_sum
+    from {{ ref('int_players') }}
+    where season = 2026 and {{ as_of_round_filter('round_id', cumulative=true) }}
+    group by round_id, position
+),
+
+-- Dense grid: every position in every round
+grid as (
+    select
+        r.round_id as as_of_round_id,
+        p.position
+    from (select distinct round_id from round_totals) as r
+    cross join (select distinct position from round_totals) as p
+),
+
+running as (
+    select
+        g.as_of_round_id,
+        g.position,
+        coalesce(sum(t.pts_count) over season_to_date, 0) as pts_count,
+        sum(t.pts_sum) over season_to_date as pts_sum,
+        sum(t.pts_sq_sum) over season_to_date as pts_sq_sum
+    from grid as g
+    left join round_totals as t
+        on g.as_of_round_id = t.round_id and g.position = t.position
+    window season_to_date as (
+        partition by g.position
+        order by g.as_of_round_id
+        rows between unbounded preceding and current row
+    )
+)
+
+select *
+from running
+where {{ as_of_round_filter() }}
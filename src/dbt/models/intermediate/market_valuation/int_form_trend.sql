@@ -14,39 +14,33 @@ Form bucket:
   - FLAT: otherwise
 */
 
-with all_rounds as (
-    select distinct round_id as as_of_round_id
-    from {{ ref('int_players') }}
-    where season = 2026
-),
-
--- Rank played matches by recency for last-N averages
-player_matches_ranked as (
+-- Last-3 average as of each played match (window frame over the player's played matches)
+with player_matches as (
     select
-        r.as_of_round_id,
-        p.id,
-        p.pts_round,
-        row_number() over (
-            partition by r.as_of_round_id, p.id
-            order by p.round_id desc
-        ) as recency_rank
-    from {{ ref('int_players') }} as p
-    cross join all_rounds as r
+        id,
+        round_id,
+        avg(pts_round) over (
+            partition by id
+            order by round_id
+            rows between 2 preceding and current row
+        ) as last3_avg_pts
+    from {{ ref('int_players') }}
     where
-        p.season = 2026
-        and p.round_id <= r.as_of_round_id
-        and p.has_played = true
+        season = 2026
+        and has_played = true
+        and {{ as_of_round_filter('round_id', cumulative=true) }}
 ),
 
--- Last 3 and last 5 averages
+-- Last 3 average as of each round: value at the player's most recent played match
 recent_avgs as (
     select
-        as_of_round_id,
-        id,
-        avg(if(recency_rank <= 3, pts_round, null)) as last3_avg_pts
-    from player_matches_ranked
-    where recency_rank <= 3
-    group by as_of_round_id, id
+        t.as_of_round_id,
+        t.id,
+        m.last3_avg_pts
+    from {{ ref('int_player_running_totals') }} as t
+    inner join player_matches as m
+        on t.id = m.id and t.last_played_round_id = m.round_id
+    where {{ as_of_round_filter('t.as_of_round_id') }}
 )
 
 select
@@ -57,7 +51,7 @@ select
     b.club_logo_url,
     b.position,
     -- EWM form
-    0.25 as ewm_alpha,
+    {{ var('ewm_alpha') }} as ewm_alpha,
     e.ewm_pts,
     -- Recent averages
     ra.last3_avg_pts,
@@ -91,6 +85,10 @@ select
     end as form_bucket_ewm
 from {{ ref('int_baseline') }} as b
 left join {{ ref('int_ewm_form') }} as e
-    on b.as_of_round_id = e.as_of_round_id and b.id = e.id
+    on
+        b.as_of_round_id = e.as_of_round_id
+        and b.id = e.id
+        and {{ as_of_round_filter('e.as_of_round_id') }}
 left join recent_avgs as ra
     on b.as_of_round_id = ra.as_of_round_id and b.id = ra.id
+where {{ as_of_round_filter('b.as_of_round_id') }}
@@ -64,8 +64,18 @@ select
     end as confidence_flag
 from {{ ref('int_baseline') }} as b
 left join {{ ref('int_ewm_form') }} as e
-    on b.as_of_round_id = e.as_of_round_id and b.id = e.id
+    on
+        b.as_of_round_id = e.as_of_round_id
+        and b.id = e.id
+        and {{ as_of_round_filter('e.as_of_round_id') }}
 left join {{ ref('int_ga_dependency') }} as ga
-    on b.as_of_round_id = ga.as_of_round_id and b.id = ga.id
+    on
+        b.as_of_round_id = ga.as_of_round_id
+        and b.id = ga.id
+        and {{ as_of_round_filter('ga.as_of_round_id') }}
 left join {{ ref('int_distribution_stats') }} as d
-    on b.as_of_round_id = d.as_of_round_id and b.id = d.id
+    on
+        b.as_of_round_id = d.as_of_round_id
+        and b.id = d.id
+        and {{ as_of_round_filter('d.as_of_round_id') }}
+where {{ as_of_round_filter('b.as_of_round_id') }}
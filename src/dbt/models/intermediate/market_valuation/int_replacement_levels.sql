@@ -20,15 +20,13 @@ with
 draft_config as (
     select *
     from
-        unnest(
-            [
-                struct('GK' as position, 20 as drafted_count),
-                struct('FB' as position, 40 as drafted_count),
-                struct('CB' as position, 40 as drafted_count),
-                struct('MD' as position, 60 as drafted_count),
-                struct('AT' as position, 60 as drafted_count)
-            ]
-        )
+        {{ struct_rows([
+            {'position': 'GK', 'drafted_count': 20},
+            {'position': 'FB', 'drafted_count': 40},
+            {'position': 'CB', 'drafted_count': 40},
+            {'position': 'MD', 'drafted_count': 60},
+            {'position': 'AT', 'drafted_count': 60},
+        ]) }}
 ),
 
 -- Rank all players per position per round by baseline (best = rank 1)
@@ -42,7 +40,7 @@ ranked as (
             order by baseline_pts desc nulls last
         ) as position_rank
     from {{ ref('int_baseline') }}
-    where baseline_pts is not null
+    where baseline_pts is not null and {{ as_of_round_filter('as_of_round_id') }}
 ),
 
 -- Average baseline of the replacement window for each position
@@ -1,4 +1,3 @@
-{{ config(materialized='view') }}
 /*
 Schedule Strength (MPAP-based)
 
@@ -21,7 +20,7 @@ Calculation per future opponent:
 with all_rounds as (
     select distinct round_id as as_of_round_id
     from {{ ref('int_players') }}
-    where season = 2026
+    where season = 2026 and {{ as_of_round_filter('round_id') }}
 ),
 
 player_clubs as (
@@ -59,21 +58,16 @@ future_matches as (
             and r.as_of_round_id < m.round_id
 ),
 
--- This season: avg points conceded per opponent per position
+-- This season: avg points conceded per opponent per position (see int_conceded_running_totals)
 conceded_this_season as (
     select
-        r.as_of_round_id,
-        p.opponent_id as conceding_club_id,
-        p.position,
-        avg(if(p.has_played, p.pts_round, null)) as pts_allowed_this_season_avg,
-        count(distinct if(p.has_played, p.round_id, null)) as matches_this_season
-    from {{ ref('int_players') }} as p
-    cross join all_rounds as r
-    where
-        p.season = 2026
-        and p.round_id <= r.as_of_round_id
-        and p.opponent_id is not null
-    group by r.as_of_round_id, p.opponent_id, p.position
+        as_of_round_id,
+        conceding_club_id,
+        position,
+        pts_sum / nullif(pts_count, 0) as pts_allowed_this_season_avg,
+        matches_played as matches_this_season
+    from {{ ref('int_conceded_running_totals') }}
+    where {{ as_of_round_filter() }}
 ),
 
 -- Last season: avg points conceded per opponent per position
@@ -128,6 +122,7 @@ opponent_mpap_detail as (
         on
             fm.opponent_id = cl.conceding_club_id
             and b.position = cl.position
+    where {{ as_of_round_filter('b.as_of_round_id') }}
 ),
 
 -- Rank opponents: overall (next N) and within venue (next N home / away)
@@ -0,0 +1,282 @@
+{{ config(cluster_by=none if target.type == 'duckdb' else ['scouting_window', 'position']) }}
+/*
+Scouting Intermediate: Window Stats
+
+Stats for every scouting window in one pass over int_players, as a long table keyed by
+(as_of_round_id, scouting_window, id). The sct_* marts each slice one window.
+
+Bounded windows (ranked recency + window-membership bitmask):
+  - last_1, last_5, last_10: stats over the last N played matches; availability over
+    the last N calendar rounds ("of the last N rounds, how many did the player play?")
+  - last_5_home, last_5_away: stats over the last 5 played matches at that venue;
+    availability over the player's last 5 listings at that venue
+  A match stays in a window from its own round until the round of the Nth later
+  match (or calendar round) of the same kind, found with lead(). Each match is paired
+  only with the as_of rounds it is live in, and a bitmask records which windows it
+  belongs to at each of them, so every window is aggregated from the same rows and
+  the work stays linear in rounds (no all_rounds cross join).
+
+Unbounded windows:
+  - this_season: season-to-date averages with window frames over a dense round grid
+  - last_season: full 2025 averages, stored under as_of_round_id = 0 (preseason)
+
+Enriched with z-scores and DVS via scouting_enrichment macro, per as_of_round and window.
+*/
+
+{%- set scouts = [
+    'g', 'a', 'ft', 'fd', 'ff', 'fs', 'ps', 'ds', 'sg', 'de', 'dp', 'fc', 'pc', 'ca', 'cv', 'gc', 'gs', 'i', 'pp'
+] -%}
+{#- venue: none = all matches (availability over calendar rounds), true = home, false = away -#}
+{%- set windows = [
+    {'name': 'last_1', 'bit': 1, 'size': 1, 'venue': none},
+    {'name': 'last_5', 'bit': 2, 'size': 5, 'venue': none},
+    {'name': 'last_10', 'bit': 4, 'size': 10, 'venue': none},
+    {'name': 'last_5_home', 'bit': 8, 'size': 5, 'venue': true},
+    {'name': 'last_5_away', 'bit': 16, 'size': 5, 'venue': false},
+] -%}
+{#- Columns holding the round each listing leaves its windows, and the bit of each window -#}
+{%- set live_until = [] -%}
+{%- set window_bits = [] -%}
+{%- for w in windows -%}
+    {%- do live_until.extend(['rc.listed_until_' ~ w.name, 'rc.played_until_' ~ w.name]) -%}
+    {%- do window_bits.append({'scouting_window': w.name, 'window_bit': w.bit}) -%}
+{%- endfor %}
+
+with listings as (
+    select
+        season,
+        id,
+        round_id,
+        player_name,
+        club,
+        club_logo_url,
+        position,
+        has_played,
+        is_home,
+        pts_round,
+        base_round,
+        {%- for s in scouts %}
+            scout_{{ s }}
+            {%- if not loop.last %},{% endif %}
+        {%- endfor %}
+    from {{ ref('int_players') }}
+    where
+        season = 2025
+        or (season = 2026 and {{ as_of_round_filter('round_id', cumulative=true) }})
+),
+
+-- Calendar rounds, with the round that closes each calendar window
+rounds as (
+    select
+        round_id,
+        max(round_id) over () + 1 as horizon_round_id,
+        {%- for size in windows | map(attribute='size') | unique %}
+            lead(round_id, {{ size }}) over (order by round_id) as round_plus_{{ size }}
+            {%- if not loop.last %},{% endif %}
+        {%- endfor %}
+    from (
+        select distinct round_id
+        from listings
+        where season = 2026
+    )
+),
+
+-- Ranked recency: for each listing, the as_of round from which it leaves each window
+-- (next round with N later listings / played matches of the same kind; horizon if none)
+recency as (
+    select
+        l.*,
+        {%- for w in windows %}
+            {%- if w.venue is none %}
+                coalesce(r.round_plus_{{ w.size }}, r.horizon_round_id) as listed_until_{{ w.name }},
+                if(
+                    l.has_played,
+                    coalesce(
+                        lead(l.round_id, {{ w.size }}) over (partition by l.id, l.has_played order by l.round_id),
+                        r.horizon_round_id
+                    ),
+                    l.round_id
+                ) as played_until_{{ w.name }},
+            {%- else %}
+                coalesce(
+                    lead(l.round_id, {{ w.size }}) over (partition by l.id, l.is_home order by l.round_id),
+                    r.horizon_round_id
+                ) as listed_until_{{ w.name }},
+                if(
+                    l.has_played,
+                    coalesce(
+                        lead(l.round_id, {{ w.size }}) over (
+                            partition by l.id, l.is_home, l.has_played order by l.round_id
+                        ),
+                        r.horizon_round_id
+                    ),
+                    l.round_id
+                ) as played_until_{{ w.name }},
+            {%- endif %}
+        {%- endfor %}
+        r.horizon_round_id
+    from listings as l
+    inner join rounds as r on l.round_id = r.round_id
+    where l.season = 2026
+),
+
+-- Each listing paired with the as_of rounds it is live in, with its window bitmasks
+live_listings as (
+    select
+        rc.*,
+        r.round_id as as_of_round_id,
+        0
+        {%- for w in windows %}
+            | if(
+                r.round_id < rc.listed_until_{{ w.name }}
+                {%- if w.venue is not none %} and rc.is_home = {{ w.venue | lower }}{% endif %},
+                {{ w.bit }}, 0
+            )
+        {%- endfor %} as listed_mask,
+        0
+        {%- for w in windows %}
+            | if(
+                rc.has_played and r.round_id < rc.played_until_{{ w.name }}
+                {%- if w.venue is not none %} and rc.is_home = {{ w.venue | lower }}{% endif %},
+                {{ w.bit }}, 0
+            )
+        {%- endfor %} as played_mask
+    from recency as rc
+    cross join {{ unnest_range('rc.round_id', 'greatest(' ~ live_until | join(', ') ~ ') - 1', 'live_round_id') }}
+    inner join rounds as r on live_round_id = r.round_id
+    where {{ as_of_round_filter('r.round_id') }}
+),
+
+-- One row per listing, as_of round and window it belongs to
+window_listings as (
+    select
+        l.*,
+        w.scouting_window,
+        (l.listed_mask & w.window_bit) != 0 as in_listed,
+        (l.played_mask & w.window_bit) != 0 as in_played
+    from live_listings as l
+    cross join {{ struct_rows(window_bits) }} as w
+    where ((l.listed_mask | l.played_mask) & w.window_bit) != 0
+),
+
+bounded_stats as (
+    select
+        as_of_round_id,
+        scouting_window,
+        id,
+        -- Most recent listing in the window (name, club may change mid-season)
+        {{ any_value_max_by('player_name', 'if(in_listed, round_id, null)') }} as player_name,
+        {{ any_value_max_by('club', 'if(in_listed, round_id, null)') }} as club,
+        {{ any_value_max_by('club_logo_url', 'if(in_listed, round_id, null)') }} as club_logo_url,
+        {{ any_value_max_by('position', 'if(in_listed, round_id, null)') }} as position,
+        countif(in_listed and has_played) as matches_counted,
+        avg(if(in_played, pts_round, null)) as pts_avg,
+        avg(if(in_played, base_round, null)) as base_avg,
+        countif(in_listed and has_played) / countif(in_listed) as availability,
+        {%- for s in scouts %}
+            avg(if(in_played, scout_{{ s }}, null)) as avg_{{ s }},
+        {%- endfor %}
+        {%- for s in scouts %}
+            avg(if(in_played and is_home, scout_{{ s }}, null)) as avg_{{ s }}_home,
+        {%- endfor %}
+        {%- for s in scouts %}
+            avg(if(in_played and not is_home, scout_{{ s }}, null)) as avg_{{ s }}_away
+            {%- if not loop.last %},{% endif %}
+        {%- endfor %}
+    from window_listings
+    group by as_of_round_id, scouting_window, id
+    having countif(in_listed) > 0
+),
+
+-- Dense grid: one row per player per round from their first listed round this season
+season_grid as (
+    select
+        f.id,
+        r.round_id as as_of_round_id
+    from (
+        select
+            id,
+            min(round_id) as first_round_id
+        from listings
+        where season = 2026
+        group by id
+    ) as f
+    inner join rounds as r on f.first_round_id <= r.round_id
+),
+
+this_season_stats as (
+    select
+        g.as_of_round_id,
+        'this_season' as scouting_window,
+        g.id,
+        last_value(l.player_name ignore nulls) over season_to_date as player_name,
+        last_value(l.club ignore nulls) over season_to_date as club,
+        last_value(l.club_logo_url ignore nulls) over season_to_date as club_logo_url,
+        last_value(l.position ignore nulls) over season_to_date as position,
+        countif(l.has_played) over season_to_date as matches_counted,
+        avg(if(l.has_played, l.pts_round, null)) over season_to_date as pts_avg,
+        avg(if(l.has_played, l.base_round, null)) over season_to_date as base_avg,
+        countif(l.has_played) over season_to_date / count(l.round_id) over season_to_date as availability,
+        {%- for s in scouts %}
+            avg(if(l.has_played, l.scout_{{ s }}, null)) over season_to_date as avg_{{ s }},
+        {%- endfor %}
+        {%- for s in scouts %}
+            avg(if(l.has_played and l.is_home, l.scout_{{ s }}, null)) over season_to_date as avg_{{ s }}_home,
+        {%- endfor %}
+        {%- for s in scouts %}
+            avg(if(l.has_played and not l.is_home, l.scout_{{ s }}, null))
+                over season_to_date as avg_{{ s }}_away
+            {%- if not loop.last %},{% endif %}
+        {%- endfor %}
+    from season_grid as g
+    left join listings as l
+        on l.season = 2026 and g.id = l.id and g.as_of_round_id = l.round_id
+    window season_to_date as (
+        partition by g.id
+        order by g.as_of_round_id
+        rows between unbounded preceding and current row
+    )
+),
+
+last_season_stats as (
+    select
+        0 as as_of_round_id,
+        'last_season' as scouting_window,
+        id,
+        {{ any_value_max_by('player_name', 'round_id') }} as player_name,
+        {{ any_value_max_by('club', 'round_id') }} as club,
+        {{ any_value_max_by('club_logo_url', 'round_id') }} as club_logo_url,
+        {{ any_value_max_by('position', 'round_id') }} as position,
+        countif(has_played) as matches_counted,
+        avg(if(has_played, pts_round, null)) as pts_avg,
+        avg(if(has_played, base_round, null)) as base_avg,
+        countif(has_played) / count(*) as availability,
+        {%- for s in scouts %}
+            avg(if(has_played, scout_{{ s }}, null)) as avg_{{ s }},
+        {%- endfor %}
+        {%- for s in scouts %}
+            avg(if(has_played and is_home, scout_{{ s }}, null)) as avg_{{ s }}_home,
+        {%- endfor %}
+        {%- for s in scouts %}
+            avg(if(has_played and not is_home, scout_{{ s }}, null)) as avg_{{ s }}_away
+            {%- if not loop.last %},{% endif %}
+        {%- endfor %}
+    from listings
+    where season = 2025
+    group by id
+),
+
+player_pts as (
+    select *
+    from (
+        select * from bounded_stats
+        union all
+        select * from this_season_stats
+        union all
+        select * from last_season_stats
+    )
+    where {{ as_of_round_filter() }}
+),
+
+-- Enrichment: z-scores and DVS per as_of_round and window (see scouting_enrichment macro)
+{{ scouting_enrichment(by_round=true, by_window=true) }}
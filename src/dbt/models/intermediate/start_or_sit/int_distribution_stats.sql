@@ -15,12 +15,16 @@ Consistency metrics (derived from blended stats):
   - CV (Coefficient of Variation) = stddev / mean. Lower = more stable.
   - Consistency Rating = 1 / (1 + CV). Range 0-1, higher = more consistent.
   - Range = ceiling - floor. Measure of volatility.
+
+Averages, standard deviations, match and boom/bust counts come from the running totals in
+int_player_running_totals (stddev from the sum of squares). Percentiles need each player's full
+score list, so they are still computed over the played matches up to every as_of_round.
 */
 
 with all_rounds as (
     select distinct round_id as as_of_round_id
     from {{ ref('int_players') }}
-    where season = 2026
+    where season = 2026 and {{ as_of_round_filter('round_id') }}
 ),
 
 -- All played matches per player (this season) up to each as_of_round
@@ -43,11 +47,9 @@ position_stats as (
     select
         as_of_round_id,
         position,
-        percentile_cont(pts_round, 0.20) over (partition by as_of_round_id, position) as pos_floor,
-        percentile_cont(pts_round, 0.50) over (partition by as_of_round_id, position) as pos_median,
-        percentile_cont(pts_round, 0.80) over (partition by as_of_round_id, position) as pos_ceiling,
-        avg(pts_round) over (partition by as_of_round_id, position) as pos_avg,
-        stddev(pts_round) over (partition by as_of_round_id, position) as pos_stddev
+        {{ percentile_cont_over('pts_round', 0.20, 'as_of_round_id, position') }} as pos_floor,
+        {{ percentile_cont_over('pts_round', 0.50, 'as_of_round_id, position') }} as pos_median,
+        {{ percentile_cont_over('pts_round', 0.80, 'as_of_round_id, position') }} as pos_ceiling
     from player_matches
 ),
 
@@ -57,9 +59,7 @@ position_stats_deduped as (
         position,
         pos_floor,
         pos_median,
-        pos_ceiling,
-        pos_avg,
-        pos_stddev
+        pos_ceiling
     from position_stats
 ),
 
@@ -68,15 +68,9 @@ player_percentiles as (
     select
         as_of_round_id,
         id,
-        percentile_cont(pts_round, 0.20) over (partition by as_of_round_id, id) as raw_floor,
-        percentile_cont(pts_round, 0.50) over (partition by as_of_round_id, id) as raw_median,
-        percentile_cont(pts_round, 0.80) over (partition by as_of_round_id, id) as raw_ceiling,
-        avg(pts_round) over (partition by as_of_round_id, id) as pts_avg,
-        stddev(pts_round) over (partition by as_of_round_id, id) as pts_stddev,
-        count(*) over (partition by as_of_round_id, id) as matches_played,
-        -- Boom/bust counts for rate computation
-        sum(case when pts_round >= 8.0 then 1 else 0 end) over (partition by as_of_round_id, id) as boom_count,
-        sum(case when pts_round <= 2.0 then 1 else 0 end) over (partition by as_of_round_id, id) as bust_count
+        {{ percentile_cont_over('pts_round', 0.20, 'as_of_round_id, id') }} as raw_floor,
+        {{ percentile_cont_over('pts_round', 0.50, 'as_of_round_id, id') }} as raw_median,
+        {{ percentile_cont_over('pts_round', 0.80, 'as_of_round_id, id') }} as raw_ceiling
     from player_matches
 ),
 
@@ -86,15 +80,34 @@ player_percentiles_deduped as (
         id,
         raw_floor,
         raw_median,
-        raw_ceiling,
-        pts_avg,
-        pts_stddev,
-        matches_played,
-        boom_count,
-        bust_count
+        raw_ceiling
     from player_percentiles
 ),
 
+-- Player-level moments and counts from the running totals
+player_stats as (
+    select
+        pp.as_of_round_id,
+        pp.id,
+        pp.raw_floor,
+        pp.raw_median,
+        pp.raw_ceiling,
+        t.matches_played,
+        t.boom_count,
+        t.bust_count,
+        t.pts_sum / nullif(t.pts_count, 0) as pts_avg,
+        -- Sample standard deviation: sqrt((sum of squares - sum^2 / n) / (n - 1))
+        if(
+            t.pts_count > 1,
+            sqrt(greatest((t.pts_sq_sum - t.pts_sum * t.pts_sum / t.pts_count) / (t.pts_count - 1), 0)),
+            null
+        ) as pts_stddev
+    from player_percentiles_deduped as pp
+    inner join {{ ref('int_player_running_totals') }} as t
+        on pp.as_of_round_id = t.as_of_round_id and pp.id = t.id
+    where {{ as_of_round_filter('t.as_of_round_id') }}
+),
+
 -- Blend player stats with position stats if < 10 matches
 blended_stats as (
     select
@@ -120,9 +133,12 @@ blended_stats as (
             when pp.matches_played >= 10 then 0.0
             else (10.0 - pp.matches_played) / 10.0
         end as blend_weight
-    from player_percentiles_deduped as pp
+    from player_stats as pp
     inner join {{ ref('int_baseline') }} as b
-        on pp.as_of_round_id = b.as_of_round_id and pp.id = b.id
+        on
+            pp.as_of_round_id = b.as_of_round_id
+            and pp.id = b.id
+            and {{ as_of_round_filter('b.as_of_round_id') }}
     left join position_stats_deduped as ps
         on pp.as_of_round_id = ps.as_of_round_id and b.position = ps.position
 )
@@ -8,63 +8,26 @@ Calculation:
 - Take all played matches (this season only, by as_of_round)
 - Assign decay weights: weight = (1-alpha)^match_age where match_age=0 for most recent
 - EWM = sum(points * weight) / sum(weight)
-- Alpha = 0.25 (standard value, higher = reacts faster)
+- Alpha = var('ewm_alpha'), default 0.25 (standard value, higher = reacts faster)
 
 Half-life with alpha=0.25: ~2.4 matches (after ~2-3 matches, old data is half as important)
-*/
-
-with all_rounds as (
-    select distinct round_id as as_of_round_id
-    from {{ ref('int_players') }}
-    where season = 2026
-),
-
--- All played matches per player with match age (0 = most recent)
-player_matches as (
-    select
-        r.as_of_round_id,
-        p.id,
-        p.pts_round,
-        p.has_played,
-        p.round_id,
-        row_number() over (
-            partition by r.as_of_round_id, p.id
-            order by p.round_id desc
-        ) - 1 as match_age  -- 0 = most recent, 1 = second most recent, etc.
-    from {{ ref('int_players') }} as p
-    cross join all_rounds as r
-    where
-        p.season = 2026
-        and p.round_id <= r.as_of_round_id
-        and p.has_played = true
-),
 
--- Calculate EWM with alpha = 0.25 (decay = 0.75)
--- Weight = (1 - alpha)^match_age = 0.75^match_age
-ewm_calc as (
-    select
-        as_of_round_id,
-        id,
-        pts_round,
-        match_age,
-        round_id,
-        pow(0.75, match_age) as weight,
-        pts_round * pow(0.75, match_age) as weighted_pts
-    from player_matches
-),
+The weighted sums are kept as a recursive running state in int_ewm_state (each round's
+state = previous state decayed by 1 - alpha, plus the new match), so no round re-weights
+the player's whole history.
+*/
 
--- Aggregate EWM per player
-ewm_agg as (
+with ewm_agg as (
     select
         as_of_round_id,
         id,
-        sum(weighted_pts) / sum(weight) as ewm_pts,
-        sum(weight) as total_weight,
-        count(*) as matches_used,
-        min(round_id) as oldest_round,
-        max(round_id) as newest_round
-    from ewm_calc
-    group by as_of_round_id, id
+        weighted_pts_sum / weight_sum as ewm_pts,
+        weight_sum as total_weight,
+        matches_used,
+        oldest_round,
+        newest_round
+    from {{ ref('int_ewm_state') }}
+    where {{ as_of_round_filter() }}
 )
 
 select
@@ -100,3 +63,4 @@ left join ewm_agg as e
     on
         b.as_of_round_id = e.as_of_round_id
         and b.id = e.id
+where {{ as_of_round_filter('b.as_of_round_id') }}
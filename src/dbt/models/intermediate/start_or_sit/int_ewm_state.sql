@@ -0,0 +1,99 @@
+/*
+EWM State: Running Exponentially Weighted Form
+
+Recursive running state behind int_ewm_form, one row per player per as_of_round.
+Each round's state is derived from the previous round's:
+  - player played:     weighted_pts_sum = decay * previous + points
+                       weight_sum       = decay * previous + 1
+  - player didn't play: state carried over unchanged
+with decay = 1 - alpha, alpha = var('ewm_alpha') (0.25 by default).
+
+ewm_pts = weighted_pts_sum / weight_sum, identical to weighting every played match by
+decay^match_age (match_age = 0 for the most recent).
+
+Incremental runs resume from the stored state of the round before the rebuilt range,
+so the latest round is a single-row update per player. A full build, or a change of
+alpha, replays the season from round 1 (see macros/ewm_state.sql).
+*/
+
+{%- set alpha = var('ewm_alpha') -%}
+{%- set resume_round = ewm_resume_round(alpha) -%}
+
+with recursive
+
+players as (
+    select distinct id
+    from {{ ref('int_players') }}
+    where season = 2026 and {{ as_of_round_filter('round_id', cumulative=true) }}
+),
+
+played_matches as (
+    select
+        id,
+        round_id,
+        coalesce(pts_round, 0) as pts_round
+    from {{ ref('int_players') }}
+    where
+        season = 2026
+        and has_played = true
+        and {{ as_of_round_filter('round_id', cumulative=true) }}
+),
+
+last_round as (
+    select max(round_id) as round_id
+    from {{ ref('int_players') }}
+    where season = 2026 and {{ as_of_round_filter('round_id', cumulative=true) }}
+),
+
+state as (
+    -- Anchor: stored state before the rebuilt rounds (empty before the season starts)
+    select
+        {{ resume_round or 0 }} as as_of_round_id,
+        pl.id,
+        {%- if resume_round %}
+            coalesce(prev.weighted_pts_sum, 0.0) as weighted_pts_sum,
+            coalesce(prev.weight_sum, 0.0) as weight_sum,
+            coalesce(prev.matches_used, 0) as matches_used,
+            prev.oldest_round,
+            prev.newest_round
+        {%- else %}
+            -- 0e0: a float literal in both dialects (DuckDB types 0.0 as a decimal)
+            0e0 as weighted_pts_sum,
+            0e0 as weight_sum,
+            0 as matches_used,
+            cast(null as int64) as oldest_round,
+            cast(null as int64) as newest_round
+        {%- endif %}
+    from players as pl
+    {%- if resume_round %}
+        left join {{ this }} as prev
+            on pl.id = prev.id and prev.as_of_round_id = {{ resume_round }}
+    {%- endif %}
+    union all
+    -- Step: decay the state and add the next round's match, if the player played it
+    select
+        s.as_of_round_id + 1 as as_of_round_id,
+        s.id,
+        if(m.id is null, s.weighted_pts_sum, (1 - {{ alpha }}) * s.weighted_pts_sum + m.pts_round) as weighted_pts_sum,
+        if(m.id is null, s.weight_sum, (1 - {{ alpha }}) * s.weight_sum + 1) as weight_sum,
+        s.matches_used + if(m.id is null, 0, 1) as matches_used,
+        coalesce(s.oldest_round, m.round_id) as oldest_round,
+        coalesce(m.round_id, s.newest_round) as newest_round
+    from state as s
+    cross join last_round as lr
+    left join played_matches as m
+        on s.id = m.id and m.round_id = s.as_of_round_id + 1
+    where s.as_of_round_id < lr.round_id
+)
+
+select
+    as_of_round_id,
+    id,
+    {{ alpha }} as ewm_alpha,
+    weighted_pts_sum,
+    weight_sum,
+    matches_used,
+    oldest_round,
+    newest_round
+from state
+where matches_used > 0 and as_of_round_id > {{ resume_round or 0 }}
@@ -16,13 +16,13 @@ Calculation:
 with all_rounds as (
     select distinct round_id as as_of_round_id
     from {{ ref('int_players') }}
-    where season = 2026
+    where season = 2026 and {{ as_of_round_filter('round_id') }}
 ),
 
 player_clubs as (
     select
         id as player_id,
-        any_value(club_id having max round_id) as club_id
+        {{ any_value_max_by('club_id', 'round_id') }} as club_id
     from {{ ref('int_players') }}
     where season = 2026
     group by id
@@ -50,21 +50,16 @@ next_match as (
 ),
 
 -- This season: avg points conceded per opponent per position (all matches up to as_of_round)
--- "conceding club" = the opponent that allowed the points
+-- "conceding club" = the opponent that allowed the points (see int_conceded_running_totals)
 conceded_this_season as (
     select
-        r.as_of_round_id,
-        p.opponent_id as conceding_club_id,
-        p.position,
-        avg(if(p.has_played, p.pts_round, null)) as pts_allowed_this_season_avg,
-        count(distinct if(p.has_played, p.round_id, null)) as matches_this_season
-    from {{ ref('int_players') }} as p
-    cross join all_rounds as r
-    where
-        p.season = 2026
-        and p.round_id <= r.as_of_round_id
-        and p.opponent_id is not null
-    group by r.as_of_round_id, p.opponent_id, p.position
+        as_of_round_id,
+        conceding_club_id,
+        position,
+        pts_sum / nullif(pts_count, 0) as pts_allowed_this_season_avg,
+        matches_played as matches_this_season
+    from {{ ref('int_conceded_running_totals') }}
+    where {{ as_of_round_filter() }}
 ),
 
 -- Last season: avg points conceded per opponent per position (full season 2025)
@@ -81,16 +76,14 @@ conceded_last_season as (
     group by p.opponent_id, p.position
 ),
 
--- League average points per position (this season up to each round)
+-- League average points per position (this season up to each round, see int_position_running_totals)
 league_avg_by_position as (
     select
-        r.as_of_round_id,
-        p.position,
-        avg(if(p.has_played, p.pts_round, null)) as league_avg_pts
-    from {{ ref('int_players') }} as p
-    cross join all_rounds as r
-    where p.season = 2026 and p.round_id <= r.as_of_round_id
-    group by r.as_of_round_id, p.position
+        as_of_round_id,
+        position,
+        pts_sum / nullif(pts_count, 0) as league_avg_pts
+    from {{ ref('int_position_running_totals') }}
+    where {{ as_of_round_filter() }}
 )
 
 select
@@ -171,3 +164,4 @@ left join league_avg_by_position as lap
     on
         b.as_of_round_id = lap.as_of_round_id
         and b.position = lap.position
+where {{ as_of_round_filter('b.as_of_round_id') }}
@@ -40,11 +40,21 @@ with with_multipliers as (
         end as venue_multiplier
     from {{ ref('int_baseline') }} as b
     left join {{ ref('int_ewm_form') }} as e
-        on b.as_of_round_id = e.as_of_round_id and b.id = e.id
+        on
+            b.as_of_round_id = e.as_of_round_id
+            and b.id = e.id
+            and {{ as_of_round_filter('e.as_of_round_id') }}
     left join {{ ref('int_home_away') }} as v
-        on b.as_of_round_id = v.as_of_round_id and b.id = v.id
+        on
+            b.as_of_round_id = v.as_of_round_id
+            and b.id = v.id
+            and {{ as_of_round_filter('v.as_of_round_id') }}
     left join {{ ref('int_map_mpap') }} as o
-        on b.as_of_round_id = o.as_of_round_id and b.id = o.id
+        on
+            b.as_of_round_id = o.as_of_round_id
+            and b.id = o.id
+            and {{ as_of_round_filter('o.as_of_round_id') }}
+    where {{ as_of_round_filter('b.as_of_round_id') }}
 )
 
 select
@@ -61,6 +61,13 @@ select
     b.baseline_pts - rl.replacement_level as par
 from {{ ref('int_baseline') }} as b
 left join {{ ref('int_home_away') }} as v
-    on b.as_of_round_id = v.as_of_round_id and b.id = v.id
+    on
+        b.as_of_round_id = v.as_of_round_id
+        and b.id = v.id
+        and {{ as_of_round_filter('v.as_of_round_id') }}
 left join {{ ref('int_replacement_levels') }} as rl
-    on b.as_of_round_id = rl.as_of_round_id and b.position = rl.position
+    on
+        b.as_of_round_id = rl.as_of_round_id
+        and b.position = rl.position
+        and {{ as_of_round_filter('rl.as_of_round_id') }}
+where {{ as_of_round_filter('b.as_of_round_id') }}
@@ -23,6 +23,13 @@ select
     b.baseline_pts - rl.replacement_level as par
 from {{ ref('int_form_trend') }} as f
 left join {{ ref('int_baseline') }} as b
-    on f.as_of_round_id = b.as_of_round_id and f.id = b.id
+    on
+        f.as_of_round_id = b.as_of_round_id
+        and f.id = b.id
+        and {{ as_of_round_filter('b.as_of_round_id') }}
 left join {{ ref('int_replacement_levels') }} as rl
-    on f.as_of_round_id = rl.as_of_round_id and f.position = rl.position
+    on
+        f.as_of_round_id = rl.as_of_round_id
+        and f.position = rl.position
+        and {{ as_of_round_filter('rl.as_of_round_id') }}
+where {{ as_of_round_filter('f.as_of_round_id') }}
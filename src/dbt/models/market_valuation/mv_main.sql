@@ -30,11 +30,23 @@ select
     end as availability
 from {{ ref('int_baseline') }} as b
 left join {{ ref('int_replacement_levels') }} as rl
-    on b.as_of_round_id = rl.as_of_round_id and b.position = rl.position
+    on
+        b.as_of_round_id = rl.as_of_round_id
+        and b.position = rl.position
+        and {{ as_of_round_filter('rl.as_of_round_id') }}
 left join {{ ref('int_ewm_form') }} as e
-    on b.as_of_round_id = e.as_of_round_id and b.id = e.id
+    on
+        b.as_of_round_id = e.as_of_round_id
+        and b.id = e.id
+        and {{ as_of_round_filter('e.as_of_round_id') }}
 left join {{ ref('int_regression') }} as reg
-    on b.as_of_round_id = reg.as_of_round_id and b.id = reg.id
+    on
+        b.as_of_round_id = reg.as_of_round_id
+        and b.id = reg.id
+        and {{ as_of_round_filter('reg.as_of_round_id') }}
 left join {{ ref('int_poe') }} as poe
-    on b.as_of_round_id = poe.as_of_round_id and b.id = poe.id
-where b.baseline_pts is not null
+    on
+        b.as_of_round_id = poe.as_of_round_id
+        and b.id = poe.id
+        and {{ as_of_round_filter('poe.as_of_round_id') }}
+where b.baseline_pts is not null and {{ as_of_round_filter('b.as_of_round_id') }}
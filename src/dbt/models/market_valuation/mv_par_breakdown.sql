@@ -27,5 +27,8 @@ select
     ) as par_rank_gen
 from {{ ref('int_baseline') }} as b
 inner join {{ ref('int_replacement_levels') }} as rl
-    on b.as_of_round_id = rl.as_of_round_id and b.position = rl.position
-where b.baseline_pts is not null
+    on
+        b.as_of_round_id = rl.as_of_round_id
+        and b.position = rl.position
+        and {{ as_of_round_filter('rl.as_of_round_id') }}
+where b.baseline_pts is not null and {{ as_of_round_filter('b.as_of_round_id') }}
@@ -23,4 +23,8 @@ select
     r.baseline_pts - rl.replacement_level as par
 from {{ ref('int_regression') }} as r
 left join {{ ref('int_replacement_levels') }} as rl
-    on r.as_of_round_id = rl.as_of_round_id and r.position = rl.position
+    on
+        r.as_of_round_id = rl.as_of_round_id
+        and r.position = rl.position
+        and {{ as_of_round_filter('rl.as_of_round_id') }}
+where {{ as_of_round_filter('r.as_of_round_id') }}
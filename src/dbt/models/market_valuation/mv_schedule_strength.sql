@@ -9,21 +9,13 @@ an easier upcoming schedule.
   - Away:    next 5 away matches
 */
 
-with all_rounds as (
-    select distinct round_id as as_of_round_id
-    from {{ ref('int_players') }}
-    where season = 2026
-),
-
-league_avg_by_position as (
+with league_avg_by_position as (
     select
-        r.as_of_round_id,
-        p.position,
-        avg(if(p.has_played, p.pts_round, null)) as league_avg_pts
-    from {{ ref('int_players') }} as p
-    cross join all_rounds as r
-    where p.season = 2026 and p.round_id <= r.as_of_round_id
-    group by r.as_of_round_id, p.position
+        as_of_round_id,
+        position,
+        pts_sum / nullif(pts_count, 0) as league_avg_pts
+    from {{ ref('int_position_running_totals') }}
+    where {{ as_of_round_filter() }}
 )
 
 select
@@ -62,9 +54,15 @@ select
     end as schedule_strength_away_ratio
 from {{ ref('int_baseline') }} as b
 inner join {{ ref('int_schedule_strength') }} as ss
-    on b.as_of_round_id = ss.as_of_round_id and b.id = ss.id
+    on
+        b.as_of_round_id = ss.as_of_round_id
+        and b.id = ss.id
+        and {{ as_of_round_filter('ss.as_of_round_id') }}
 inner join {{ ref('int_replacement_levels') }} as rl
-    on b.as_of_round_id = rl.as_of_round_id and b.position = rl.position
+    on
+        b.as_of_round_id = rl.as_of_round_id
+        and b.position = rl.position
+        and {{ as_of_round_filter('rl.as_of_round_id') }}
 left join league_avg_by_position as lap
     on b.as_of_round_id = lap.as_of_round_id and b.position = lap.position
-where b.baseline_pts is not null
+where b.baseline_pts is not null and {{ as_of_round_filter('b.as_of_round_id') }}
@@ -32,11 +32,23 @@ select
     coalesce(ga.ga_share, 0) as ga_dependency
 from {{ ref('int_baseline') }} as b
 inner join {{ ref('int_replacement_levels') }} as rl
-    on b.as_of_round_id = rl.as_of_round_id and b.position = rl.position
+    on
+        b.as_of_round_id = rl.as_of_round_id
+        and b.position = rl.position
+        and {{ as_of_round_filter('rl.as_of_round_id') }}
 left join {{ ref('int_distribution_stats') }} as d
-    on b.as_of_round_id = d.as_of_round_id and b.id = d.id
+    on
+        b.as_of_round_id = d.as_of_round_id
+        and b.id = d.id
+        and {{ as_of_round_filter('d.as_of_round_id') }}
 left join {{ ref('int_ga_dependency') }} as ga
-    on b.as_of_round_id = ga.as_of_round_id and b.id = ga.id
+    on
+        b.as_of_round_id = ga.as_of_round_id
+        and b.id = ga.id
+        and {{ as_of_round_filter('ga.as_of_round_id') }}
 left join {{ ref('int_poe') }} as poe
-    on b.as_of_round_id = poe.as_of_round_id and b.id = poe.id
-where b.baseline_pts is not null
+    on
+        b.as_of_round_id = poe.as_of_round_id
+        and b.id = poe.id
+        and {{ as_of_round_filter('poe.as_of_round_id') }}
+where b.baseline_pts is not null and {{ as_of_round_filter('b.as_of_round_id') }}
@@ -1,9 +1,9 @@
 /*
 Scouting Mart: Last Match Performance
 
-Thin mart over int_sct_last_1_stats.
+Thin mart over the last_1 window of int_sct_window_stats.
 Adds ADP rankings (row_number by DVS) and G/A contribution.
-All complex logic lives in the intermediate model.
+All complex logic (windowing, z-scores, DVS) lives in the intermediate model.
 */
 
 with goal_points as (
@@ -106,4 +106,5 @@ select
     row_number() over (partition by as_of_round_id, position order by dvs_pos_base desc nulls last) as adp_pos_base,
     row_number() over (partition by as_of_round_id order by dvs_gen_avg desc nulls last) as adp_gen_avg,
     row_number() over (partition by as_of_round_id order by dvs_gen_base desc nulls last) as adp_gen_base
-from {{ ref('int_sct_last_1_stats') }}
+from {{ ref('int_sct_window_stats') }}
+where scouting_window = 'last_1' and {{ as_of_round_filter('as_of_round_id') }}
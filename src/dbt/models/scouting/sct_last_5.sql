@@ -1,7 +1,7 @@
 /*
 Scouting Mart: Last 5 Matches
 
-Thin mart over int_sct_last_5_stats.
+Thin mart over the last_5 window of int_sct_window_stats.
 Adds ADP rankings (row_number by DVS) and G/A contribution.
 All complex logic (windowing, z-scores, DVS) lives in the intermediate model.
 */
@@ -106,4 +106,5 @@ select
     row_number() over (partition by as_of_round_id, position order by dvs_pos_base desc nulls last) as adp_pos_base,
     row_number() over (partition by as_of_round_id order by dvs_gen_avg desc nulls last) as adp_gen_avg,
     row_number() over (partition by as_of_round_id order by dvs_gen_base desc nulls last) as adp_gen_base
-from {{ ref('int_sct_last_5_stats') }}
+from {{ ref('int_sct_window_stats') }}
+where scouting_window = 'last_5' and {{ as_of_round_filter('as_of_round_id') }}
@@ -1,7 +1,8 @@
+{{ config(materialized='table', partition_by=none) }}
 /*
 Scouting Mart: Last Season (2025)
 
-Thin mart over int_sct_last_season_stats.
+Thin mart over the last_season window of int_sct_window_stats.
 Adds ADP rankings (row_number by DVS) and G/A contribution.
 No as_of_round_id dimension since this covers the entire previous season.
 */
@@ -105,4 +106,5 @@ select
     row_number() over (partition by position order by dvs_pos_base desc nulls last) as adp_pos_base,
     row_number() over (order by dvs_gen_avg desc nulls last) as adp_gen_avg,
     row_number() over (order by dvs_gen_base desc nulls last) as adp_gen_base
-from {{ ref('int_sct_last_season_stats') }}
+from {{ ref('int_sct_window_stats') }}
+where scouting_window = 'last_season'
@@ -21,8 +21,18 @@ select
     mv.regression_score
 from {{ ref('int_map_score') }} as s
 left join {{ ref('ss_main') }} as ss
-    on s.as_of_round_id = ss.as_of_round_id and s.id = ss.player_id
+    on
+        s.as_of_round_id = ss.as_of_round_id
+        and s.id = ss.player_id
+        and {{ as_of_round_filter('ss.as_of_round_id') }}
 left join {{ ref('ss_map_breakdown') }} as mb
-    on s.as_of_round_id = mb.as_of_round_id and s.id = mb.player_id
+    on
+        s.as_of_round_id = mb.as_of_round_id
+        and s.id = mb.player_id
+        and {{ as_of_round_filter('mb.as_of_round_id') }}
 left join {{ ref('mv_main') }} as mv
-    on s.as_of_round_id = mv.as_of_round_id and s.id = mv.player_id
+    on
+        s.as_of_round_id = mv.as_of_round_id
+        and s.id = mv.player_id
+        and {{ as_of_round_filter('mv.as_of_round_id') }}
+where {{ as_of_round_filter('s.as_of_round_id') }}
@@ -0,0 +1,7 @@
+select
+    temporada as season,
+    rodada_id as round_id,
+    atleta_id as id,
+    lower(scout_code) as scout_code,
+    count as scout_count
+from {{ source('cartola', 'raw_player_round_scouts') }}
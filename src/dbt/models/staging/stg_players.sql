@@ -1,3 +1,9 @@
+{#- Legacy seeds hold one flat column per scout; the API nests them in a scout record -#}
+{%- set legacy_scout = {} -%}
+{%- for code in ['gc', 'v', 'ps', 'ff', 'sg', 'dp', 'ft', 'cv', 'gs', 'fs', 'i', 'pc', 'ca', 'de', 'g', 'fd', 'a', 'pp', 'fc', 'ds'] -%}
+    {%- do legacy_scout.update({code: 'cast(' ~ code ~ ' as int64)'}) -%}
+{%- endfor %}
+
 with raw_players_etl as (
     select
         temporada as season,
@@ -26,29 +32,8 @@ raw_players_legacy_2025 as (
         media_num as pts_avg,
         entrou_em_campo as has_played,
         jogos_num as matches_played,
-        struct(
-            cast(gc as int64) as gc,
-            cast(v as int64) as v,
-            cast(ps as int64) as ps,
-            cast(ff as int64) as ff,
-            cast(sg as int64) as sg,
-            cast(dp as int64) as dp,
-            cast(ft as int64) as ft,
-            cast(cv as int64) as cv,
-            cast(gs as int64) as gs,
-            cast(fs as int64) as fs,
-            cast(i as int64) as i,
-            cast(pc as int64) as pc,
-            cast(ca as int64) as ca,
-            cast(de as int64) as de,
-            cast(g as int64) as g,
-            cast(fd as int64) as fd,
-            cast(a as int64) as a,
-            cast(pp as int64) as pp,
-            cast(fc as int64) as fc,
-            cast(ds as int64) as ds
-        ) as scout
-    from {{ ref('raw_players_legacy_2025') }}
+        {{ make_struct(legacy_scout) }} as scout
+    from {{ source('cartola', 'raw_players_legacy_2025') }}
 ),
 
 raw_players_legacy_2026 as (
@@ -63,28 +48,7 @@ raw_players_legacy_2026 as (
         media_num as pts_avg,
         entrou_em_campo as has_played,
         jogos_num as matches_played,
-        struct(
-            cast(gc as int64) as gc,
-            cast(v as int64) as v,
-            cast(ps as int64) as ps,
-            cast(ff as int64) as ff,
-            cast(sg as int64) as sg,
-            cast(dp as int64) as dp,
-            cast(ft as int64) as ft,
-            cast(cv as int64) as cv,
-            cast(gs as int64) as gs,
-            cast(fs as int64) as fs,
-            cast(i as int64) as i,
-            cast(pc as int64) as pc,
-            cast(ca as int64) as ca,
-            cast(de as int64) as de,
-            cast(g as int64) as g,
-            cast(fd as int64) as fd,
-            cast(a as int64) as a,
-            cast(pp as int64) as pp,
-            cast(fc as int64) as fc,
-            cast(ds as int64) as ds
-        ) as scout
+        {{ make_struct(legacy_scout) }} as scout
     from {{ ref('raw_players_legacy_2026') }}
 ),
 
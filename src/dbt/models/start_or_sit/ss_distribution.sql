@@ -25,4 +25,8 @@ select
     m.map_score
 from {{ ref('int_distribution_stats') }} as d
 left join {{ ref('int_map_score') }} as m
-    on d.as_of_round_id = m.as_of_round_id and d.id = m.id
+    on
+        d.as_of_round_id = m.as_of_round_id
+        and d.id = m.id
+        and {{ as_of_round_filter('m.as_of_round_id') }}
+where {{ as_of_round_filter('d.as_of_round_id') }}
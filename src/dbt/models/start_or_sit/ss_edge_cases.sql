@@ -1,3 +1,4 @@
+{{ config(materialized='table', partition_by=none) }}
 /*
 Start or Sit: Edge Cases & Missing Data (Subtab)
 
@@ -28,6 +28,13 @@ select
     m.map_score
 from {{ ref('int_baseline') }} as b
 left join {{ ref('int_home_away') }} as v
-    on b.as_of_round_id = v.as_of_round_id and b.id = v.id
+    on
+        b.as_of_round_id = v.as_of_round_id
+        and b.id = v.id
+        and {{ as_of_round_filter('v.as_of_round_id') }}
 left join {{ ref('int_map_score') }} as m
-    on b.as_of_round_id = m.as_of_round_id and b.id = m.id
+    on
+        b.as_of_round_id = m.as_of_round_id
+        and b.id = m.id
+        and {{ as_of_round_filter('m.as_of_round_id') }}
+where {{ as_of_round_filter('b.as_of_round_id') }}
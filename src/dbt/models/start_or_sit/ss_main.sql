@@ -21,6 +21,13 @@ select
     m.is_home_next
 from {{ ref('int_map_score') }} as m
 left join {{ ref('int_distribution_stats') }} as d
-    on m.as_of_round_id = d.as_of_round_id and m.id = d.id
+    on
+        m.as_of_round_id = d.as_of_round_id
+        and m.id = d.id
+        and {{ as_of_round_filter('d.as_of_round_id') }}
 left join {{ ref('int_poe') }} as poe
-    on m.as_of_round_id = poe.as_of_round_id and m.id = poe.id
+    on
+        m.as_of_round_id = poe.as_of_round_id
+        and m.id = poe.id
+        and {{ as_of_round_filter('poe.as_of_round_id') }}
+where {{ as_of_round_filter('m.as_of_round_id') }}
@@ -26,4 +26,8 @@ select
     m.map_rank_gen
 from {{ ref('int_map_score') }} as m
 left join {{ ref('int_poe') }} as poe
-    on m.as_of_round_id = poe.as_of_round_id and m.id = poe.id
+    on
+        m.as_of_round_id = poe.as_of_round_id
+        and m.id = poe.id
+        and {{ as_of_round_filter('poe.as_of_round_id') }}
+where {{ as_of_round_filter('m.as_of_round_id') }}
@@ -1,3 +1,4 @@
+{{ config(cluster_by=none if target.type == 'duckdb' else ['position', 'opponent_club']) }}
 /*
 Start or Sit: Opponent & MPAP Debug (Subtab)
 
@@ -21,6 +22,7 @@ select
     o.as_of_round_id as last_updated_round
 from {{ ref('int_map_mpap') }} as o
 left join {{ ref('stg_clubs') }} as oc on o.opponent_id = oc.id
+where {{ as_of_round_filter('o.as_of_round_id') }}
 -- Deduplicate: show one row per opponent-position-round (not per player)
 qualify row_number() over (
     partition by o.as_of_round_id, o.opponent_id, o.position
@@ -1,3 +1,8 @@
+{{ config(
+    partition_by=none if target.type == 'duckdb'
+        else {'field': 'round', 'data_type': 'int64', 'range': {'start': 1, 'end': 39, 'interval': 1}},
+    unique_key='round',
+) }}
 /*
 Start or Sit: Round-by-Round Raw (Subtab)
 
@@ -42,3 +47,4 @@ select
     scout_i,
     scout_pp
 from {{ ref('int_round_by_round') }}
+where {{ as_of_round_filter('round', partition='round') }}
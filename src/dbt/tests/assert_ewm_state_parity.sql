@@ -0,0 +1,55 @@
+/*
+EWM state parity: the recursive running state in int_ewm_state must match the
+direct definition, weighting every played match by (1 - alpha)^match_age
+(match_age = 0 for the most recent), with the alpha stored in the state.
+
+Checked on the latest as_of_round only, which covers every played match of the season.
+Returns the players whose ewm_pts or matches_used differ.
+*/
+
+with latest_round as (
+    select
+        max(as_of_round_id) as as_of_round_id,
+        any_value(ewm_alpha) as ewm_alpha
+    from {{ ref('int_ewm_state') }}
+),
+
+latest_state as (
+    select s.*
+    from {{ ref('int_ewm_state') }} as s
+    inner join latest_round as lr on s.as_of_round_id = lr.as_of_round_id
+),
+
+played_matches as (
+    select
+        p.id,
+        lr.ewm_alpha,
+        coalesce(p.pts_round, 0) as pts_round,
+        row_number() over (partition by p.id order by p.round_id desc) - 1 as match_age
+    from {{ ref('int_players') }} as p
+    inner join latest_round as lr on p.round_id <= lr.as_of_round_id
+    where p.season = 2026 and p.has_played = true
+),
+
+direct_ewm as (
+    select
+        id,
+        sum(pts_round * pow(1 - ewm_alpha, match_age)) / sum(pow(1 - ewm_alpha, match_age)) as ewm_pts,
+        count(*) as matches_used
+    from played_matches
+    group by id
+)
+
+select
+    s.id,
+    s.weighted_pts_sum / s.weight_sum as state_ewm_pts,
+    d.ewm_pts as direct_ewm_pts,
+    s.matches_used as state_matches_used,
+    d.matches_used as direct_matches_used
+from latest_state as s
+full outer join direct_ewm as d on s.id = d.id
+where
+    s.id is null
+    or d.id is null
+    or abs(s.weighted_pts_sum / s.weight_sum - d.ewm_pts) > 1e-6
+    or s.matches_used != d.matches_used
@@ -0,0 +1,51 @@
+/*
+App-facing marts must be partitioned and clustered for the app's queries.
+
+Every model under models/scouting, start_or_sit, market_valuation and squad_and_team
+needs:
+  - int64 range partitioning on its round column (as_of_round_id, or round for the
+    round-by-round marts), so `where as_of_round_id = N` / `round <= N` prunes
+  - clustering led by position (position, club, player_id by default)
+
+Snapshot marts without a round dimension are listed in `unpartitioned` and only need
+the clustering. Returns one row per mart missing either. Skipped on DuckDB, which has
+neither (the configs are unset on that target).
+*/
+
+{%- set mart_folders = ['scouting', 'start_or_sit', 'market_valuation', 'squad_and_team'] -%}
+{%- set round_columns = ['as_of_round_id', 'round'] -%}
+{%- set unpartitioned = ['sct_last_season', 'ss_edge_cases'] -%}
+
+{%- set problems = [] -%}
+{%- if execute and target.type != 'duckdb' -%}
+    {%- for node in graph.nodes.values() if node.resource_type == 'model' and node.fqn[1] in mart_folders -%}
+        {%- set partition_by = node.config.get('partition_by') -%}
+        {%- set cluster_by = node.config.get('cluster_by') -%}
+        {%- set cluster_by = [cluster_by] if cluster_by is string else (cluster_by or []) -%}
+        {%- if node.name not in unpartitioned and not (
+            partition_by
+            and partition_by.get('field') in round_columns
+            and partition_by.get('data_type') == 'int64'
+            and partition_by.get('range')
+        ) -%}
+            {%- do problems.append((node.name, 'not partitioned by an int64 range on its round column')) -%}
+        {%- endif -%}
+        {%- if not cluster_by or cluster_by[0] != 'position' -%}
+            {%- do problems.append((node.name, 'not clustered by position, club, player_id')) -%}
+        {%- endif -%}
+    {%- endfor -%}
+{%- endif %}
+
+{% if problems -%}
+{%- set problem_rows = [] -%}
+{%- for model_name, problem in problems -%}
+    {%- do problem_rows.append({'model_name': model_name, 'problem': problem}) -%}
+{%- endfor -%}
+select *
+from {{ struct_rows(problem_rows) }}
+{%- else -%}
+select
+    cast(null as {{ dbt.type_string() }}) as model_name,
+    cast(null as {{ dbt.type_string() }}) as problem
+limit 0
+{%- endif %}
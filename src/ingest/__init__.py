@@ -0,0 +1,12 @@
+"""Cartola ingestion: market payload -> Parquet bundle -> BigQuery loads per dataset.
+
+Replaces the curl/jq/bq steps of the daily pipeline (``uv run ingest``):
+
+  - sources: where the payload comes from (Cartola API, any base URL such as a
+    local fixture server, or a round of the legacy CSVs)
+  - market: streaming parser and typed schemas of the raw tables
+  - bundle: content-addressed Parquet bundle of one fetch
+  - load: Parquet files and BigQuery load jobs
+  - profiling: wall time, CPU, peak memory, rows and bytes per pipeline stage
+  - pipeline: the stages wired together
+"""
@@ -0,0 +1,112 @@
+"""Content-addressed Parquet bundles: one fetch, loaded into any number of datasets.
+
+A bundle is a directory named after the digest of its contents, holding one
+Parquet file per table and a ``manifest.json`` with the rows of each table and
+the digest of each entity: the players of each round, the clubs, the positions
+and the schedule. Tables are put in key order before hashing, so the same
+snapshot served in another order gets the same digests, and a digest match
+means there is nothing new to load.
+"""
+
+import hashlib
+import json
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from ingest.load import APPENDED_TABLES, write_parquet
+
+# Hex characters of a digest kept (also the longest value a BigQuery label takes)
+DIGEST_CHARS = 32
+
+# Row order of each table in a bundle
+ORDER_BY = {
+    "raw_players_etl": ("temporada", "rodada_id", "atleta_id"),
+    "raw_clubs": ("id",),
+    "raw_positions": ("id",),
+    "raw_schedule": ("season", "match_id"),
+}
+
+
+@dataclass(frozen=True)
+class Bundle:
+    """A written bundle: its digest, directory, table rows and entity digests."""
+
+    digest: str
+    directory: Path
+    rows: dict[str, int]
+    digests: dict[str, str]
+
+    def path(self, name: str) -> Path:
+        """Return the Parquet file of a table."""
+        return self.directory / f"{name}.parquet"
+
+    def entities(self, name: str) -> dict[str, str]:
+        """Return the digests of a table's entities (one per round for players)."""
+        return {
+            entity: digest
+            for entity, digest in self.digests.items()
+            if entity == name or entity.startswith(f"{name}-")
+        }
+
+
+def table_digest(table: pa.Table) -> str:
+    """Hash a table's schema and rows (as an Arrow IPC stream)."""
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table.combine_chunks())
+    return hashlib.sha256(sink.getvalue()).hexdigest()[:DIGEST_CHARS]
+
+
+def entity_digests(name: str, table: pa.Table) -> dict[str, str]:
+    """Hash a table as a whole, or round by round (``<name>-<season>-<round>``)."""
+    if name not in APPENDED_TABLES:
+        return {name: table_digest(table)}
+    rounds = pc.binary_join_element_wise(
+        table["temporada"].cast(pa.string()),
+        table["rodada_id"].cast(pa.string()),
+        "-",
+    )
+    return {
+        f"{name}-{season_round}": table_digest(
+            table.filter(pc.equal(rounds, season_round))
+        )
+        for season_round in pc.unique(rounds).to_pylist()
+    }
+
+
+def write_bundle(tables: dict[str, pa.Table], root: Path) -> Bundle:
+    """Write the tables as a bundle under ``root`` (reused if already there)."""
+    tables = {
+        name: table.sort_by([(column, "ascending") for column in ORDER_BY[name]])
+        for name, table in tables.items()
+    }
+    digests = {
+        entity: digest
+        for name, table in tables.items()
+        for entity, digest in entity_digests(name, table).items()
+    }
+    digest = hashlib.sha256(json.dumps(digests, sort_keys=True).encode()).hexdigest()[
+        :DIGEST_CHARS
+    ]
+    rows = {name: table.num_rows for name, table in tables.items()}
+    bundle = Bundle(digest, root / digest, rows, digests)
+    if bundle.directory.exists():
+        return bundle
+
+    # Written next to its final place and renamed, so a bundle is never partial
+    root.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=root, prefix=".tmp-"))
+    try:
+        for name, table in tables.items():
+            write_parquet(table, staging / f"{name}.parquet")
+        manifest = {"digest": digest, "rows": rows, "entities": digests}
+        (staging / "manifest.json").write_text(json.dumps(manifest, indent=2))
+        staging.rename(bundle.directory)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return bundle
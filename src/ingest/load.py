@@ -0,0 +1,342 @@
+"""Parquet files and BigQuery load jobs for the raw tables.
+
+Each table is written once as Parquet and sent in a single load job, typed by
+the file's schema instead of JSON autodetect. ``raw_players_etl`` and
+``raw_player_round_scouts`` are appended through a MERGE on their key, so a
+rerun or a retried load never duplicates an athlete-round; the other tables
+are replaced.
+
+Athlete-rounds already loaded are also dropped before the upload. Their keys
+are read for the payload's season and rounds only and packed into one int64
+each, so the check is a hash lookup per row whatever the table's history.
+"""
+
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from google.api_core.exceptions import NotFound
+from google.cloud import bigquery
+
+from ingest.market import PLAYER_KEY
+
+# Tables appended to (merged on these columns), keeping earlier rounds; every
+# other table is replaced
+APPENDED_TABLES = {
+    "raw_players_etl": PLAYER_KEY,
+    "raw_player_round_scouts": (*PLAYER_KEY, "scout_code"),
+}
+
+# Low bits of a packed key taken by the athlete id and the round (season above)
+ATHLETE_BITS = 32
+ROUND_BITS = 8
+
+# Appended tables are loaded here first, then merged into the table
+STAGING_SUFFIX = "__staging"
+
+# Dataset labels holding the digests of the last bundle loaded into it and of
+# each of its entities (``ingest-raw_clubs``, ``ingest-raw_players_etl-2026-12``)
+BUNDLE_LABEL = "ingest_bundle"
+ENTITY_LABEL_PREFIX = "ingest-"
+
+# Dataset labels holding, per season, the last round whose per-round scouts
+# were computed (``scouted-2026: 12``); rounds without a nonzero scout leave no
+# rows in ``raw_player_round_scouts``, so the table alone cannot tell
+SCOUTED_LABEL_PREFIX = "scouted-"
+
+
+def write_parquet(table: pa.Table, path: Path) -> int:
+    """Write a table as Parquet and return the file size in bytes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, path)
+    return path.stat().st_size
+
+
+def pack_keys(keys: pa.Table) -> pa.Array:
+    """Pack each ``(temporada, rodada_id, atleta_id)`` row into one int64."""
+    season, round_id, athlete = (keys[name].cast(pa.int64()) for name in PLAYER_KEY)
+    return pc.add_checked(
+        pc.add_checked(
+            pc.multiply_checked(season, 1 << (ROUND_BITS + ATHLETE_BITS)),
+            pc.multiply_checked(round_id, 1 << ATHLETE_BITS),
+        ),
+        athlete,
+    ).combine_chunks()
+
+
+def loaded_player_keys(
+    client: bigquery.Client, table_id: str, season: int, rounds: list[int]
+) -> pa.Array:
+    """Return the packed keys already loaded for a season's rounds.
+
+    Only the given rounds are read. Empty when the table does not exist yet.
+    """
+    try:
+        client.get_table(table_id)
+    except NotFound:
+        return pa.array([], pa.int64())
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("season", "INT64", season),
+            bigquery.ArrayQueryParameter("rounds", "INT64", rounds),
+        ]
+    )
+    keys = client.query(
+        f"""
+        SELECT DISTINCT temporada, rodada_id, atleta_id
+        FROM `{table_id}`
+        WHERE temporada = @season AND rodada_id IN UNNEST(@rounds)
+        """,  # noqa: S608
+        job_config=job_config,
+    ).to_arrow()
+    return pack_keys(keys)
+
+
+def scout_totals(
+    client: bigquery.Client, table_id: str, season: int, round_id: int
+) -> dict[tuple[int, str], int]:
+    """Return each athlete's season scouts before a round, from the stored deltas.
+
+    Keyed by ``(atleta_id, scout_code)``. Empty when the table does not exist yet.
+    """
+    try:
+        client.get_table(table_id)
+    except NotFound:
+        return {}
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("season", "INT64", season),
+            bigquery.ScalarQueryParameter("round_id", "INT64", round_id),
+        ]
+    )
+    rows = client.query(
+        f"""
+        SELECT atleta_id, scout_code, SUM(count) AS count
+        FROM `{table_id}`
+        WHERE temporada = @season AND rodada_id < @round_id
+        GROUP BY atleta_id, scout_code
+        """,  # noqa: S608
+        job_config=job_config,
+    ).result()
+    return {(row.atleta_id, row.scout_code): row["count"] for row in rows}
+
+
+def stored_rounds(
+    client: bigquery.Client, table_id: str, season: int, round_id: int
+) -> set[int]:
+    """Return the rounds of a season before ``round_id`` that a table holds rows of.
+
+    Empty when the table does not exist yet.
+    """
+    try:
+        client.get_table(table_id)
+    except NotFound:
+        return set()
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("season", "INT64", season),
+            bigquery.ScalarQueryParameter("round_id", "INT64", round_id),
+        ]
+    )
+    rows = client.query(
+        f"""
+        SELECT DISTINCT rodada_id
+        FROM `{table_id}`
+        WHERE temporada = @season AND rodada_id < @round_id
+        """,  # noqa: S608
+        job_config=job_config,
+    ).result()
+    return {row.rodada_id for row in rows}
+
+
+def drop_loaded(players: pa.Table, loaded: pa.Array) -> pa.Table:
+    """Drop the athlete-rounds whose packed key is in ``loaded``."""
+    if len(loaded) == 0:
+        return players
+    return players.filter(pc.invert(pc.is_in(pack_keys(players), value_set=loaded)))
+
+
+def load_parquet(
+    client: bigquery.Client, table_id: str, path: Path, *, replace: bool = False
+) -> int:
+    """Load a Parquet file into a table and return the rows it added.
+
+    Replaced tables (or any table with ``replace``) take one load job. Appended
+    tables are loaded into a staging table and merged on their key (a first
+    load creates the table).
+    """
+    key = APPENDED_TABLES.get(table_id.rsplit(".", 1)[-1])
+    if key is None or replace:
+        return _load(client, table_id, path, bigquery.WriteDisposition.WRITE_TRUNCATE)
+    try:
+        target = client.get_table(table_id)
+    except NotFound:
+        return _load(client, table_id, path, bigquery.WriteDisposition.WRITE_EMPTY)
+
+    staging_id = f"{table_id}{STAGING_SUFFIX}"
+    try:
+        _load(client, staging_id, path, bigquery.WriteDisposition.WRITE_TRUNCATE)
+        staging = client.get_table(staging_id)
+        _add_missing_fields(client, target, staging)
+        return _merge(
+            client, table_id, staging_id, target.schema, staging.schema, key=key
+        )
+    finally:
+        client.delete_table(staging_id, not_found_ok=True)
+
+
+def _load(
+    client: bigquery.Client, table_id: str, path: Path, write_disposition: str
+) -> int:
+    """Run one Parquet load job and return the rows loaded."""
+    job_config = bigquery.LoadJobConfig(
+        source_format=bigquery.SourceFormat.PARQUET,
+        write_disposition=write_disposition,
+    )
+    with path.open("rb") as file:
+        job = client.load_table_from_file(file, table_id, job_config=job_config)
+    job.result()
+    return job.output_rows
+
+
+def _with_fields(
+    target: list[bigquery.SchemaField], staging: list[bigquery.SchemaField]
+) -> list[bigquery.SchemaField]:
+    """Return ``target`` plus the fields only ``staging`` has, in records too."""
+    staged = {field.name: field for field in staging}
+    fields = []
+    for field in target:
+        other = staged.get(field.name)
+        if field.field_type == "RECORD" and other is not None and other.fields:
+            subfields = _with_fields(list(field.fields), list(other.fields))
+            if len(subfields) > len(field.fields):
+                field = bigquery.SchemaField(  # noqa: PLW2901
+                    field.name,
+                    field.field_type,
+                    mode=field.mode,
+                    description=field.description,
+                    fields=subfields,
+                )
+        fields.append(field)
+    names = {field.name for field in target}
+    return [*fields, *(field for field in staging if field.name not in names)]
+
+
+def _add_missing_fields(
+    client: bigquery.Client, target: bigquery.Table, staging: bigquery.Table
+) -> None:
+    """Add to ``target`` the columns (and record fields) only ``staging`` has."""
+    schema = _with_fields(target.schema, staging.schema)
+    if schema != target.schema:
+        target.schema = schema
+        client.update_table(target, ["schema"])
+
+
+def _by_name(
+    expr: str, field: bigquery.SchemaField, staged: bigquery.SchemaField | None
+) -> str:
+    """Return the staged value ``expr`` as a value of the target ``field``.
+
+    BigQuery assigns STRUCT values by position, so records are rebuilt field by
+    field in the target's order; fields the staged record lacks are NULL.
+    """
+    if staged is None:
+        return f"CAST(NULL AS {field.to_standard_sql().type.type_kind.name})"
+    if field.field_type != "RECORD" or field.mode == "REPEATED":
+        return expr
+    staged_fields = {sub.name: sub for sub in staged.fields}
+    subfields = ", ".join(
+        f"{_by_name(f'{expr}.`{sub.name}`', sub, staged_fields.get(sub.name))}"
+        f" AS `{sub.name}`"
+        for sub in field.fields
+    )
+    return f"IF({expr} IS NULL, NULL, STRUCT({subfields}))"
+
+
+def _merge(  # noqa: PLR0913
+    client: bigquery.Client,
+    table_id: str,
+    staging_id: str,
+    schema: list[bigquery.SchemaField],
+    staging_schema: list[bigquery.SchemaField],
+    *,
+    key: tuple[str, ...],
+) -> int:
+    """Insert the staging rows whose ``key`` is not in the table (``schema``) yet."""
+    staged = {field.name: field for field in staging_schema}
+    fields = [field for field in schema if field.name in staged]
+    columns = ", ".join(f"`{field.name}`" for field in fields)
+    values = ", ".join(
+        _by_name(f"staged.`{field.name}`", field, staged[field.name])
+        for field in fields
+    )
+    on = " AND ".join(f"target.{name} = staged.{name}" for name in key)
+    job = client.query(
+        f"""
+        MERGE `{table_id}` AS target
+        USING `{staging_id}` AS staged
+        ON {on}
+        WHEN NOT MATCHED THEN INSERT ({columns}) VALUES ({values})
+        """  # noqa: S608
+    )
+    job.result()
+    return job.num_dml_affected_rows or 0
+
+
+def loaded_digests(
+    client: bigquery.Client, dataset: str
+) -> tuple[str | None, dict[str, str]]:
+    """Return the digests of the last bundle loaded into a dataset and its entities."""
+    labels = client.get_dataset(dataset).labels
+    entities = {
+        key.removeprefix(ENTITY_LABEL_PREFIX): value
+        for key, value in labels.items()
+        if key.startswith(ENTITY_LABEL_PREFIX)
+    }
+    return labels.get(BUNDLE_LABEL), entities
+
+
+def mark_loaded(
+    client: bigquery.Client, dataset: str, digest: str, entities: dict[str, str]
+) -> None:
+    """Record a bundle and its entities as loaded into a dataset (as labels).
+
+    Entity labels the bundle does not have (e.g. earlier rounds) are removed.
+    """
+    ds = client.get_dataset(dataset)
+    stale = {
+        key: None
+        for key in ds.labels
+        if key.startswith(ENTITY_LABEL_PREFIX)
+        and key.removeprefix(ENTITY_LABEL_PREFIX) not in entities
+    }
+    ds.labels = {
+        **stale,
+        BUNDLE_LABEL: digest,
+        **{
+            f"{ENTITY_LABEL_PREFIX}{entity}": entity_digest
+            for entity, entity_digest in entities.items()
+        },
+    }
+    client.update_dataset(ds, ["labels"])
+
+
+def scouted_rounds(client: bigquery.Client, dataset: str) -> dict[int, int]:
+    """Return, per season, the last round whose scouts a dataset holds."""
+    labels = client.get_dataset(dataset).labels
+    return {
+        int(key.removeprefix(SCOUTED_LABEL_PREFIX)): int(value)
+        for key, value in labels.items()
+        if key.startswith(SCOUTED_LABEL_PREFIX)
+    }
+
+
+def mark_scouted(client: bigquery.Client, dataset: str, rounds: dict[int, int]) -> None:
+    """Record the last round whose scouts were loaded, per season (as labels)."""
+    ds = client.get_dataset(dataset)
+    ds.labels = {
+        f"{SCOUTED_LABEL_PREFIX}{season}": str(round_id)
+        for season, round_id in rounds.items()
+    }
+    client.update_dataset(ds, ["labels"])
@@ -0,0 +1,211 @@
+"""Cartola ``/atletas/mercado`` payload: streaming parser and typed raw tables.
+
+The payload holds every athlete of the market (``atletas``, a list) plus the
+clubs and positions (``clubes`` / ``posicoes``, objects keyed by id). It is read
+as a stream of JSON events, so each record is built and appended to its table's
+column buffers as soon as it is complete; the raw bytes are never held whole.
+
+Records are narrowed to the typed schemas below (the columns dbt reads plus
+market context). Fields the API adds later are dropped until added here, so a
+payload change can no longer alter a raw table's types the way autodetect did.
+"""
+
+from collections.abc import Iterator
+from typing import BinaryIO
+
+import ijson
+import pyarrow as pa
+
+SCOUT_CODES = (
+    "A", "CA", "CV", "DE", "DP", "DS", "FC", "FD", "FF", "FS",
+    "FT", "G", "GC", "GS", "I", "PC", "PP", "PS", "SG", "V",
+)  # fmt: skip
+
+PLAYERS_SCHEMA = pa.schema(
+    [
+        ("temporada", pa.int64()),
+        ("rodada_id", pa.int64()),
+        ("atleta_id", pa.int64()),
+        ("clube_id", pa.int64()),
+        ("posicao_id", pa.int64()),
+        ("status_id", pa.int64()),
+        ("apelido", pa.string()),
+        ("apelido_abreviado", pa.string()),
+        ("nome", pa.string()),
+        ("slug", pa.string()),
+        ("foto", pa.string()),
+        ("pontos_num", pa.float64()),
+        ("media_num", pa.float64()),
+        ("preco_num", pa.float64()),
+        ("variacao_num", pa.float64()),
+        ("minimo_para_valorizar", pa.float64()),
+        ("jogos_num", pa.int64()),
+        ("entrou_em_campo", pa.bool_()),
+        ("scout", pa.struct([(code, pa.int64()) for code in SCOUT_CODES])),
+    ]
+)
+
+CLUBS_SCHEMA = pa.schema(
+    [
+        ("id", pa.int64()),
+        ("nome", pa.string()),
+        ("abreviacao", pa.string()),
+        ("slug", pa.string()),
+        ("apelido", pa.string()),
+        ("nome_fantasia", pa.string()),
+        (
+            "escudos",
+            pa.struct([(size, pa.string()) for size in ("60x60", "45x45", "30x30")]),
+        ),
+    ]
+)
+
+POSITIONS_SCHEMA = pa.schema(
+    [
+        ("id", pa.int64()),
+        ("nome", pa.string()),
+        ("abreviacao", pa.string()),
+    ]
+)
+
+SCHEDULE_SCHEMA = pa.schema(
+    [
+        ("season", pa.int64()),
+        ("match_id", pa.int64()),
+        ("round_id", pa.int64()),
+        ("home_team_id", pa.int64()),
+        ("home_team_name", pa.string()),
+        ("home_team_tla", pa.string()),
+        ("away_team_id", pa.int64()),
+        ("away_team_name", pa.string()),
+        ("away_team_tla", pa.string()),
+    ]
+)
+
+# Per-round scouts of each athlete, one row per nonzero scout count
+SCOUTS_SCHEMA = pa.schema(
+    [
+        ("temporada", pa.int64()),
+        ("rodada_id", pa.int64()),
+        ("atleta_id", pa.int64()),
+        ("scout_code", pa.string()),
+        ("count", pa.int64()),
+    ]
+)
+
+# Columns identifying an athlete-round
+PLAYER_KEY = ("temporada", "rodada_id", "atleta_id")
+
+# Payload entity -> raw table it is loaded into
+TABLES = {
+    "atletas": ("raw_players_etl", PLAYERS_SCHEMA),
+    "clubes": ("raw_clubs", CLUBS_SCHEMA),
+    "posicoes": ("raw_positions", POSITIONS_SCHEMA),
+}
+
+
+class TableBuilder:
+    """Column buffers for one typed table: records in, Arrow table out."""
+
+    def __init__(self, schema: pa.Schema) -> None:
+        """Start an empty table with ``schema``."""
+        self.schema = schema
+        self.columns: dict[str, list] = {name: [] for name in schema.names}
+
+    def append(self, record: dict) -> None:
+        """Add a record, keeping only the schema's fields (missing ones are null)."""
+        for name, values in self.columns.items():
+            values.append(record.get(name))
+
+    def __len__(self) -> int:
+        """Return the number of records appended."""
+        return len(self.columns[self.schema.names[0]])
+
+    def table(self) -> pa.Table:
+        """Return the records as an Arrow table, cast to the schema."""
+        return pa.Table.from_pydict(self.columns, schema=self.schema)
+
+
+def _entity(prefix: str) -> str | None:
+    """Return the entity a JSON object at ``prefix`` is a record of, if any."""
+    top, _, rest = prefix.partition(".")
+    if top == "atletas" and rest == "item":
+        return top
+    if top in {"clubes", "posicoes"} and rest and "." not in rest:
+        return top
+    return None
+
+
+def stream_records(stream: BinaryIO) -> Iterator[tuple[str, dict]]:
+    """Yield ``(entity, record)`` for each athlete, club and position in the payload."""
+    builder, entity, depth = None, None, 0
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if builder is None:
+            entity = _entity(prefix) if event == "start_map" else None
+            if entity is None:
+                continue
+            builder = ijson.ObjectBuilder()
+        builder.event(event, value)
+        if event in {"start_map", "start_array"}:
+            depth += 1
+        elif event in {"end_map", "end_array"}:
+            depth -= 1
+            if depth == 0:
+                yield entity, builder.value
+                builder = None
+
+
+def parse_market(stream: BinaryIO, season: int) -> dict[str, pa.Table]:
+    """Parse a market payload into the typed raw tables, keyed by table name.
+
+    The API carries no season, so ``season`` is stamped on every athlete.
+    """
+    builders = {entity: TableBuilder(schema) for entity, (_, schema) in TABLES.items()}
+    for entity, record in stream_records(stream):
+        if entity == "atletas":
+            record["temporada"] = season
+        builders[entity].append(record)
+    return {TABLES[entity][0]: builder.table() for entity, builder in builders.items()}
+
+
+def schedule_table(matches: list[dict], season: int) -> pa.Table:
+    """Typed ``raw_schedule`` rows from football-data.org matches."""
+    builder = TableBuilder(SCHEDULE_SCHEMA)
+    for match in matches:
+        home, away = match["homeTeam"], match["awayTeam"]
+        builder.append(
+            {
+                "season": season,
+                "match_id": match["id"],
+                "round_id": match["matchday"],
+                "home_team_id": home["id"],
+                "home_team_name": home["shortName"],
+                "home_team_tla": home["tla"],
+                "away_team_id": away["id"],
+                "away_team_name": away["shortName"],
+                "away_team_tla": away["tla"],
+            }
+        )
+    return builder.table()
+
+
+def scout_deltas(players: pa.Table, totals: dict[tuple[int, str], int]) -> pa.Table:
+    """Per-round ``raw_player_round_scouts`` rows from cumulative season scouts.
+
+    The API's ``scout`` counts run over the season, so a round's counts are the
+    difference from the athlete's totals before it. ``totals`` holds those totals,
+    keyed by ``(atleta_id, scout_code)``, for the season of ``players`` and is
+    brought up to date as its rounds are read, in order. Zero counts are left out.
+    """
+    builder = TableBuilder(SCOUTS_SCHEMA)
+    rows = players.select([*PLAYER_KEY, "scout"]).sort_by(
+        [(column, "ascending") for column in PLAYER_KEY]
+    )
+    for row in rows.to_pylist():
+        for code, total in (row["scout"] or {}).items():
+            key = (row["atleta_id"], code)
+            count = (total or 0) - totals.get(key, 0)
+            if count:
+                builder.append({**row, "scout_code": code, "count": count})
+                totals[key] = total or 0
+    return builder.table()
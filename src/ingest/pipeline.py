@@ -0,0 +1,280 @@
+"""Ingest pipeline: fetch and parse once, write a bundle, load it into each dataset."""
+
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from google.api_core.exceptions import NotFound
+from google.cloud import bigquery
+
+from ingest.bundle import Bundle, write_bundle
+from ingest.load import (
+    drop_loaded,
+    load_parquet,
+    loaded_digests,
+    loaded_player_keys,
+    mark_loaded,
+    mark_scouted,
+    scout_totals,
+    scouted_rounds,
+    stored_rounds,
+    write_parquet,
+)
+from ingest.market import (
+    PLAYER_KEY,
+    PLAYERS_SCHEMA,
+    parse_market,
+    schedule_table,
+    scout_deltas,
+)
+from ingest.profiling import CountingReader, Profiler
+from ingest.sources import LegacySource, Source, legacy_rounds
+
+PLAYERS_TABLE = "raw_players_etl"
+SCOUTS_TABLE = "raw_player_round_scouts"
+
+
+def fetch(source: Source, season: int, profiler: Profiler) -> dict[str, pa.Table]:
+    """Read the market payload (and the schedule, when the source has one)."""
+    with (
+        profiler.stage("fetch + parse market") as stage,
+        closing(source.market()) as raw,
+    ):
+        stream = CountingReader(raw)
+        tables = parse_market(stream, season)
+        stage.n_bytes = stream.n_bytes
+        stage.rows = sum(table.num_rows for table in tables.values())
+    with profiler.stage("fetch schedule") as stage:
+        matches = source.matches(season)
+        if matches is not None:
+            tables["raw_schedule"] = schedule_table(matches, season)
+            stage.rows = len(matches)
+    return tables
+
+
+def new_players(
+    client: bigquery.Client, dataset: str, bundle: Bundle, profiler: Profiler
+) -> pa.Table:
+    """Return the bundle's athlete-rounds not in the dataset yet."""
+    with profiler.stage(f"{dataset.rsplit('.', 1)[-1]}: drop loaded") as stage:
+        players = pq.read_table(bundle.path(PLAYERS_TABLE))
+        keys = loaded_player_keys(
+            client,
+            f"{dataset}.{PLAYERS_TABLE}",
+            players["temporada"][0].as_py(),
+            pc.unique(players["rodada_id"]).to_pylist(),
+        )
+        new = drop_loaded(players, keys)
+        stage.rows = players.num_rows - new.num_rows
+    return new
+
+
+def round_scouts(
+    client: bigquery.Client,
+    dataset: str,
+    players: pa.Table,
+    legacy_dir: Path | None,
+    profiler: Profiler,
+) -> pa.Table:
+    """Return the per-round scouts of new athlete-rounds, from the stored totals.
+
+    The totals are only right when every earlier round of the season has had
+    its scouts computed, so the table is backfilled first when one has not (e.g.
+    on the first load into a dataset). Rounds are tracked by the dataset's
+    ``scouted-<season>`` label rather than the table, which has no rows for a
+    round without scouts.
+    """
+    season = players["temporada"][0].as_py()
+    first_round = pc.min(players["rodada_id"]).as_py()
+    earlier = stored_rounds(client, f"{dataset}.{PLAYERS_TABLE}", season, first_round)
+    if legacy_dir is not None and (legacy_dir / str(season)).is_dir():
+        earlier.update(
+            round_id
+            for round_id in legacy_rounds(legacy_dir / str(season))
+            if round_id < first_round
+        )
+    scouted = scouted_rounds(client, dataset).get(season, 0)
+    if any(round_id > scouted for round_id in earlier):
+        backfill_scouts(client, dataset, legacy_dir, profiler)
+
+    with profiler.stage(f"{dataset.rsplit('.', 1)[-1]}: scout deltas") as stage:
+        totals = scout_totals(client, f"{dataset}.{SCOUTS_TABLE}", season, first_round)
+        scouts = scout_deltas(players, totals)
+        stage.rows = scouts.num_rows
+    return scouts
+
+
+def load_dataset(
+    client: bigquery.Client,
+    dataset: str,
+    bundle: Bundle,
+    legacy_dir: Path | None,
+    profiler: Profiler,
+) -> dict[str, int] | None:
+    """Load a bundle into ``dataset`` and return the rows added per table.
+
+    Tables whose entities all match the digests recorded on the dataset are not
+    loaded (0 rows); None means the dataset already held the whole bundle. New
+    athlete-rounds also get their per-round scouts (see ``round_scouts``), loaded
+    before the players so that a failed run leaves them to be computed again.
+    ``legacy_dir`` holds the legacy CSV rounds, if any. The digests, and the
+    last round whose scouts were computed, are recorded on the dataset once
+    every table is loaded.
+    """
+    held_bundle, held = loaded_digests(client, dataset)
+    if held_bundle == bundle.digest:
+        return None
+    label = dataset.rsplit(".", 1)[-1]
+    rows = {}
+    scouted = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        files: dict[str, Path] = {}
+        for name, n_rows in bundle.rows.items():
+            rows[name] = 0
+            entities = bundle.entities(name)
+            if not n_rows or all(held.get(e) == d for e, d in entities.items()):
+                continue
+            if name != PLAYERS_TABLE:
+                files[name] = bundle.path(name)
+                continue
+            players = new_players(client, dataset, bundle, profiler)
+            if players.num_rows == 0:
+                continue
+            scouts = round_scouts(client, dataset, players, legacy_dir, profiler)
+            rows[SCOUTS_TABLE] = 0
+            scouted[players["temporada"][0].as_py()] = pc.max(
+                players["rodada_id"]
+            ).as_py()
+            if scouts.num_rows:
+                files[SCOUTS_TABLE] = Path(tmp_dir) / f"{SCOUTS_TABLE}.parquet"
+                write_parquet(scouts, files[SCOUTS_TABLE])
+            files[name] = bundle.path(name)
+            if players.num_rows < n_rows:
+                files[name] = Path(tmp_dir) / f"{name}.parquet"
+                write_parquet(players, files[name])
+
+        for name, path in files.items():
+            with profiler.stage(f"{label}: load {name}") as stage:
+                stage.rows = rows[name] = load_parquet(
+                    client, f"{dataset}.{name}", path
+                )
+                stage.n_bytes = path.stat().st_size
+    if scouted:
+        mark_scouted(client, dataset, scouted)
+    mark_loaded(client, dataset, bundle.digest, bundle.digests)
+    return rows
+
+
+def needs_rebuild(rows: dict[str, int] | None) -> bool:
+    """Tell whether a dataset's load changed any raw table (so dbt must run)."""
+    return rows is not None and any(rows.values())
+
+
+def run(  # noqa: PLR0913
+    source: Source,
+    season: int,
+    profiler: Profiler,
+    *,
+    client: bigquery.Client | None = None,
+    datasets: tuple[str, ...] = (),
+    out_dir: Path | None = None,
+    legacy_dir: Path | None = None,
+) -> tuple[Bundle, dict[str, dict[str, int] | None]]:
+    """Ingest one market snapshot into every dataset (``project.dataset``).
+
+    The snapshot is fetched and written as a bundle once, under ``out_dir`` when
+    given (otherwise in a temporary directory for the loads only), then loaded
+    into the datasets concurrently. Returns the bundle and, per dataset, the
+    rows added per table (None when it already held the bundle). A failed load
+    does not stop the others; the failures are raised together at the end.
+    ``legacy_dir`` holds the legacy CSV rounds, read if scouts need a backfill.
+    """
+    tables = fetch(source, season, profiler)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with profiler.stage("write bundle") as stage:
+            bundle = write_bundle(tables, out_dir or Path(tmp_dir))
+            stage.rows = sum(bundle.rows.values())
+            stage.n_bytes = sum(
+                path.stat().st_size for path in bundle.directory.glob("*.parquet")
+            )
+        if client is None or not datasets:
+            return bundle, {}
+        with ThreadPoolExecutor(max_workers=len(datasets)) as pool:
+            futures = {
+                dataset: pool.submit(
+                    load_dataset, client, dataset, bundle, legacy_dir, profiler
+                )
+                for dataset in datasets
+            }
+    errors = [future.exception() for future in futures.values()]
+    if any(errors):
+        msg = "loads failed"
+        raise ExceptionGroup(msg, [error for error in errors if error])
+    return bundle, {dataset: future.result() for dataset, future in futures.items()}
+
+
+def backfill_scouts(
+    client: bigquery.Client, dataset: str, legacy_dir: Path | None, profiler: Profiler
+) -> int:
+    """Rebuild ``raw_player_round_scouts`` from every stored round; return its rows.
+
+    Reads the legacy CSV rounds (``legacy_dir/<season>/rodada-<round>.csv``) and
+    all of ``raw_players_etl``, replaces the table with their per-round scouts
+    and records the last round of each season as scouted. Daily loads run it
+    themselves when earlier rounds have not had their scouts computed.
+    """
+    label = dataset.rsplit(".", 1)[-1]
+    schema = pa.schema([PLAYERS_SCHEMA.field(name) for name in (*PLAYER_KEY, "scout")])
+    with profiler.stage(f"{label}: read stored rounds") as stage:
+        tables = [
+            parse_market(
+                LegacySource(season_dir, round_id).market(),
+                int(season_dir.name),
+            )[PLAYERS_TABLE].select(schema.names)
+            for season_dir in sorted(legacy_dir.glob("[0-9]*") if legacy_dir else [])
+            for round_id in legacy_rounds(season_dir)
+        ]
+        try:
+            stored = client.query(
+                f"SELECT {', '.join(schema.names)} FROM `{dataset}.{PLAYERS_TABLE}`"  # noqa: S608
+            ).to_arrow()
+        except NotFound:
+            stored = schema.empty_table()
+        # Typed like the payload (the table's scout fields may differ in order)
+        tables.append(pa.Table.from_pylist(stored.to_pylist(), schema=schema))
+        players = pa.concat_tables(tables)
+        stage.rows = players.num_rows
+
+    with profiler.stage(f"{label}: scout deltas") as stage:
+        scouts = pa.concat_tables(
+            scout_deltas(players.filter(pc.equal(players["temporada"], season)), {})
+            for season in pc.unique(players["temporada"]).to_pylist()
+        )
+        stage.rows = scouts.num_rows
+
+    with (
+        tempfile.TemporaryDirectory() as tmp_dir,
+        profiler.stage(f"{label}: load {SCOUTS_TABLE}") as stage,
+    ):
+        path = Path(tmp_dir) / f"{SCOUTS_TABLE}.parquet"
+        stage.n_bytes = write_parquet(scouts, path)
+        stage.rows = load_parquet(
+            client, f"{dataset}.{SCOUTS_TABLE}", path, replace=True
+        )
+    last_rounds = players.group_by("temporada").aggregate([("rodada_id", "max")])
+    mark_scouted(
+        client,
+        dataset,
+        dict(
+            zip(
+                last_rounds["temporada"].to_pylist(),
+                last_rounds["rodada_id_max"].to_pylist(),
+                strict=True,
+            )
+        ),
+    )
+    return stage.rows
@@ -0,0 +1,81 @@
+"""End-to-end profile of an ingest run: one line per pipeline stage.
+
+Each stage records wall time, CPU time, the process's peak memory once it ends,
+and the rows and bytes it handled. ``uv run ingest --cprofile PATH`` also dumps
+a cProfile of the whole run for function-level detail. Stages that run
+concurrently (the loads into each dataset) share the process's CPU time and
+peak memory.
+"""
+
+import resource
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import BinaryIO
+
+
+@dataclass
+class Stage:
+    """Measurements of one pipeline stage."""
+
+    name: str
+    seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_rss_mb: float = 0.0
+    rows: int = 0
+    n_bytes: int = 0
+
+
+class Profiler:
+    """Collects the stages of a run, in order."""
+
+    def __init__(self) -> None:
+        """Start with no stages."""
+        self.stages: list[Stage] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Stage]:
+        """Time a stage; the caller fills in the rows and bytes it handled."""
+        stage = Stage(name)
+        start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield stage
+        finally:
+            stage.seconds = time.perf_counter() - start
+            stage.cpu_seconds = time.process_time() - cpu_start
+            # ru_maxrss is in KiB on Linux
+            stage.peak_rss_mb = (
+                resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            )
+            self.stages.append(stage)
+
+    def report(self) -> str:
+        """Return the stages as a table, with the run's totals."""
+        header = f"{'stage':<40} {'wall s':>8} {'cpu s':>8} {'peak MB':>9}"
+        lines = [f"{header} {'rows':>9} {'MB':>9}"]
+        lines.extend(
+            f"{s.name:<40} {s.seconds:>8.2f} {s.cpu_seconds:>8.2f} "
+            f"{s.peak_rss_mb:>9.1f} {s.rows:>9} {s.n_bytes / 1e6:>9.2f}"
+            for s in self.stages
+        )
+        lines.append(
+            f"{'total':<40} {sum(s.seconds for s in self.stages):>8.2f} "
+            f"{sum(s.cpu_seconds for s in self.stages):>8.2f}"
+        )
+        return "\n".join(lines)
+
+
+class CountingReader:
+    """Byte stream wrapper counting the bytes read through it."""
+
+    def __init__(self, stream: BinaryIO) -> None:
+        """Wrap ``stream``."""
+        self.stream = stream
+        self.n_bytes = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """Read from the wrapped stream, counting the bytes returned."""
+        data = self.stream.read(size)
+        self.n_bytes += len(data)
+        return data
@@ -0,0 +1,154 @@
+"""Payload sources: the Cartola API (or any server mirroring it) and the legacy CSVs.
+
+A source hands out the market payload as a binary stream, so the parser works
+the same whatever the origin, and the football-data.org matches of a season.
+"""
+
+import csv
+import io
+import json
+import os
+import urllib.request
+from pathlib import Path
+from typing import BinaryIO, Protocol
+
+from ingest.market import SCOUT_CODES
+
+CARTOLA_URL = "https://api.cartolafc.globo.com"
+FOOTBALL_DATA_URL = "https://api.football-data.org/v4"
+
+# Requests that outlive this are treated as failed
+TIMEOUT_SECONDS = 60
+
+# Cartola positions (the legacy CSVs only carry the id)
+POSITIONS = {
+    1: ("Goleiro", "gol"),
+    2: ("Lateral", "lat"),
+    3: ("Zagueiro", "zag"),
+    4: ("Meia", "mei"),
+    5: ("Atacante", "ata"),
+    6: ("Técnico", "tec"),
+}
+
+
+class Source(Protocol):
+    """Where the raw payloads come from."""
+
+    def market(self) -> BinaryIO:
+        """Open the ``/atletas/mercado`` payload as a byte stream."""
+        ...
+
+    def matches(self, season: int) -> list[dict] | None:
+        """Return the season's matches, or None when the source has no schedule."""
+        ...
+
+
+class HttpSource:
+    """The Cartola and football-data.org APIs, or servers mirroring their paths.
+
+    ``cartola_url`` can point at a local fixture server serving
+    ``/atletas/mercado``. The schedule needs ``FOOTBALL_DATA_API_KEY``; without it
+    there is no schedule.
+    """
+
+    def __init__(
+        self,
+        cartola_url: str = CARTOLA_URL,
+        football_data_url: str = FOOTBALL_DATA_URL,
+    ) -> None:
+        """Read from the given base URLs."""
+        self.cartola_url = cartola_url.rstrip("/")
+        self.football_data_url = football_data_url.rstrip("/")
+
+    def market(self) -> BinaryIO:
+        """Open the market payload (the response body is read as it is parsed)."""
+        return urllib.request.urlopen(  # noqa: S310
+            f"{self.cartola_url}/atletas/mercado", timeout=TIMEOUT_SECONDS
+        )
+
+    def matches(self, season: int) -> list[dict] | None:
+        """Return the Brasileirão matches of a season, future rounds included."""
+        api_key = os.environ.get("FOOTBALL_DATA_API_KEY")
+        if not api_key:
+            return None
+        request = urllib.request.Request(  # noqa: S310
+            f"{self.football_data_url}/competitions/BSA/matches?season={season}",
+            headers={"X-Auth-Token": api_key},
+        )
+        with urllib.request.urlopen(  # noqa: S310
+            request, timeout=TIMEOUT_SECONDS
+        ) as response:
+            return json.load(response)["matches"]
+
+
+class LegacySource:
+    """One round of the legacy CSVs (``legacy/<season>/rodada-<round>.csv``).
+
+    Rows are turned back into the API's shape (``atletas`` list, ``clubes`` and
+    ``posicoes`` keyed by id) so the same parser and loads run offline. Clubs
+    only carry their abbreviation, and there is no schedule.
+    """
+
+    def __init__(self, season_dir: Path, round_id: int | None = None) -> None:
+        """Serve ``round_id`` of the season directory (default: its last round)."""
+        rounds = legacy_rounds(season_dir)
+        self.path = rounds[round_id if round_id is not None else max(rounds)]
+
+    def market(self) -> BinaryIO:
+        """Build the round's market payload from the CSV."""
+        athletes, clubs = [], {}
+        with self.path.open(newline="") as file:
+            for row in csv.DictReader(file):
+                athlete = {
+                    key.removeprefix("atletas."): _csv_value(key, value)
+                    for key, value in row.items()
+                    if key.startswith("atletas.") and key.count(".") == 1
+                }
+                athlete["scout"] = {
+                    code: int(float(row[code])) for code in SCOUT_CODES if row.get(code)
+                }
+                athletes.append(athlete)
+                club = row["atletas.clube.id.full.name"]
+                clubs[athlete["clube_id"]] = {
+                    "id": athlete["clube_id"],
+                    "abreviacao": club,
+                    "nome_fantasia": club,
+                }
+        payload = {
+            "atletas": athletes,
+            "clubes": clubs,
+            "posicoes": {
+                position_id: {
+                    "id": position_id,
+                    "nome": name,
+                    "abreviacao": abbreviation,
+                }
+                for position_id, (name, abbreviation) in POSITIONS.items()
+            },
+        }
+        return io.BytesIO(json.dumps(payload).encode())
+
+    def matches(self, season: int) -> None:  # noqa: ARG002
+        """Return no schedule (the legacy CSVs have none)."""
+        return
+
+
+def legacy_rounds(season_dir: Path) -> dict[int, Path]:
+    """Return the legacy CSV of each round of a season directory, in round order."""
+    paths = {
+        int(path.stem.split("-")[1]): path for path in season_dir.glob("rodada-*.csv")
+    }
+    return dict(sorted(paths.items()))
+
+
+def _csv_value(key: str, value: str) -> object:
+    """Convert a legacy CSV cell to the type the API sends."""
+    if value == "":
+        return None
+    if key.endswith(("_id", "jogos_num")):
+        return int(float(value))
+    if key.endswith(("_num", "minimo_para_valorizar")):
+        return float(value)
+    if key.endswith("entrou_em_campo"):
+        return value == "True"
+    return value
@@ -0,0 +1,7 @@
+"""Put the scripts, the ``src`` packages and the app's modules on the import path."""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(ROOT), str(ROOT / "src"), str(ROOT / "src" / "app")]
@@ -0,0 +1,392 @@
+"""Tests for the ingest package: parsing, bundles, and loads against a fake client."""
+
+import json
+import threading
+from collections.abc import Iterator
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import pytest
+from google.api_core.exceptions import NotFound
+from google.cloud import bigquery
+
+from ingest import load, pipeline
+from ingest.bundle import entity_digests, write_bundle
+from ingest.market import (
+    CLUBS_SCHEMA,
+    PLAYER_KEY,
+    PLAYERS_SCHEMA,
+    POSITIONS_SCHEMA,
+    parse_market,
+    scout_deltas,
+)
+from ingest.profiling import Profiler
+from ingest.sources import HttpSource, LegacySource, legacy_rounds
+
+ROOT = Path(__file__).resolve().parents[1]
+DATASET = "project.dataset"
+SCOUTED = pa.schema([PLAYERS_SCHEMA.field(name) for name in (*PLAYER_KEY, "scout")])
+
+# A trimmed /atletas/mercado payload, with a field the schemas leave out
+MARKET = {
+    "atletas": [
+        {
+            "atleta_id": 37656,
+            "rodada_id": 3,
+            "clube_id": 266,
+            "posicao_id": 1,
+            "status_id": 7,
+            "apelido": "Fábio",
+            "pontos_num": 2.1,
+            "media_num": 3,
+            "preco_num": 10.55,
+            "jogos_num": 3,
+            "entrou_em_campo": True,
+            "scout": {"DE": 2, "FS": 1},
+            "gato_mestre": {"media_pontos_mandante": 4.2},
+        },
+        {
+            "atleta_id": 39148,
+            "rodada_id": 3,
+            "clube_id": 282,
+            "posicao_id": 5,
+            "status_id": 2,
+            "apelido": "Hulk",
+            "pontos_num": 0,
+            "entrou_em_campo": False,
+            "scout": {},
+        },
+    ],
+    "clubes": {
+        "266": {"id": 266, "nome": "FLU", "abreviacao": "FLU", "escudos": {}},
+        "282": {"id": 282, "nome": "CAM", "abreviacao": "CAM"},
+    },
+    "posicoes": {
+        "1": {"id": 1, "nome": "Goleiro", "abreviacao": "gol"},
+        "5": {"id": 5, "nome": "Atacante", "abreviacao": "ata"},
+    },
+    "status": {"7": {"id": 7, "nome": "Provável"}},
+}
+
+
+def players(*rows: tuple[int, int, int, dict[str, int | None]]) -> pa.Table:
+    """Build athlete-rounds from ``(season, round, athlete, scouts)`` tuples."""
+    codes = [field.name for field in SCOUTED.field("scout").type]
+    return pa.Table.from_pylist(
+        [
+            dict(zip(SCOUTED.names, (*key, dict.fromkeys(codes) | scouts), strict=True))
+            for *key, scouts in rows
+        ],
+        schema=SCOUTED,
+    )
+
+
+class FakeJob:
+    """A finished job holding rows (queries) or a row count (loads)."""
+
+    def __init__(
+        self, rows: list[bigquery.Row] | pa.Table, output_rows: int = 0
+    ) -> None:
+        self.rows = rows
+        self.output_rows = output_rows
+
+    def result(self) -> list[bigquery.Row]:
+        return self.rows
+
+    def to_arrow(self) -> pa.Table:
+        return self.rows
+
+
+class FakeClient:
+    """The client calls the ingest package makes, over in-memory Arrow tables."""
+
+    def __init__(self, tables: dict[str, pa.Table]) -> None:
+        self.tables = {f"{DATASET}.{name}": table for name, table in tables.items()}
+        self.labels = {}
+
+    def get_dataset(self, dataset: str) -> bigquery.Dataset:
+        ds = bigquery.Dataset(dataset)
+        ds.labels = dict(self.labels)
+        return ds
+
+    def update_dataset(self, ds: bigquery.Dataset, fields: list[str]) -> None:
+        assert fields == ["labels"]
+        for key, value in ds.labels.items():
+            if value is None:
+                self.labels.pop(key, None)
+            else:
+                self.labels[key] = value
+
+    def get_table(self, table_id: str) -> bigquery.Table:
+        if table_id not in self.tables:
+            raise NotFound(table_id)
+        return bigquery.Table(table_id)
+
+    def query(
+        self, sql: str, job_config: bigquery.QueryJobConfig | None = None
+    ) -> FakeJob:
+        table_id = sql.split("`")[1]
+        if table_id not in self.tables:
+            raise NotFound(table_id)
+        table = self.tables[table_id]
+        if job_config is None:
+            return FakeJob(table.select(list(SCOUTED.names)))
+        params = {
+            p.name: getattr(p, "value", None) or p.values
+            for p in job_config.query_parameters
+        }
+        if "rounds" in params:
+            rounds = pc.is_in(table["rodada_id"], pa.array(params["rounds"]))
+        else:
+            rounds = pc.less(table["rodada_id"], params["round_id"])
+        table = table.filter(
+            pc.and_(pc.equal(table["temporada"], params["season"]), rounds)
+        )
+        if "rounds" in params:
+            return FakeJob(table.select(list(PLAYER_KEY)))
+        if "SUM(count)" in sql:
+            table = table.group_by(["atleta_id", "scout_code"]).aggregate(
+                [("count", "sum")]
+            )
+            names = ["atleta_id", "scout_code", "count"]
+            columns = [
+                table[name].to_pylist()
+                for name in ("atleta_id", "scout_code", "count_sum")
+            ]
+        else:
+            names = ["rodada_id"]
+            columns = [pc.unique(table["rodada_id"]).to_pylist()]
+        index = {name: i for i, name in enumerate(names)}
+        return FakeJob(
+            [bigquery.Row(values, index) for values in zip(*columns, strict=True)]
+        )
+
+    def load_table_from_file(
+        self, file: object, table_id: str, job_config: bigquery.LoadJobConfig
+    ) -> FakeJob:
+        assert job_config.write_disposition == bigquery.WriteDisposition.WRITE_TRUNCATE
+        self.tables[table_id] = pq.read_table(file)
+        return FakeJob([], self.tables[table_id].num_rows)
+
+
+@pytest.fixture
+def cartola_url(tmp_path: Path) -> Iterator[str]:
+    """Serve MARKET at ``/atletas/mercado`` from a local HTTP server."""
+    (tmp_path / "atletas").mkdir()
+    (tmp_path / "atletas" / "mercado").write_text(json.dumps(MARKET))
+    handler = partial(SimpleHTTPRequestHandler, directory=tmp_path)
+    handler.log_message = lambda *_: None
+    with ThreadingHTTPServer(("127.0.0.1", 0), handler) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_port}/"
+        server.shutdown()
+
+
+def test_http_market_parses_into_typed_tables(cartola_url: str) -> None:
+    with HttpSource(cartola_url).market() as stream:
+        tables = parse_market(stream, 2026)
+    assert {name: table.num_rows for name, table in tables.items()} == {
+        "raw_players_etl": 2,
+        "raw_clubs": 2,
+        "raw_positions": 2,
+    }
+    assert tables["raw_players_etl"].schema == PLAYERS_SCHEMA
+    assert tables["raw_clubs"].schema == CLUBS_SCHEMA
+    assert tables["raw_positions"].schema == POSITIONS_SCHEMA
+    fabio, hulk = tables["raw_players_etl"].to_pylist()
+    assert fabio["temporada"] == 2026
+    assert fabio["media_num"] == 3.0
+    assert (fabio["scout"]["DE"], fabio["scout"]["G"]) == (2, None)
+    assert (hulk["preco_num"], hulk["scout"]["FS"]) == (None, None)
+
+
+def test_drop_loaded_keeps_only_new_athlete_rounds() -> None:
+    new = players((2026, 3, 1, {}), (2026, 3, 2, {}), (2026, 4, 1, {}))
+    keys = load.pack_keys(players((2026, 3, 2, {}), (2025, 3, 1, {})))
+    kept = load.drop_loaded(new, keys)
+    assert kept.select(list(PLAYER_KEY)).to_pylist() == [
+        {"temporada": 2026, "rodada_id": 3, "atleta_id": 1},
+        {"temporada": 2026, "rodada_id": 4, "atleta_id": 1},
+    ]
+    assert load.drop_loaded(new, pa.array([], pa.int64())) is new
+
+
+def test_pack_keys_are_distinct_per_athlete_round() -> None:
+    keys = load.pack_keys(
+        players((2026, 1, 2, {}), (2026, 2, 1, {}), (2025, 1, 2, {}), (2026, 1, 2, {}))
+    )
+    assert keys.type == pa.int64()
+    assert len(set(keys.to_pylist())) == 3
+
+
+def test_bundle_digests_ignore_row_order(tmp_path: Path) -> None:
+    tables = parse_market(LegacySource(ROOT / "legacy" / "2025", 3).market(), 2025)
+    shuffled = {
+        name: table.take(pa.array(range(table.num_rows - 1, -1, -1)))
+        for name, table in tables.items()
+    }
+    bundle = write_bundle(tables, tmp_path / "a")
+    assert write_bundle(shuffled, tmp_path / "b").digests == bundle.digests
+    assert bundle.digest == write_bundle(shuffled, tmp_path / "b").digest
+
+
+def test_entity_digests_are_per_round() -> None:
+    rounds = players((2026, 1, 7, {"G": 1}), (2026, 2, 7, {"G": 2}))
+    changed = players((2026, 1, 7, {"G": 1}), (2026, 2, 7, {"G": 3}))
+    before = entity_digests("raw_players_etl", rounds)
+    after = entity_digests("raw_players_etl", changed)
+    assert sorted(before) == ["raw_players_etl-2026-1", "raw_players_etl-2026-2"]
+    assert before["raw_players_etl-2026-1"] == after["raw_players_etl-2026-1"]
+    assert before["raw_players_etl-2026-2"] != after["raw_players_etl-2026-2"]
+
+
+def test_scout_deltas_turns_season_totals_into_round_counts() -> None:
+    totals = {}
+    scouts = scout_deltas(
+        players(
+            (2025, 2, 7, {"G": 2, "FS": 3}),
+            (2025, 1, 7, {"G": 1, "FS": 3}),
+            (2025, 1, 9, {"DS": None}),
+        ),
+        totals,
+    )
+    assert {tuple(row.values()) for row in scouts.to_pylist()} == {
+        (2025, 1, 7, "G", 1),
+        (2025, 1, 7, "FS", 3),
+        (2025, 2, 7, "G", 1),
+    }
+    assert totals == {(7, "G"): 2, (7, "FS"): 3}
+
+
+def test_scout_deltas_starts_from_stored_totals_and_keeps_corrections() -> None:
+    scouts = scout_deltas(
+        players((2025, 5, 7, {"G": 3, "CA": None})), {(7, "G"): 2, (7, "CA"): 1}
+    )
+    assert dict(
+        zip(scouts["scout_code"].to_pylist(), scouts["count"].to_pylist(), strict=True)
+    ) == {
+        "G": 1,
+        "CA": -1,
+    }
+
+
+def test_scout_deltas_match_legacy_season() -> None:
+    season_dir = ROOT / "legacy" / "2025"
+    season = pa.concat_tables(
+        parse_market(LegacySource(season_dir, round_id).market(), 2025)[
+            "raw_players_etl"
+        ].select(SCOUTED.names)
+        for round_id in legacy_rounds(season_dir)
+    )
+    scouts = scout_deltas(season, {})
+    assert scouts.num_rows == 28_463
+    assert pc.sum(scouts["count"]).as_py() == 44_268
+
+
+def test_round_scouts_backfills_missing_rounds_first() -> None:
+    client = FakeClient(
+        {"raw_players_etl": players((2025, 1, 7, {"G": 1}), (2025, 2, 7, {"G": 2}))}
+    )
+    scouts = pipeline.round_scouts(
+        client, DATASET, players((2025, 3, 7, {"G": 4})), None, Profiler()
+    )
+    assert scouts.to_pylist() == [
+        {
+            "temporada": 2025,
+            "rodada_id": 3,
+            "atleta_id": 7,
+            "scout_code": "G",
+            "count": 2,
+        }
+    ]
+    assert client.tables[f"{DATASET}.raw_player_round_scouts"].num_rows == 2
+
+
+def test_load_dataset_backfills_scouts_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Round 1 has no scouts, so it never has rows in raw_player_round_scouts
+    client = FakeClient({"raw_players_etl": players((2025, 1, 7, {}))})
+    backfills = []
+
+    def backfill_scouts(*args: object) -> int:
+        backfills.append(args)
+        return backfill(*args)
+
+    def load_parquet(
+        client: FakeClient, table_id: str, path: Path, *, replace: bool = False
+    ) -> int:
+        table = pq.read_table(path)
+        if not replace and table_id in client.tables:
+            table = pa.concat_tables([client.tables[table_id], table])
+        client.tables[table_id] = table
+        return table.num_rows
+
+    backfill = pipeline.backfill_scouts
+    monkeypatch.setattr(pipeline, "backfill_scouts", backfill_scouts)
+    monkeypatch.setattr(pipeline, "load_parquet", load_parquet)
+    for round_id in (2, 3, 4):
+        bundle = write_bundle(
+            {"raw_players_etl": players((2025, round_id, 7, {"G": round_id - 1}))},
+            tmp_path / str(round_id),
+        )
+        pipeline.load_dataset(client, DATASET, bundle, None, Profiler())
+    assert len(backfills) == 1
+    scouts = client.tables[f"{DATASET}.raw_player_round_scouts"]
+    assert scouts["rodada_id"].to_pylist() == [2, 3, 4]
+    assert client.labels["scouted-2025"] == "4"
+
+
+def test_merge_inserts_records_by_name_in_target_order(tmp_path: Path) -> None:
+    field = bigquery.SchemaField
+    table_id = f"{DATASET}.raw_players_etl"
+    schemas = {
+        table_id: [
+            field("atleta_id", "INTEGER"),
+            field(
+                "scout", "RECORD", fields=[field("G", "INTEGER"), field("A", "INTEGER")]
+            ),
+        ]
+    }
+    staged = [
+        field("atleta_id", "INTEGER"),
+        field(
+            "scout", "RECORD", fields=[field("A", "INTEGER"), field("FS", "INTEGER")]
+        ),
+    ]
+    queries = []
+
+    class Client:
+        def get_table(self, table_id: str) -> bigquery.Table:
+            return bigquery.Table(table_id, schema=schemas[table_id])
+
+        def update_table(self, table: bigquery.Table, fields: list[str]) -> None:
+            assert fields == ["schema"]
+            schemas[table_id] = table.schema
+
+        def load_table_from_file(self, *args: object, **kwargs: object) -> FakeJob:
+            schemas[f"{table_id}__staging"] = staged
+            return FakeJob([], 1)
+
+        def query(self, sql: str) -> FakeJob:
+            queries.append(sql)
+            job = FakeJob([])
+            job.num_dml_affected_rows = 1
+            return job
+
+        def delete_table(self, *args: object, **kwargs: object) -> None:
+            pass
+
+    path = tmp_path / "players.parquet"
+    path.touch()
+    assert load.load_parquet(Client(), table_id, path) == 1
+    assert [sub.name for sub in schemas[table_id][1].fields] == ["G", "A", "FS"]
+    assert (
+        "STRUCT(CAST(NULL AS INT64) AS `G`, staged.`scout`.`A` AS `A`, "
+        "staged.`scout`.`FS` AS `FS`)"
+    ) in queries[0]
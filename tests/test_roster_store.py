@@ -0,0 +1,96 @@
+"""Tests for the session roster store, over the in-memory backend."""
+
+import pytest
+from roster_store import InMemoryRosterBackend, RosterConflictError, RosterStore
+
+USER = "user@example.com"
+
+
+class CountingBackend(InMemoryRosterBackend):
+    """In-memory backend counting its round trips."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+        self.commits = 0
+
+    def get_all(self, *args: object) -> dict:
+        self.reads += 1
+        return super().get_all(*args)
+
+    def commit(self, *args: object) -> dict:
+        self.commits += 1
+        return super().commit(*args)
+
+
+def test_rosters_are_read_once_and_saved_per_call() -> None:
+    backend = CountingBackend()
+    store = RosterStore(backend, USER)
+    assert store.load("user_squads") == set()
+    store.save("user_squads", {1, 2})
+    store.save("user_teams", {1})
+    assert store.load("user_squads") == {1, 2}
+    assert (backend.reads, backend.commits) == (1, 2)
+    assert store.versions["user_squads"] == 1
+    assert store.versions["user_teams"] == 2
+
+
+def test_batch_commits_once() -> None:
+    backend = CountingBackend()
+    store = RosterStore(backend, USER)
+    with store.batch():
+        store.save("user_squads", {1, 2})
+        store.save("user_teams", {1})
+        assert store.load("user_teams") == {1}
+        assert backend.commits == 0
+    assert backend.commits == 1
+    assert RosterStore(backend, USER).load("user_teams") == {1}
+
+
+def test_batch_that_raises_writes_nothing() -> None:
+    backend = CountingBackend()
+    store = RosterStore(backend, USER)
+
+    def save_then_fail() -> None:
+        with store.batch():
+            store.save("user_squads", {1, 2})
+            raise ValueError("boom")  # noqa: EM101
+
+    with pytest.raises(ValueError, match="boom"):
+        save_then_fail()
+    assert backend.commits == 0
+    assert store.load("user_squads") == set()
+
+
+def test_conflicting_save_is_rejected_and_reloads() -> None:
+    backend = InMemoryRosterBackend()
+    store = RosterStore(backend, USER)
+    other = RosterStore(backend, USER)
+    assert store.load("user_squads") == other.load("user_squads") == set()
+    other.save("user_squads", {3})
+    with pytest.raises(RosterConflictError):
+        store.save("user_squads", {1})
+    assert store.load("user_squads") == {3}
+    store.save("user_squads", {1})
+    assert RosterStore(backend, USER).load("user_squads") == {1}
+
+
+def test_failed_commit_leaves_the_cache_unchanged() -> None:
+    class FailingBackend(InMemoryRosterBackend):
+        def commit(self, *args: object) -> dict:
+            raise ConnectionError
+
+    store = RosterStore(FailingBackend(), USER)
+    with pytest.raises(ConnectionError):
+        store.save("user_squads", {1})
+    assert store.load("user_squads") == set()
+
+
+def test_stale_rosters_are_read_again() -> None:
+    backend = CountingBackend()
+    store = RosterStore(backend, USER, max_age=0)
+    other = RosterStore(backend, USER)
+    store.load("user_squads")
+    other.save("user_squads", {4})
+    assert store.load("user_squads") == {4}
+    assert store.versions["user_squads"] == other.versions["user_squads"]
@@ -0,0 +1,47 @@
+"""Tests for the round-scoped refresh plan."""
+
+from scripts import round_refresh
+
+BEFORE = {
+    ("raw_players_etl", 2026, 1): (10, 1),
+    ("raw_players_etl", 2026, 2): (10, 2),
+    ("raw_player_round_scouts", 2026, 1): (5, 3),
+    ("raw_clubs", 0, 0): (20, 4),
+}
+
+
+def plan(
+    after: round_refresh.Fingerprints | None = None,
+) -> tuple[list[str], range] | None:
+    """Plan the build for ``BEFORE`` with some fingerprints replaced."""
+    after = {**BEFORE, **(after or {})}
+    return round_refresh.build_args(
+        round_refresh.changed_partitions(BEFORE, after), after
+    )
+
+
+def test_unchanged_sources_build_nothing() -> None:
+    assert plan() is None
+
+
+def test_changed_rounds_rebuild_from_the_first() -> None:
+    args, rounds = plan({("raw_player_round_scouts", 2026, 2): (4, 9)})
+    assert args[args.index("--vars") + 1] == '{"round_from": 2, "round_to": 2}'
+    assert "source:cartola.raw_player_round_scouts+" in args
+    assert rounds == range(2, 3)
+
+
+def test_changed_other_source_is_a_full_refresh() -> None:
+    assert plan({("raw_clubs", 0, 0): (21, 4)}) == (
+        ["build", "--full-refresh"],
+        range(0),
+    )
+    assert plan({("raw_schedule", 0, 0): (380, 7)}) == (
+        ["build", "--full-refresh"],
+        range(0),
+    )
+
+
+def test_changed_earlier_season_is_a_full_refresh() -> None:
+    args, _ = plan({("raw_players_etl", 2025, 38): (10, 1)})
+    assert args == ["build", "--full-refresh"]
@@ -0,0 +1,135 @@
+"""Tests for the app's query helpers."""
+
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+import duckdb
+import pandas as pd
+import pytest
+import streamlit as st
+import utils
+from google.api_core.exceptions import NotFound
+
+# Seconds each fake BigQuery job takes
+LATENCY = 0.3
+
+
+class SleepingJob:
+    """A query job that takes LATENCY seconds to return its rows."""
+
+    def __init__(self, sql: str) -> None:
+        self.sql = sql
+
+    def to_dataframe(self) -> pd.DataFrame:
+        time.sleep(LATENCY)
+        if "as_of_round_id" in self.sql:
+            return pd.DataFrame({"as_of_round_id": [1, 2]})
+        return pd.DataFrame({"sql": [self.sql]})
+
+
+class SleepingClient:
+    """BigQuery client fake: every query is a SleepingJob, and is recorded."""
+
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+        self.lock = threading.Lock()
+
+    def query(self, sql: str) -> SleepingJob:
+        with self.lock:
+            self.queries.append(sql)
+        return SleepingJob(sql)
+
+    def get_table(self, table_id: str) -> None:
+        raise NotFound(table_id)
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> Iterator[SleepingClient]:
+    """Serve the app's queries from a SleepingClient, with empty caches."""
+    fake = SleepingClient()
+    monkeypatch.setattr(utils, "DUCKDB_PATH", None)
+    monkeypatch.setattr(utils, "get_client", lambda: fake)
+    st.cache_data.clear()
+    yield fake
+    st.cache_data.clear()
+
+
+def test_fetch_concurrently_overlaps_misses_and_skips_hits(
+    client: SleepingClient,
+) -> None:
+    utils.load_available_rounds()
+    loaders = {i: partial(utils._query, f"SELECT {i}") for i in range(4)}  # noqa: SLF001
+    n_queries = len(client.queries)
+
+    started = time.perf_counter()
+    results = utils.fetch_concurrently(loaders)
+    elapsed = time.perf_counter() - started
+    assert elapsed < 2 * LATENCY
+    assert [data["sql"][0] for data in results.values()] == [
+        f"SELECT {i}" for i in range(4)
+    ]
+    assert len(client.queries) == n_queries + 4
+
+    started = time.perf_counter()
+    utils.fetch_concurrently(loaders)
+    assert time.perf_counter() - started < LATENCY
+    assert len(client.queries) == n_queries + 4
+
+
+def test_build_marker_is_empty_without_build_metadata(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    database = tmp_path / "fantasy_br.duckdb"
+    with duckdb.connect(str(database)) as connection:
+        connection.execute("CREATE TABLE ss_main AS SELECT 1 AS as_of_round_id")
+    monkeypatch.setattr(utils, "DUCKDB_PATH", str(database))
+    st.cache_data.clear()
+    assert utils.load_build_marker() == {}
+    with duckdb.connect(str(database)) as connection:
+        connection.execute(
+            "CREATE TABLE build_metadata AS SELECT 'build' AS invocation_id, "
+            "now() AS finished_at, 'ss_main' AS model_name, 1 AS max_round_id"
+        )
+    st.cache_data.clear()
+    assert utils.load_build_marker() == {"ss_main": "build"}
+    st.cache_data.clear()
+
+
+def test_projection_cache_reuses_covering_projections() -> None:
+    cache = utils.ProjectionCache(max_entries=4)
+    cache.add(("q",), ("build-1",), (("a", "b"),))
+    assert cache.covering(("q",), ("build-1",), (("a",),)) == (("a", "b"),)
+    assert cache.covering(("q",), ("build-1",), (("c",),)) == (("c",),)
+
+
+def test_projection_cache_drops_projections_of_old_tiers() -> None:
+    cache = utils.ProjectionCache(max_entries=4)
+    cache.add(("q",), ("build-1",), (None,))
+    assert cache.covering(("q",), ("build-2",), (("a",),)) == (("a",),)
+    assert cache.covering(("q",), ("build-1",), (("a",),)) == (("a",),)
+
+
+def test_projection_cache_keeps_recently_used_query_sets() -> None:
+    cache = utils.ProjectionCache(max_entries=2)
+    cache.add(("q1",), (), (None,))
+    cache.add(("q2",), (), (None,))
+    cache.covering(("q1",), (), (("a",),))
+    cache.add(("q3",), (), (None,))
+    assert cache.covering(("q1",), (), (("a",),)) == (None,)
+    assert cache.covering(("q2",), (), (("a",),)) == (("a",),)
+
+
+def test_projection_cache_is_thread_safe() -> None:
+    cache = utils.ProjectionCache(max_entries=8)
+
+    def add(i: int) -> None:
+        for j in range(200):
+            cache.add((f"q{(i + j) % 16}",), (), ((f"c{j}",),))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(add, range(8)))
+    assert len(cache._entries) == 8  # noqa: SLF001